@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark for the Quiz model.
+
+This script measures how many bytes each stored question costs, comparing the
+compact Quiz storage with the old list-of-dicts layout.
+
+Usage:
+    python scripts/bench_quiz_memory.py [--questions N] [--answers N]
+
+Options:
+    --questions N   Number of questions to add (default: 100000)
+    --answers N     Number of answers per question (default: 4)
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from quizmaster.models.quiz import Quiz
+
+
+def make_question(i, answer_count):
+    """Build the text and answers of the i-th benchmark question."""
+    if i % 2:
+        # True/False questions repeat the same answer texts
+        return f"Statement number {i} is true.", ["True", "False"][:max(answer_count, 2)]
+    return f"What is the answer to question {i}?", [f"Answer {i}-{j}" for j in range(answer_count)]
+
+
+def measure(build):
+    """Return the number of bytes allocated and still alive after calling build()."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current
+
+
+def build_compact(count, answer_count):
+    """Build a Quiz with the compact storage."""
+    quiz = Quiz("Benchmark")
+    for i in range(count):
+        text, answers = make_question(i, answer_count)
+        quiz.add_question(text, answers, 0)
+    return quiz
+
+
+def build_legacy(count, answer_count):
+    """Build the old list-of-dicts representation."""
+    questions = []
+    for i in range(count):
+        text, answers = make_question(i, answer_count)
+        questions.append({"question": text, "answers": answers, "correct_answer_index": 0})
+    return questions
+
+
+def main():
+    """Run the benchmark and print bytes per question for both layouts."""
+    parser = argparse.ArgumentParser(description="Quiz storage memory benchmark")
+    parser.add_argument("--questions", type=int, default=100000, help="Number of questions")
+    parser.add_argument("--answers", type=int, default=4, help="Answers per question")
+    args = parser.parse_args()
+
+    compact = measure(lambda: build_compact(args.questions, args.answers))
+    legacy = measure(lambda: build_legacy(args.questions, args.answers))
+
+    print(f"Questions:           {args.questions}")
+    print(f"Compact storage:     {compact / args.questions:8.1f} bytes/question")
+    print(f"List of dicts:       {legacy / args.questions:8.1f} bytes/question")
+    print(f"Saving:              {100 * (1 - compact / legacy):8.1f} %")
+
+
+if __name__ == "__main__":
+    main()
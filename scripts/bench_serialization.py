@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Serialization benchmark for quiz responses.
+
+This script compares how long it takes to turn a quiz into a JSON response body
+through the Pydantic models (the default path) and through the fast path enabled
+with QUIZMASTER_FAST_JSON=1, and how much gzip and brotli shrink the body.
+
+Usage:
+    python scripts/bench_serialization.py [--questions N] [--answers N] [--repeat N]
+
+Options:
+    --questions N   Number of questions in the quiz (default: 10000)
+    --answers N     Number of answers per question (default: 4)
+    --repeat N      Number of timed runs per path; the best is reported (default: 5)
+"""
+
+import argparse
+import time
+
+from quizmaster import main as api
+from quizmaster.models.quiz import Quiz
+from quizmaster.services import serialization
+from quizmaster.services.serialization import ENCODING_BROTLI, ENCODING_GZIP, compress, quiz_to_json
+
+
+def build_quiz(count, answer_count):
+    """Build a quiz with the given number of questions."""
+    quiz = Quiz("Benchmark", "Serialization benchmark")
+    for i in range(count):
+        quiz.add_question(f"What is the answer to question {i}?", [f"Answer {i}-{j}" for j in range(answer_count)], 0)
+    return quiz
+
+
+def best_time(function, repeat):
+    """Return the fastest of several runs of function(), in seconds, and its result."""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    """Run the benchmark and print the time per path and the compressed sizes."""
+    parser = argparse.ArgumentParser(description="Quiz serialization benchmark")
+    parser.add_argument("--questions", type=int, default=10000, help="Number of questions")
+    parser.add_argument("--answers", type=int, default=4, help="Answers per question")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per path")
+    args = parser.parse_args()
+
+    quiz = build_quiz(args.questions, args.answers)
+    model_time, model_body = best_time(lambda: api.render_json(api.quiz_to_model(quiz, 0)), args.repeat)
+    fast_time, fast_body = best_time(lambda: quiz_to_json(quiz, 0), args.repeat)
+    assert model_body == fast_body, "The fast path must produce the same bytes"
+
+    print(f"Questions:           {args.questions}")
+    print(f"Body size:           {len(fast_body) / 1024:8.1f} KiB")
+    print(f"Pydantic models:     {model_time * 1000:8.1f} ms")
+    print(f"Fast path:           {fast_time * 1000:8.1f} ms "
+          f"({'orjson' if serialization.orjson else 'json'}, {model_time / fast_time:.1f}x faster)")
+
+    encodings = [ENCODING_GZIP] + ([ENCODING_BROTLI] if serialization.brotli else [])
+    for encoding in encodings:
+        compress_time, compressed = best_time(lambda: compress(fast_body, encoding), args.repeat)
+        print(f"{encoding + ':':<21}{len(compressed) / 1024:8.1f} KiB in {compress_time * 1000:.1f} ms "
+              f"({100 * (1 - len(compressed) / len(fast_body)):.0f}% smaller, cached per quiz version)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Build a memory-mapped quiz bank file from a JSONL or CSV question file.
+
+The input uses the same row formats as the bulk import endpoint. Invalid rows are
+reported and skipped. Serve the result with QUIZMASTER_BANKS=path/to/bank.qmb.
+
+Usage:
+    python scripts/build_quiz_bank.py INPUT OUTPUT --title TITLE [--description TEXT]
+    python scripts/build_quiz_bank.py --synthetic N OUTPUT --title TITLE
+
+Options:
+    --title TEXT        Title of the quiz (required)
+    --description TEXT  Description of the quiz
+    --synthetic N       Write N generated questions instead of reading INPUT, for benchmarks
+"""
+
+import argparse
+import sys
+import time
+
+from quizmaster.models.quiz import Quiz
+from quizmaster.models.quiz_bank import QuizBank, write_quiz_bank
+from quizmaster.services.question_import import is_csv_header, parse_csv_row, parse_jsonl_row
+
+
+def read_rows(path):
+    """Yield the valid rows of a JSONL or CSV file, reporting invalid ones on stderr."""
+    parse = parse_jsonl_row if path.endswith((".jsonl", ".ndjson")) else parse_csv_row
+    with open(path, encoding="utf-8") as file:
+        for line_number, line in enumerate(file, 1):
+            line = line.rstrip("\r\n")
+            if not line.strip() or (line_number == 1 and parse is parse_csv_row and is_csv_header(line)):
+                continue
+            try:
+                text, answers, correct_answer_index = parse(line)
+                Quiz.validate_question(answers, correct_answer_index)
+            except ValueError as e:
+                print(f"Line {line_number}: {e}", file=sys.stderr)
+                continue
+            yield text, answers, correct_answer_index
+
+
+def synthetic_rows(count):
+    """Yield generated benchmark questions."""
+    for i in range(count):
+        yield f"What is the answer to question {i}?", [f"Answer {i}-{j}" for j in range(4)], i % 4
+
+
+def main():
+    """Write the bank, then reopen it and report how long writing and opening took."""
+    parser = argparse.ArgumentParser(description="Build a memory-mapped quiz bank")
+    parser.add_argument("input", nargs="?", help="JSONL or CSV question file")
+    parser.add_argument("output", help="Bank file to write")
+    parser.add_argument("--title", required=True, help="Title of the quiz")
+    parser.add_argument("--description", default="", help="Description of the quiz")
+    parser.add_argument("--synthetic", type=int, help="Number of generated questions to write instead")
+    args = parser.parse_args()
+    if (args.input is None) == (args.synthetic is None):
+        parser.error("give either INPUT or --synthetic N")
+
+    rows = synthetic_rows(args.synthetic) if args.synthetic is not None else read_rows(args.input)
+    start = time.perf_counter()
+    count = write_quiz_bank(args.output, args.title, rows, args.description)
+    written = time.perf_counter() - start
+
+    start = time.perf_counter()
+    bank = QuizBank(args.output)
+    opened = time.perf_counter() - start
+
+    print(f"Questions:   {count}")
+    print(f"Write time:  {written:8.2f} s")
+    print(f"Open time:   {opened * 1e6:8.1f} us")
+    bank.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -6,18 +6,30 @@ This script tests all the REST API endpoints of the QuizMaster backend to ensure
 they function correctly. It can be run as a standalone script or imported and used
 in other test scripts.
 
+With --benchmark it instead load-tests every endpoint with concurrent async clients
+and reports throughput and p50/p95/p99 latency per route (see quizmaster.utils.benchmark).
+
 Usage:
     python test_backend.py [--host HOST] [--port PORT] [--verbose]
+    python test_api.py --benchmark [--in-process] [--requests N] [--concurrency N]
 
 Options:
-    --host HOST     Specify the host address (default: localhost)
-    --port PORT     Specify the port number (default: 8091)
-    --verbose       Enable verbose output
-    --no-start      Don't start the API server (assumes it's already running)
-    --help          Show this help message and exit
+    --host HOST         Specify the host address (default: localhost)
+    --port PORT         Specify the port number (default: 8091)
+    --verbose           Enable verbose output
+    --no-start          Don't start the API server (assumes it's already running)
+    --benchmark         Run the load test instead of the functional tests
+    --in-process        Benchmark the ASGI app in this process instead of a server
+    --requests N        Requests per route (default: 200)
+    --concurrency N     Concurrent clients (default: 16)
+    --quizzes N         Quizzes to seed (default: 5)
+    --questions N       Questions per seeded quiz (default: 50)
+    --max-p95-ms MS     Fail if any route's p95 latency exceeds MS milliseconds
+    --help              Show this help message and exit
 """
 
 import argparse
+import asyncio
 import json
 import os
 import requests
@@ -399,6 +411,34 @@ class BackendTester:
 
         return self.test_results["failed"] == 0
 
+    def run_benchmark(self, in_process=False, requests_per_route=200, concurrency=16,
+                      quizzes=5, questions=50, max_p95_ms=None):
+        """Load-test every endpoint and print throughput and latency percentiles per route."""
+        from quizmaster.utils.benchmark import format_report, make_client, run_benchmark
+
+        self.print_header("Benchmarking " + ("the ASGI app in-process" if in_process else self.base_url))
+
+        async def run():
+            async with make_client(None if in_process else self.base_url) as client:
+                return await run_benchmark(
+                    client, requests=requests_per_route, concurrency=concurrency, quizzes=quizzes, questions=questions
+                )
+
+        results = asyncio.run(run())
+        print(format_report(results))
+
+        success = True
+        for result in results:
+            if result.errors:
+                self.print_error(f"{result.name}: {result.errors} failed requests")
+                success = False
+            if max_p95_ms is not None and result.percentile(95) * 1000 > max_p95_ms:
+                self.print_error(f"{result.name}: p95 latency above {max_p95_ms} ms")
+                success = False
+        if success:
+            self.print_success("Benchmark completed without errors")
+        return success
+
     def print_test_summary(self):
         """Print a summary of the test results."""
         self.print_header("Test Summary")
@@ -419,6 +459,13 @@ def parse_arguments():
     parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port number (default: {DEFAULT_PORT})")
     parser.add_argument("--verbose", action="store_true", help="Enable verbose output")
     parser.add_argument("--no-start", action="store_true", help="Don't start the API server (assumes it's already running)")
+    parser.add_argument("--benchmark", action="store_true", help="Run the load test instead of the functional tests")
+    parser.add_argument("--in-process", action="store_true", help="Benchmark the ASGI app without a server")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per route (default: 200)")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent clients (default: 16)")
+    parser.add_argument("--quizzes", type=int, default=5, help="Quizzes to seed (default: 5)")
+    parser.add_argument("--questions", type=int, default=50, help="Questions per seeded quiz (default: 50)")
+    parser.add_argument("--max-p95-ms", type=float, default=None, help="Fail if a route's p95 latency exceeds this")
     return parser.parse_args()
 
 
@@ -428,6 +475,28 @@ def main():
 
     tester = BackendTester(host=args.host, port=args.port, verbose=args.verbose)
 
+    if args.benchmark:
+        benchmark_options = dict(
+            requests_per_route=args.requests,
+            concurrency=args.concurrency,
+            quizzes=args.quizzes,
+            questions=args.questions,
+            max_p95_ms=args.max_p95_ms
+        )
+        if args.in_process:
+            return 0 if tester.run_benchmark(in_process=True, **benchmark_options) else 1
+        try:
+            requests.get(f"http://{args.host}:{args.port}/api")
+        except requests.exceptions.RequestException:
+            if args.no_start:
+                tester.print_error("API is not running and --no-start option is set")
+                return 1
+            tester.start_api_server()
+        try:
+            return 0 if tester.run_benchmark(**benchmark_options) else 1
+        finally:
+            tester.stop_api_server()
+
     # Check if the API is already running
     try:
         response = requests.get(f"http://{args.host}:{args.port}/api")
@@ -16,6 +16,10 @@ setup(
     install_requires=[
         # Add dependencies here
     ],
+    extras_require={
+        # Faster JSON serialization and brotli response compression
+        "fast": ["orjson>=3.8.0", "brotli>=1.0.9"],
+    },
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
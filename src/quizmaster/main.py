@@ -5,18 +5,46 @@ This module provides the entry point for running the QuizMaster application
 and defines the FastAPI REST endpoints.
 """
 
-from typing import List, Optional, Dict, Any
-from fastapi import FastAPI, HTTPException, status
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from typing import TYPE_CHECKING, List, Optional, Dict, Any, Iterator, Literal, Tuple, Union
+from fastapi import FastAPI, Header, HTTPException, Query, Request, WebSocket, WebSocketDisconnect, status
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
-import uvicorn
+import argparse
+import asyncio
+import hmac
+import json
 import os
 import pathlib
+import random
+import threading
+
+from quizmaster.models.default_quiz import default_quiz
+from quizmaster.services.analytics import AnswerStats, QuestionStats
+from quizmaster.services.bot_engine import BotEngine, Transport
+from quizmaster.services.leaderboard import Leaderboards
+from quizmaster.services.live_rooms import CLOSE_TOO_SLOW, ROOM_FINISHED, Room, RoomRegistry
+from quizmaster.services.metrics import Metrics, MetricsMiddleware
+from quizmaster.services.profiler import Profiling, ProfilerMiddleware
+from quizmaster.services.question_import import QuestionImporter, format_for_content_type, iter_lines
+from quizmaster.services.quiz_store import QuestionRow, QuizInfo, create_store
+from quizmaster.services.response_cache import ResponseCache
+from quizmaster.services.sampling import SamplerRegistry, sample_uniform
+from quizmaster.services.search import SearchIndex
+from quizmaster.services.serialization import (
+    ENCODING_BROTLI, ENCODING_GZIP, compress, negotiate_encoding, quiz_to_json
+)
+from quizmaster.services.sessions import Attempt, SessionEngine
+from quizmaster.models.quiz import DEDUP_MERGE, DEDUP_OFF, DEDUP_REJECT, Question, Quiz
+from quizmaster.utils.http import etag_matches, make_etag
 
-from quizmaster.services.quiz_bot import QuizBot
-from quizmaster.models.quiz import Quiz
+# The NumPy-backed services (duplicate detection, grading and item response theory) are
+# imported on first use, so importing the API does not load NumPy
+if TYPE_CHECKING:
+    from quizmaster.services.dedup import DedupRegistry
+    from quizmaster.services.grading import GradingResult
+    from quizmaster.services.irt import ItemBank, ItemBanks
 
 
 # Pydantic models for API
@@ -37,16 +65,64 @@ class QuestionCreateModel(BaseModel):
     correct_answer_index: int
 
 
+class ImportErrorModel(BaseModel):
+    line: int
+    error: str
+
+
+class BulkImportResultModel(BaseModel):
+    quiz_id: int
+    imported: int
+    failed: int
+    question_count: int
+    errors: List[ImportErrorModel]
+    merged: int = 0
+    warnings: List[ImportErrorModel] = []
+
+
 class QuizModel(BaseModel):
     id: Optional[int] = None
     title: str
     description: Optional[str] = None
+    version: Optional[int] = None
     questions: Optional[List[QuestionModel]] = None
 
 
+class QuizSummaryModel(BaseModel):
+    id: int
+    title: str
+    description: Optional[str] = None
+    version: int
+    question_count: int
+
+
+class QuizChangesModel(BaseModel):
+    quiz_id: int
+    epoch: str
+    since: int
+    version: int
+    questions: List[QuestionModel]
+
+
+class SampleRequestModel(BaseModel):
+    count: int = Field(..., ge=1, le=1000)
+    seed: Optional[int] = None
+    weights: Optional[Dict[int, float]] = Field(
+        None, description="Weights of individual questions by ID; the others weigh 1"
+    )
+
+
+class QuizSampleModel(BaseModel):
+    quiz_id: int
+    version: int
+    seed: int
+    questions: List[QuestionModel]
+
+
 class QuizCreateModel(BaseModel):
     title: str
     description: Optional[str] = None
+    dedup_policy: Literal["off", "warn", "reject", "merge"] = DEDUP_OFF
 
 
 class AnswerSubmissionModel(BaseModel):
@@ -59,6 +135,123 @@ class AnswerResponseModel(BaseModel):
     message: str
 
 
+class AnswerSheetModel(BaseModel):
+    answers: List[Optional[int]]
+    user_id: Optional[str] = None
+
+
+class BulkAnswerSheetsModel(BaseModel):
+    sheets: List[List[Optional[int]]]
+    user_ids: Optional[List[Optional[str]]] = None
+
+
+class GradeResultModel(BaseModel):
+    correct: List[bool]
+    score: int
+    answered: int
+    question_count: int
+
+
+class BulkGradeResultModel(BaseModel):
+    question_count: int
+    scores: List[int]
+    answered: List[int]
+    correct: List[List[bool]]
+    question_correct_counts: List[int]
+
+
+class AnswerStatsModel(BaseModel):
+    text: str
+    is_correct: bool
+    count: int
+
+
+class QuestionStatsModel(BaseModel):
+    question_id: int
+    text: str
+    submissions: int
+    correct: int
+    correct_rate: Optional[float] = None
+    answers: List[AnswerStatsModel]
+
+
+class QuizAnalyticsModel(BaseModel):
+    quiz_id: int
+    submissions: int
+    questions: List[QuestionStatsModel]
+
+
+class SearchResultModel(BaseModel):
+    quiz_id: int
+    question_id: int
+    text: str
+    score: float
+
+
+class LeaderboardEntryModel(BaseModel):
+    rank: int
+    user_id: str
+    score: int
+
+
+class LeaderboardModel(BaseModel):
+    quiz_id: int
+    total: int
+    entries: List[LeaderboardEntryModel]
+
+
+class SessionCreateModel(BaseModel):
+    user_id: Optional[str] = None
+    adaptive: bool = Field(
+        False, description="Pick each question by its information at the learner's estimated ability"
+    )
+    max_questions: Optional[int] = Field(None, ge=1, description="Questions to ask in an adaptive session")
+
+
+class SessionModel(BaseModel):
+    session_id: str
+    quiz_id: int
+    user_id: Optional[str] = None
+    next_question_id: Optional[int] = None
+    answered: int
+    score: int
+    question_count: int
+    adaptive: bool = False
+    ability: Optional[float] = None
+    ability_se: Optional[float] = None
+
+
+class CalibrationModel(BaseModel):
+    quiz_id: int
+    responses: int
+    learners: int
+    question_count: int
+    iterations: int
+
+
+class SessionAnswerResponseModel(AnswerResponseModel):
+    session: SessionModel
+
+
+class RoomCreateModel(BaseModel):
+    quiz_id: int
+
+
+class RoomModel(BaseModel):
+    room_id: str
+    quiz_id: int
+    state: str
+    question_index: int
+    question_count: int
+    participants: int
+    counts: List[int]
+    answered: int
+
+
+class RoomCreatedModel(RoomModel):
+    host_token: str
+
+
 # Create FastAPI app
 app = FastAPI(
     title="QuizMaster API",
@@ -75,6 +268,15 @@ app.add_middleware(
     allow_headers=["*"],  # Allow all headers
 )
 
+# On-demand sampling profiles of the running server, started through /admin/profile
+profiling = Profiling()
+app.add_middleware(ProfilerMiddleware, profiling=profiling)
+
+# Request counts and latency histograms per route template, served at /metrics.
+# Added last so it is the outermost middleware and times everything else.
+metrics = Metrics()
+app.add_middleware(MetricsMiddleware, metrics=metrics)
+
 # Get the project root directory
 ROOT_DIR = pathlib.Path(__file__).parent.parent.parent
 
@@ -83,24 +285,114 @@ ROOT_DIR = pathlib.Path(__file__).parent.parent.parent
 
 
 
-# In-memory storage for quizzes
-quizzes = {}
-quiz_id_counter = 0
+# Quiz storage, selected with the QUIZMASTER_STORE environment variable ("memory" by
+# default, "sqlite:///path/to/quizmaster.db" or "journal:///path/to/directory")
+store = create_store(os.environ.get("QUIZMASTER_STORE", "memory"))
+
+# Full-text index over question and answer text, fed by on_questions_added and caught up
+# from the store before each search, so questions added by other workers are found too
+search_index = SearchIndex()
+
+# Duplicate-detection indexes of the quizzes that have a dedup policy, created by get_dedup
+dedup: Optional["DedupRegistry"] = None
+
+# Best score of every user per quiz, fed by graded sheets and finished sessions
+leaderboards = Leaderboards()
+
+# Fenwick trees for weighted question sampling, built on a quiz's first weighted draw
+samplers = SamplerRegistry()
+
+# Answer-choice counters behind the analytics endpoint
+answer_stats = AnswerStats()
+
+# Scored responses and calibrated item parameters for adaptive sessions, created by get_item_banks
+item_banks: Optional["ItemBanks"] = None
+
+# Guards the first-use creation of the NumPy-backed services
+services_lock = threading.Lock()
+
+# Cache of serialized quiz responses, keyed by quiz ID and invalidated by Quiz.version
+response_cache = ResponseCache(
+    max_bytes=int(os.environ.get("QUIZMASTER_CACHE_BYTES", 64 * 1024 * 1024))
+)
+
+# Serialize quizzes straight to JSON bytes instead of through the Pydantic models
+# (QUIZMASTER_FAST_JSON=1); the output is identical either way
+FAST_JSON = os.environ.get("QUIZMASTER_FAST_JSON", "0") == "1"
+
+# Quiz responses at least this large are compressed if the client accepts it
+COMPRESS_MIN_BYTES = int(os.environ.get("QUIZMASTER_COMPRESS_MIN_BYTES", 1024))
+
+# Token that unlocks the /admin endpoints (sent as X-Admin-Token); they are disabled when unset
+ADMIN_TOKEN = os.environ.get("QUIZMASTER_ADMIN_TOKEN", "")
+
+# Server-side quiz attempts, expired after QUIZMASTER_SESSION_TTL seconds of inactivity
+sessions = SessionEngine(ttl=float(os.environ.get("QUIZMASTER_SESSION_TTL", 1800)))
+
+# Quiz bot chats served over WebSockets, all driven by the event loop
+bots = BotEngine()
+
+# Live multiplayer rooms; participants beyond QUIZMASTER_ROOM_QUEUE unsent messages are dropped,
+# and rooms the host has not advanced for QUIZMASTER_ROOM_TTL seconds are closed
+rooms = RoomRegistry(
+    queue_size=int(os.environ.get("QUIZMASTER_ROOM_QUEUE", 64)),
+    tally_interval=float(os.environ.get("QUIZMASTER_ROOM_TALLY_INTERVAL", 0.25)),
+    ttl=float(os.environ.get("QUIZMASTER_ROOM_TTL", 3600))
+)
+
+
+def get_dedup() -> "DedupRegistry":
+    """Get the duplicate-detection indexes, loading NumPy on first use."""
+    global dedup
+    with services_lock:
+        if dedup is None:
+            from quizmaster.services.dedup import DedupRegistry
+            dedup = DedupRegistry()
+        return dedup
+
+
+def get_item_banks() -> "ItemBanks":
+    """Get the adaptive-testing response logs and item banks, loading NumPy on first use."""
+    global item_banks
+    with services_lock:
+        if item_banks is None:
+            from quizmaster.services.irt import ItemBanks
+            # Every quiz logs at most QUIZMASTER_RESPONSE_LOG_SIZE responses, the newest ones
+            item_banks = ItemBanks(max_responses=int(os.environ.get("QUIZMASTER_RESPONSE_LOG_SIZE", 500_000)))
+        return item_banks
+
+
+def on_questions_added(quiz_id: int, first_question_id: int, rows: List[QuestionRow]) -> None:
+    """Update the derived indexes after questions are appended to a quiz."""
+    search_index.add_questions(quiz_id, first_question_id, rows)
+    # Until the registry exists no quiz has a dedup index to update
+    if dedup is not None:
+        dedup.on_questions_added(quiz_id, first_question_id, rows)
+
+
+store.add_listener(on_questions_added)
+
+# Read-only quiz bank files to serve, separated by os.pathsep; they are memory-mapped,
+# so mounting is instant and workers share their pages
+for bank_path in filter(None, os.environ.get("QUIZMASTER_BANKS", "").split(os.pathsep)):
+    store.mount_bank(bank_path)
 
 
 # Helper function to convert Quiz to QuizModel
-def quiz_to_model(quiz: Quiz, quiz_id: int) -> QuizModel:
+def quiz_to_model(quiz: Quiz, quiz_id: int, version: Optional[int] = None) -> QuizModel:
+    if version is None:
+        version = quiz.version
     questions = []
-    for i, q in enumerate(quiz.questions):
+    for i, q in enumerate(quiz.questions[:version]):
         answers = []
-        for j, a in enumerate(q["answers"]):
+        for j, a in enumerate(q.answers):
             answers.append(AnswerModel(
                 text=a,
-                is_correct=(j == q["correct_answer_index"])
+                is_correct=(j == q.correct_answer_index)
             ))
         questions.append(QuestionModel(
             id=i,
-            text=q["question"],
+            text=q.question,
             answers=answers
         ))
 
@@ -108,10 +400,143 @@ def quiz_to_model(quiz: Quiz, quiz_id: int) -> QuizModel:
         id=quiz_id,
         title=quiz.title,
         description=quiz.description,
+        version=version,
         questions=questions
     )
 
 
+def question_to_model(question_id: int, question: Question) -> QuestionModel:
+    """Convert a question to its API representation."""
+    return QuestionModel(
+        id=question_id,
+        text=question.question,
+        answers=[
+            AnswerModel(text=answer, is_correct=(i == question.correct_answer_index))
+            for i, answer in enumerate(question.answers)
+        ]
+    )
+
+
+def render_json(data: Any) -> bytes:
+    """Serialize data the same way FastAPI's JSONResponse does."""
+    return json.dumps(
+        jsonable_encoder(data),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def get_quiz_info_or_404(quiz_id: int) -> QuizInfo:
+    """Get the metadata of a quiz, raising a 404 error if it does not exist."""
+    info = store.get_quiz_info(quiz_id)
+    if info is None:
+        raise HTTPException(status_code=404, detail="Quiz not found")
+    return info
+
+
+def get_quiz_or_404(quiz_id: int) -> Quiz:
+    """Get a quiz, raising a 404 error if it does not exist."""
+    quiz = store.get_quiz(quiz_id)
+    if quiz is None:
+        raise HTTPException(status_code=404, detail="Quiz not found")
+    return quiz
+
+
+def render_quiz(info: QuizInfo) -> bytes:
+    """
+    Get the serialized QuizModel for a quiz, using the response cache when possible.
+
+    The quiz is rendered as of info.version, even if questions were appended since info
+    was read, so the body always matches the version it is cached under and the ETag
+    quiz_etag derives from info.
+    """
+    body = response_cache.get(info.id, info.version)
+    if body is None:
+        quiz = store.get_quiz(info.id)
+        if FAST_JSON:
+            body = quiz_to_json(quiz, info.id, info.version)
+        else:
+            body = render_json(quiz_to_model(quiz, info.id, info.version))
+        response_cache.put(info.id, info.version, body)
+    return body
+
+
+def encode_body(
+    body: bytes, accept_encoding: Optional[str], key: Any = None, version: int = 0
+) -> Tuple[bytes, Optional[str]]:
+    """
+    Compress a response body if it is large enough and the client accepts a compressed encoding.
+
+    Args:
+        body: The uncompressed body.
+        accept_encoding: The request's Accept-Encoding header.
+        key: If given, the compressed body is cached under this key and the encoding.
+        version: The content version of the cached body.
+
+    Returns:
+        The body to send and its content encoding, or None if it is not compressed.
+    """
+    encoding = negotiate_encoding(accept_encoding)
+    if encoding is None or len(body) < COMPRESS_MIN_BYTES:
+        return body, None
+    if key is None:
+        return compress(body, encoding), encoding
+
+    compressed = response_cache.get((key, encoding), version)
+    if compressed is None:
+        compressed = compress(body, encoding)
+        response_cache.put((key, encoding), version, compressed)
+    return compressed, encoding
+
+
+def render_quiz_summary(info: QuizInfo) -> bytes:
+    """Get the serialized QuizSummaryModel for a quiz."""
+    return render_json(QuizSummaryModel(
+        id=info.id,
+        title=info.title,
+        description=info.description,
+        version=info.version,
+        question_count=info.question_count
+    ))
+
+
+def quiz_etag(info: QuizInfo, encoding: Optional[str] = None) -> str:
+    """Get the strong ETag of a quiz, derived from its content version and content encoding."""
+    if encoding is None:
+        return make_etag(store.epoch, info.id, info.version)
+    return make_etag(store.epoch, info.id, info.version, encoding)
+
+
+def quiz_response(
+    info: QuizInfo,
+    status_code: int = status.HTTP_200_OK,
+    headers: Optional[Dict[str, str]] = None,
+    accept_encoding: Optional[str] = None
+) -> Response:
+    """Build a JSON response for a quiz from its cached serialized form, compressed if accepted."""
+    body, encoding = encode_body(render_quiz(info), accept_encoding, info.id, info.version)
+    response_headers = {"ETag": quiz_etag(info, encoding), "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+    if encoding is not None:
+        response_headers["Content-Encoding"] = encoding
+    response_headers.update(headers or {})
+    return Response(
+        content=body,
+        status_code=status_code,
+        media_type="application/json",
+        headers=response_headers
+    )
+
+
+def not_modified_response(etag: str) -> Response:
+    """Build a 304 Not Modified response for a representation the client already has."""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": "no-cache"}
+    )
+
+
 # API Routes
 
 @app.get("/api")
@@ -120,43 +545,151 @@ async def api_root():
     return {"message": "Welcome to QuizMaster API!"}
 
 
-@app.get("/quizzes", response_model=List[QuizModel])
-async def get_quizzes():
-    """Get all quizzes."""
-    return [quiz_to_model(quiz, quiz_id) for quiz_id, quiz in quizzes.items()]
+@app.get("/quizzes", response_model=List[Union[QuizModel, QuizSummaryModel]])
+async def get_quizzes(
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    after: Optional[int] = Query(None, description="Cursor: the last quiz ID of the previous page"),
+    view: str = Query("full", pattern="^(full|summary)$"),
+    accept: Optional[str] = Header(None),
+    accept_encoding: Optional[str] = Header(None)
+):
+    """
+    Get quizzes.
+
+    Without parameters all quizzes are returned. With `limit`, a page of quizzes is
+    returned and the `X-Next-Cursor` and `Link` headers point to the next page.
+    `view=summary` omits the questions. Sending `Accept: application/x-ndjson`
+    streams one quiz per line instead of building the whole list in memory.
+    """
+    render = render_quiz_summary if view == "summary" else render_quiz
+
+    if accept and "application/x-ndjson" in accept:
+        def stream() -> Iterator[bytes]:
+            for info in store.iter_quiz_infos(after, limit):
+                yield render(info) + b"\n"
 
+        return StreamingResponse(stream(), media_type="application/x-ndjson")
 
-@app.post("/quizzes", response_model=QuizModel, status_code=status.HTTP_201_CREATED)
-async def create_quiz(quiz_data: QuizCreateModel):
-    """Create a new quiz."""
-    global quiz_id_counter
+    page = list(store.iter_quiz_infos(after, limit))
+    body = b"[" + b",".join(render(info) for info in page) + b"]"
+    headers = {"Vary": "Accept-Encoding"}
+    if limit is not None and len(page) == limit:
+        next_cursor = page[-1].id
+        headers["X-Next-Cursor"] = str(next_cursor)
+        headers["Link"] = f'</quizzes?limit={limit}&after={next_cursor}&view={view}>; rel="next"'
+    body, encoding = encode_body(body, accept_encoding)
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type="application/json", headers=headers)
 
-    quiz = Quiz(title=quiz_data.title, description=quiz_data.description)
-    quiz_id = quiz_id_counter
-    quiz_id_counter += 1
 
-    quizzes[quiz_id] = quiz
-    return quiz_to_model(quiz, quiz_id)
+# Routes that write to the store are plain functions, so FastAPI runs them in its thread
+# pool: a journal store blocks until the write is fsynced, and concurrent writes waiting
+# in their own threads are committed together instead of stalling the event loop one by one
+
+
+@app.post("/quizzes", response_model=QuizModel, status_code=status.HTTP_201_CREATED)
+def create_quiz(quiz_data: QuizCreateModel):
+    """Create a new quiz."""
+    quiz = Quiz(title=quiz_data.title, description=quiz_data.description, dedup_policy=quiz_data.dedup_policy)
+    quiz_id = store.add_quiz(quiz)
+    return quiz_response(store.get_quiz_info(quiz_id), status_code=status.HTTP_201_CREATED)
 
 
 @app.get("/quizzes/{quiz_id}", response_model=QuizModel)
-async def get_quiz(quiz_id: int):
-    """Get a specific quiz by ID."""
-    if quiz_id not in quizzes:
-        raise HTTPException(status_code=404, detail="Quiz not found")
+async def get_quiz(
+    quiz_id: int, if_none_match: Optional[str] = Header(None), accept_encoding: Optional[str] = Header(None)
+):
+    """Get a specific quiz by ID. Large quizzes are sent compressed when the client accepts gzip or brotli."""
+    info = get_quiz_info_or_404(quiz_id)
+    for encoding in (None, ENCODING_GZIP, ENCODING_BROTLI):
+        etag = quiz_etag(info, encoding)
+        if etag_matches(if_none_match, etag):
+            return not_modified_response(etag)
+
+    return quiz_response(info, accept_encoding=accept_encoding)
+
+
+@app.get("/quizzes/{quiz_id}/changes", response_model=QuizChangesModel)
+async def get_quiz_changes(
+    quiz_id: int,
+    since: int = Query(..., ge=0, description="The quiz version the client already has"),
+    if_none_match: Optional[str] = Header(None)
+):
+    """
+    Get the questions added to a quiz since a version.
 
-    return quiz_to_model(quizzes[quiz_id], quiz_id)
+    Questions are only ever appended and every question increments the version, so the
+    questions added since version `since` are those from position `since` onwards. Clients
+    keep the returned `version` and pass it as `since` on the next call. If `epoch` differs
+    from the one the client saw before, the store was replaced and it must resync from 0.
+    """
+    info = get_quiz_info_or_404(quiz_id)
+    if since > info.version:
+        raise HTTPException(status_code=409, detail=f"Version {since} is ahead of the quiz (version {info.version})")
+
+    etag = make_etag(store.epoch, quiz_id, info.version, "since", since)
+    if etag_matches(if_none_match, etag):
+        return not_modified_response(etag)
+
+    questions = store.get_questions(quiz_id, since) or []
+    version = since + len(questions)
+    changes = QuizChangesModel(
+        quiz_id=quiz_id,
+        epoch=store.epoch,
+        since=since,
+        version=version,
+        questions=[question_to_model(since + i, q) for i, q in enumerate(questions)]
+    )
+    return Response(
+        content=render_json(changes),
+        media_type="application/json",
+        headers={"ETag": make_etag(store.epoch, quiz_id, version, "since", since), "Cache-Control": "no-cache"}
+    )
 
 
 @app.post("/quizzes/{quiz_id}/questions", response_model=QuizModel)
-async def add_question(quiz_id: int, question_data: QuestionCreateModel):
-    """Add a question to a quiz."""
-    if quiz_id not in quizzes:
-        raise HTTPException(status_code=404, detail="Quiz not found")
+def add_question(
+    quiz_id: int, question_data: QuestionCreateModel, accept_encoding: Optional[str] = Header(None)
+):
+    """
+    Add a question to a quiz.
+
+    If the quiz has a dedup policy and the question duplicates an existing one, the
+    `X-Duplicate-Of` header holds the existing question's ID. Under "reject" the request
+    fails with 409; under "merge" the question is not added.
+    """
+    info = get_quiz_info_or_404(quiz_id)
+    headers = {}
+    if info.dedup_policy == DEDUP_OFF:
+        append_question(quiz_id, question_data)
+        return quiz_response(store.get_quiz_info(quiz_id), accept_encoding=accept_encoding)
 
-    quiz = quizzes[quiz_id]
     try:
-        quiz.add_question(
+        Quiz.validate_question(question_data.answers, question_data.correct_answer_index)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    from quizmaster.services.dedup import fingerprint
+    registry = get_dedup()
+    # Requests run in parallel threads, so the check and the append hold the quiz's dedup
+    # lock; otherwise two identical questions posted together would both pass the check
+    with registry.lock_for(quiz_id):
+        match = registry.index_for(store, quiz_id).find(fingerprint(question_data.text, question_data.answers))
+        if match is not None:
+            if info.dedup_policy == DEDUP_REJECT:
+                raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=match.describe())
+            headers["X-Duplicate-Of"] = str(match.question_id)
+        if match is None or info.dedup_policy != DEDUP_MERGE:
+            append_question(quiz_id, question_data)
+
+    return quiz_response(store.get_quiz_info(quiz_id), headers=headers, accept_encoding=accept_encoding)
+
+
+def append_question(quiz_id: int, question_data: QuestionCreateModel) -> None:
+    """Append a question to a stored quiz, turning validation errors into 400 responses."""
+    try:
+        store.add_question(
+            quiz_id,
             question=question_data.text,
             answers=question_data.answers,
             correct_answer_index=question_data.correct_answer_index
@@ -164,50 +697,97 @@ async def add_question(quiz_id: int, question_data: QuestionCreateModel):
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-    return quiz_to_model(quiz, quiz_id)
 
+@app.post("/quizzes/{quiz_id}/questions/bulk", response_model=BulkImportResultModel)
+async def import_questions(quiz_id: int, request: Request):
+    """
+    Add many questions to a quiz from a JSONL or CSV body.
 
-@app.get("/quizzes/{quiz_id}/questions/{question_id}", response_model=QuestionModel)
-async def get_question(quiz_id: int, question_id: int):
-    """Get a specific question from a quiz."""
-    if quiz_id not in quizzes:
-        raise HTTPException(status_code=404, detail="Quiz not found")
+    The body is parsed while it streams in and appended in chunks. Rows that fail
+    validation are reported in the summary and do not stop the import. Duplicates are
+    handled according to the quiz's dedup policy and listed in `warnings` unless rejected.
+    """
+    info = get_quiz_info_or_404(quiz_id)
+    try:
+        import_format = format_for_content_type(request.headers.get("content-type", ""))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail=str(e))
+
+    registry = get_dedup() if info.dedup_policy != DEDUP_OFF else None
+    importer = QuestionImporter(store, quiz_id, dedup=registry, dedup_policy=info.dedup_policy)
+    await importer.run(iter_lines(request.stream()), import_format)
+
+    return BulkImportResultModel(
+        quiz_id=quiz_id,
+        imported=importer.imported,
+        failed=importer.failed,
+        question_count=store.get_quiz_info(quiz_id).question_count,
+        errors=[ImportErrorModel(line=line, error=error) for line, error in importer.errors],
+        merged=importer.merged,
+        warnings=[ImportErrorModel(line=line, error=error) for line, error in importer.warnings]
+    )
 
-    quiz = quizzes[quiz_id]
-    if question_id < 0 or question_id >= quiz.get_question_count():
-        raise HTTPException(status_code=404, detail="Question not found")
 
-    question_data = quiz.questions[question_id]
-    answers = []
-    for i, answer in enumerate(question_data["answers"]):
-        answers.append(AnswerModel(
-            text=answer,
-            is_correct=(i == question_data["correct_answer_index"])
-        ))
+@app.post("/quizzes/{quiz_id}/sample", response_model=QuizSampleModel)
+async def sample_questions(quiz_id: int, sample_request: SampleRequestModel):
+    """
+    Draw random questions from a quiz without replacement, for example 30 out of a 100k bank.
 
-    return QuestionModel(
-        id=question_id,
-        text=question_data["question"],
-        answers=answers
-    )
+    With `weights`, each draw picks a question with probability proportional to its weight.
+    The same `seed` on the same quiz version draws the same questions; without one a seed
+    is chosen and returned.
+    """
+    info = get_quiz_info_or_404(quiz_id)
+    if sample_request.count > info.question_count:
+        raise HTTPException(
+            status_code=400, detail=f"The quiz has only {info.question_count} questions"
+        )
 
+    seed = sample_request.seed if sample_request.seed is not None else random.getrandbits(63)
+    rng = random.Random(seed)
+    try:
+        if sample_request.weights:
+            sampler = samplers.get(quiz_id, info.question_count)
+            question_ids = sampler.sample(sample_request.count, rng, sample_request.weights)
+        else:
+            question_ids = sample_uniform(info.question_count, sample_request.count, rng)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return QuizSampleModel(
+        quiz_id=quiz_id,
+        version=info.version,
+        seed=seed,
+        questions=[question_to_model(i, store.get_question(quiz_id, i)) for i in question_ids]
+    )
 
-@app.post("/quizzes/{quiz_id}/questions/{question_id}/submit", response_model=AnswerResponseModel)
-async def submit_answer(quiz_id: int, question_id: int, submission: AnswerSubmissionModel):
-    """Submit an answer to a question."""
-    if quiz_id not in quizzes:
-        raise HTTPException(status_code=404, detail="Quiz not found")
 
-    quiz = quizzes[quiz_id]
-    if question_id < 0 or question_id >= quiz.get_question_count():
+@app.get("/quizzes/{quiz_id}/questions/{question_id}", response_model=QuestionModel)
+async def get_question(quiz_id: int, question_id: int, if_none_match: Optional[str] = Header(None)):
+    """Get a specific question from a quiz."""
+    info = get_quiz_info_or_404(quiz_id)
+    if question_id < 0 or question_id >= info.question_count:
         raise HTTPException(status_code=404, detail="Question not found")
 
-    question_data = quiz.questions[question_id]
-    if submission.answer_index < 0 or submission.answer_index >= len(question_data["answers"]):
+    etag = make_etag(store.epoch, quiz_id, info.version, question_id)
+    if etag_matches(if_none_match, etag):
+        return not_modified_response(etag)
+
+    question = question_to_model(question_id, store.get_question(quiz_id, question_id))
+    return Response(
+        content=render_json(question),
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": "no-cache"}
+    )
+
+
+def check_answer(question_data: Question, answer_index: int) -> AnswerResponseModel:
+    """Grade one answer to a question, raising a 400 error if the answer index is invalid."""
+    if answer_index < 0 or answer_index >= len(question_data.answers):
         raise HTTPException(status_code=400, detail="Invalid answer index")
 
-    is_correct = submission.answer_index == question_data["correct_answer_index"]
-    correct_answer = question_data["answers"][question_data["correct_answer_index"]]
+    is_correct = answer_index == question_data.correct_answer_index
+    correct_answer = question_data.answers[question_data.correct_answer_index]
 
     if is_correct:
         message = "Correct! Well done!"
@@ -221,26 +801,620 @@ async def submit_answer(quiz_id: int, question_id: int, submission: AnswerSubmis
         )
 
 
+@app.post("/quizzes/{quiz_id}/questions/{question_id}/submit", response_model=AnswerResponseModel)
+async def submit_answer(quiz_id: int, question_id: int, submission: AnswerSubmissionModel):
+    """Submit an answer to a question."""
+    if quiz_id not in store:
+        raise HTTPException(status_code=404, detail="Quiz not found")
+
+    question_data = store.get_question(quiz_id, question_id)
+    if question_data is None:
+        raise HTTPException(status_code=404, detail="Question not found")
+
+    feedback = check_answer(question_data, submission.answer_index)
+    answer_stats.record(
+        quiz_id, question_id, submission.answer_index, len(question_data.answers), feedback.is_correct
+    )
+    return feedback
+
+
+def grade_or_400(quiz_id: int, sheets: List[List[Optional[int]]]) -> "GradingResult":
+    """Grade answer sheets for a quiz and count their answers, turning failures into HTTP errors."""
+    from quizmaster.services.grading import UNANSWERED, grade_sheets
+
+    quiz = get_quiz_or_404(quiz_id)
+    try:
+        result = grade_sheets(quiz, sheets)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    answer_stats.record_sheets(quiz_id, result)
+    get_item_banks().log(quiz_id).add_sheets(result.correct, result.answers != UNANSWERED)
+    return result
+
+
+@app.post("/quizzes/{quiz_id}/grade", response_model=GradeResultModel)
+async def grade_answer_sheet(quiz_id: int, sheet: AnswerSheetModel):
+    """
+    Grade a whole answer sheet in one call.
+
+    `answers` holds one answer index per question in question order; null or a
+    shorter list leaves questions unanswered. With a `user_id` the score is ranked on
+    the quiz's leaderboard.
+    """
+    result = grade_or_400(quiz_id, [sheet.answers])
+    if sheet.user_id is not None:
+        leaderboards.record(quiz_id, sheet.user_id, int(result.scores[0]))
+    return GradeResultModel(
+        correct=result.correct[0].tolist(),
+        score=int(result.scores[0]),
+        answered=int(result.answered[0]),
+        question_count=result.question_count
+    )
+
+
+@app.post("/quizzes/{quiz_id}/grade/bulk", response_model=BulkGradeResultModel)
+async def grade_answer_sheets(quiz_id: int, batch: BulkAnswerSheetsModel):
+    """
+    Grade many answer sheets at once with a single vectorized comparison.
+
+    Returns per-sheet scores and per-question correctness, plus how many sheets got each question right.
+    `user_ids`, if given, names the user of each sheet for the leaderboard.
+    """
+    if batch.user_ids is not None and len(batch.user_ids) != len(batch.sheets):
+        raise HTTPException(status_code=400, detail="user_ids must have one entry per sheet")
+    result = grade_or_400(quiz_id, batch.sheets)
+    if batch.user_ids is not None:
+        for user_id, score in zip(batch.user_ids, result.scores.tolist()):
+            if user_id is not None:
+                leaderboards.record(quiz_id, user_id, score)
+    body = json.dumps({
+        "question_count": result.question_count,
+        "scores": result.scores.tolist(),
+        "answered": result.answered.tolist(),
+        "correct": result.correct.tolist(),
+        "question_correct_counts": result.question_correct_counts.tolist()
+    }, separators=(",", ":")).encode("utf-8")
+    return Response(content=body, media_type="application/json")
+
+
+def session_model(session_id: str, attempt: Attempt) -> SessionModel:
+    """Convert an attempt to its API representation."""
+    info = store.get_quiz_info(attempt.quiz_id)
+    question_count = info.question_count if info is not None else attempt.cursor
+    finished = attempt.cursor >= question_count
+    ability = ability_se = None
+    if attempt.adaptive is not None:
+        finished = finished or attempt.adaptive.finished
+        ability, ability_se = attempt.adaptive.estimate()
+    return SessionModel(
+        session_id=session_id,
+        quiz_id=attempt.quiz_id,
+        user_id=attempt.user_id,
+        next_question_id=None if finished else attempt.cursor,
+        answered=attempt.answered_count,
+        score=attempt.score,
+        question_count=question_count,
+        adaptive=attempt.adaptive is not None,
+        ability=ability,
+        ability_se=ability_se
+    )
+
+
+async def adaptive_bank(quiz_id: int, question_count: int) -> "ItemBank":
+    """
+    Get the item bank that adaptive sessions of a quiz pick questions from.
+
+    Building or extending the bank after the quiz grows is CPU-bound, so it runs in the
+    default executor instead of on the event loop.
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        None, get_item_banks().bank, quiz_id, question_count,
+        lambda: {question_id: stats.correct_rate for question_id, stats in answer_stats.question_stats(quiz_id).items()}
+    )
+
+
+def advance_adaptive(attempt: Attempt, question_count: int, bank: "ItemBank") -> None:
+    """Move an adaptive attempt to the most informative question not yet asked."""
+    question_id = bank.select(attempt.adaptive)
+    attempt.cursor = question_id if question_id is not None else question_count
+
+
+def get_attempt_or_404(session_id: str) -> Attempt:
+    """Get an active attempt, raising a 404 error if it does not exist or has expired."""
+    attempt = sessions.get(session_id)
+    if attempt is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+    return attempt
+
+
+@app.post("/quizzes/{quiz_id}/sessions", response_model=SessionModel, status_code=status.HTTP_201_CREATED)
+async def start_session(quiz_id: int, session_data: Optional[SessionCreateModel] = None):
+    """
+    Start a server-side attempt at a quiz. Attempts with a `user_id` are ranked on the leaderboard when finished.
+
+    An `adaptive` attempt asks up to `max_questions` questions (all of them by default),
+    each chosen to tell the most about the learner's ability given the answers so far,
+    and reports the ability estimate with its standard error.
+    """
+    info = get_quiz_info_or_404(quiz_id)
+    session_data = session_data or SessionCreateModel()
+    bank = await adaptive_bank(quiz_id, info.question_count) if session_data.adaptive else None
+    session_id, attempt = sessions.start(quiz_id, session_data.user_id)
+    if bank is not None:
+        from quizmaster.services.irt import AdaptiveState
+        attempt.adaptive = AdaptiveState(min(session_data.max_questions or info.question_count, info.question_count))
+        advance_adaptive(attempt, info.question_count, bank)
+    return session_model(session_id, attempt)
+
+
+@app.get("/sessions/{session_id}", response_model=SessionModel)
+async def get_session(session_id: str):
+    """Get the progress of an attempt."""
+    return session_model(session_id, get_attempt_or_404(session_id))
+
+
+@app.post("/sessions/{session_id}/answer", response_model=SessionAnswerResponseModel)
+async def answer_session_question(session_id: str, submission: AnswerSubmissionModel):
+    """Answer the attempt's current question and advance to the next one."""
+    attempt = get_attempt_or_404(session_id)
+    bank = None
+    if attempt.adaptive is not None:
+        question_count = store.get_quiz_info(attempt.quiz_id).question_count
+        bank = await adaptive_bank(attempt.quiz_id, question_count)
+        # Read the attempt again after waiting, so nothing else can run between reading and advancing it
+        attempt = get_attempt_or_404(session_id)
+    question_data = store.get_question(attempt.quiz_id, attempt.cursor)
+    if question_data is None or (attempt.adaptive is not None and attempt.adaptive.finished):
+        raise HTTPException(status_code=409, detail="All questions have been answered")
+
+    feedback = check_answer(question_data, submission.answer_index)
+    answer_stats.record(
+        attempt.quiz_id, attempt.cursor, submission.answer_index, len(question_data.answers), feedback.is_correct
+    )
+    if bank is not None:
+        bank.update(attempt.adaptive, attempt.cursor, feedback.is_correct)
+        attempt.record(feedback.is_correct)
+        advance_adaptive(attempt, question_count, bank)
+    else:
+        attempt.record(feedback.is_correct)
+    return SessionAnswerResponseModel(
+        is_correct=feedback.is_correct,
+        correct_answer=feedback.correct_answer,
+        message=feedback.message,
+        session=session_model(session_id, attempt)
+    )
+
+
+@app.post("/sessions/{session_id}/finish", response_model=SessionModel)
+async def finish_session(session_id: str):
+    """Finish an attempt and return its final score."""
+    attempt = sessions.finish(session_id)
+    if attempt is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+    if attempt.user_id is not None:
+        leaderboards.record(attempt.quiz_id, attempt.user_id, attempt.score)
+    if attempt.answered:
+        question_ids, correct = zip(*attempt.responses())
+        get_item_banks().log(attempt.quiz_id).add_person(question_ids, correct)
+    return session_model(session_id, attempt)
+
+
+@app.post("/quizzes/{quiz_id}/calibrate", response_model=CalibrationModel)
+def calibrate_quiz(quiz_id: int):
+    """
+    Estimate the discrimination and difficulty of every question of a quiz from all
+    graded sheets and finished sessions, for adaptive sessions to pick questions with.
+
+    Calibration is CPU-bound, so it runs in the thread pool rather than on the event loop.
+    """
+    info = get_quiz_info_or_404(quiz_id)
+    try:
+        _, iterations, responses, learners = get_item_banks().calibrate(quiz_id, info.question_count)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return CalibrationModel(
+        quiz_id=quiz_id,
+        responses=responses,
+        learners=learners,
+        question_count=info.question_count,
+        iterations=iterations
+    )
+
+
+@app.get("/quizzes/{quiz_id}/leaderboard", response_model=LeaderboardModel)
+async def get_leaderboard(
+    quiz_id: int,
+    limit: int = Query(10, ge=1, le=1000),
+    offset: int = Query(0, ge=0)
+):
+    """Get a page of a quiz's leaderboard, best scores first. Users with equal scores share a rank."""
+    get_quiz_info_or_404(quiz_id)
+    board = leaderboards.get(quiz_id)
+    entries = board.page(offset, limit) if board is not None else []
+    return LeaderboardModel(
+        quiz_id=quiz_id,
+        total=len(board) if board is not None else 0,
+        entries=[LeaderboardEntryModel(rank=rank, user_id=user_id, score=score) for rank, user_id, score in entries]
+    )
+
+
+@app.get("/quizzes/{quiz_id}/leaderboard/{user_id}", response_model=LeaderboardEntryModel)
+async def get_leaderboard_rank(quiz_id: int, user_id: str):
+    """Get a user's rank and best score on a quiz's leaderboard."""
+    get_quiz_info_or_404(quiz_id)
+    board = leaderboards.get(quiz_id)
+    ranked = board.rank(user_id) if board is not None else None
+    if ranked is None:
+        raise HTTPException(status_code=404, detail="User not on leaderboard")
+    return LeaderboardEntryModel(rank=ranked[0], user_id=user_id, score=ranked[1])
+
+
+@app.get("/quizzes/{quiz_id}/analytics", response_model=QuizAnalyticsModel)
+async def get_quiz_analytics(quiz_id: int):
+    """
+    Get how often each answer of each question was chosen and how often it was correct.
+
+    Answers are counted from single submissions, session answers and graded answer sheets.
+    """
+    quiz = get_quiz_or_404(quiz_id)
+    stats = answer_stats.question_stats(quiz_id)
+    questions = []
+    for question_id, q in enumerate(quiz.questions):
+        question_stats = stats.get(question_id) or QuestionStats(question_id, [0] * len(q.answers), 0)
+        questions.append(QuestionStatsModel(
+            question_id=question_id,
+            text=q.question,
+            submissions=question_stats.submissions,
+            correct=question_stats.correct,
+            correct_rate=question_stats.correct_rate,
+            answers=[
+                AnswerStatsModel(text=answer, is_correct=(i == q.correct_answer_index), count=count)
+                for i, (answer, count) in enumerate(zip(q.answers, question_stats.answer_counts))
+            ]
+        ))
+
+    return QuizAnalyticsModel(
+        quiz_id=quiz_id,
+        submissions=sum(question.submissions for question in questions),
+        questions=questions
+    )
+
+
+@app.get("/search", response_model=List[SearchResultModel])
+def search_questions(
+    q: str = Query(..., min_length=1, description="Words to search for in questions and answers"),
+    limit: int = Query(20, ge=1, le=100),
+    prefix: bool = Query(True, description="Let the last word match longer words starting with it"),
+    quiz_id: Optional[int] = Query(None, description="Only search this quiz")
+):
+    """Search questions and answers, best matches first."""
+    # A plain function, so indexing questions the index has not seen runs off the event loop
+    search_index.index_store(store, quiz_id)
+    results = []
+    for hit_quiz_id, question_id, score in search_index.search(q, limit=limit, prefix=prefix, quiz_id=quiz_id):
+        question_data = store.get_question(hit_quiz_id, question_id)
+        if question_data is not None:
+            results.append(SearchResultModel(
+                quiz_id=hit_quiz_id,
+                question_id=question_id,
+                text=question_data.question,
+                score=score
+            ))
+    return results
+
+
+class WebSocketTransport(Transport):
+    """Carries a quiz bot conversation over a WebSocket, one text frame per message."""
+
+    def __init__(self, websocket: WebSocket):
+        """
+        Initialize a new WebSocketTransport.
+
+        Args:
+            websocket: The accepted WebSocket.
+        """
+        self.websocket = websocket
+        self.connected = True
+
+    async def receive(self) -> Optional[str]:
+        """Wait for the next text frame; None once the client disconnects."""
+        try:
+            return await self.websocket.receive_text()
+        except WebSocketDisconnect:
+            self.connected = False
+            return None
+
+    async def send(self, text: str) -> None:
+        """Send a text frame."""
+        await self.websocket.send_text(text)
+
+    async def close(self) -> None:
+        """Close the WebSocket unless the client already has."""
+        if self.connected:
+            self.connected = False
+            await self.websocket.close()
+
+
+@app.websocket("/quizzes/{quiz_id}/chat")
+async def chat_with_bot(websocket: WebSocket, quiz_id: int):
+    """Take a quiz as a chat: the bot sends questions and feedback, the client sends answer numbers or 'q'."""
+    quiz = store.get_quiz(quiz_id)
+    if quiz is None:
+        await websocket.close(code=4404)
+        return
+
+    await websocket.accept()
+    await bots.serve(WebSocketTransport(websocket), quiz)
+
+
+def room_fields(room: Room) -> Dict[str, Any]:
+    """Get the fields of a live room's API representation."""
+    return {
+        "room_id": room.room_id,
+        "quiz_id": room.quiz_id,
+        "state": room.state,
+        "question_index": room.question_index,
+        "question_count": room.quiz.get_question_count(),
+        "participants": len(room.participants),
+        "counts": room.counts,
+        "answered": room.answered
+    }
+
+
+def get_room_or_404(room_id: str) -> Room:
+    """Get a live room or raise a 404 error."""
+    room = rooms.get(room_id)
+    if room is None:
+        raise HTTPException(status_code=404, detail="Room not found")
+    return room
+
+
+def require_host(room: Room, token: Optional[str]) -> None:
+    """Raise a 403 error unless the token is the room's host token."""
+    if token is None or not hmac.compare_digest(token.encode("utf-8"), room.host_token.encode("utf-8")):
+        raise HTTPException(status_code=403, detail="Invalid host token")
+
+
+@app.post("/rooms", response_model=RoomCreatedModel, status_code=status.HTTP_201_CREATED)
+async def create_room(room_data: RoomCreateModel):
+    """Open a live room for a quiz; the response holds the host token needed to run it."""
+    room = rooms.create(room_data.quiz_id, get_quiz_or_404(room_data.quiz_id))
+    return RoomCreatedModel(**room_fields(room), host_token=room.host_token)
+
+
+@app.get("/rooms/{room_id}", response_model=RoomModel)
+async def get_room(room_id: str):
+    """Get the state and running answer counts of a live room."""
+    return RoomModel(**room_fields(get_room_or_404(room_id)))
+
+
+@app.post("/rooms/{room_id}/advance", response_model=RoomModel)
+async def advance_room(room_id: str, x_host_token: Optional[str] = Header(None)):
+    """Reveal the open question, or send the next one, or finish the room (host only)."""
+    room = get_room_or_404(room_id)
+    require_host(room, x_host_token)
+    try:
+        # A finished room is removed, so later requests for it get 404
+        rooms.advance(room)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return RoomModel(**room_fields(room))
+
+
+@app.delete("/rooms/{room_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def close_room(room_id: str, x_host_token: Optional[str] = Header(None)):
+    """Finish a live room and disconnect its participants (host only)."""
+    require_host(get_room_or_404(room_id), x_host_token)
+    rooms.close(room_id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@app.websocket("/rooms/{room_id}/play")
+async def play_in_room(websocket: WebSocket, room_id: str, name: str = "Player"):
+    """
+    Take part in a live room.
+
+    The server sends JSON messages of type joined, question, tally, reveal and finished;
+    the client answers the open question by sending {"answer": <answer index>}.
+    """
+    room = rooms.get(room_id)
+    if room is None or room.state == ROOM_FINISHED:
+        await websocket.close(code=4404)
+        return
+
+    await websocket.accept()
+    participant = room.join(name[:100])
+
+    async def send_messages():
+        while True:
+            text = await participant.outbox.get()
+            if text is None:
+                await websocket.close(code=CLOSE_TOO_SLOW if participant.dropped else 1000)
+                return
+            await websocket.send_text(text)
+
+    async def receive_answers():
+        try:
+            while True:
+                data = await websocket.receive_text()
+                try:
+                    answer_index = int(json.loads(data)["answer"])
+                except (ValueError, KeyError, TypeError):
+                    continue
+                # Waits while the room's answer queue is full, which stops reading from this client
+                await room.submit(participant, answer_index)
+        except WebSocketDisconnect:
+            pass
+
+    tasks = [asyncio.ensure_future(send_messages()), asyncio.ensure_future(receive_answers())]
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for task in tasks:
+            task.cancel()
+        room.leave(participant)
+
+
 @app.post("/init-default-quiz", response_model=QuizModel)
-async def init_default_quiz():
+def init_default_quiz():
     """Initialize the default Python quiz."""
-    global quiz_id_counter
+    quiz_id = store.add_quiz(default_quiz())
+    return quiz_response(store.get_quiz_info(quiz_id))
+
+
+@app.get("/cache/stats")
+async def get_cache_stats():
+    """Get hit rate, memory use and eviction statistics of the response cache."""
+    return response_cache.stats()
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """Get request, latency, storage and cache metrics in the Prometheus text format."""
+    cache = response_cache.stats()
+    rooms.expire()
+    gauges = [
+        ("quizzes", "Stored quizzes.", len(store)),
+        ("questions", "Stored questions in all quizzes.", store.count_questions()),
+        ("search_documents", "Questions in the search index.", len(search_index)),
+        ("sessions_active", "Active quiz sessions.", len(sessions)),
+        ("bot_chats_active", "Quiz bot chats in progress.", bots.active),
+        ("rooms_active", "Open live rooms.", len(rooms)),
+        ("room_participants", "Participants connected to live rooms.", rooms.participant_count()),
+        ("response_cache_entries", "Entries in the response cache.", cache["entries"]),
+        ("response_cache_bytes", "Bytes held by the response cache.", cache["bytes"]),
+        ("response_cache_hits", "Response cache hits.", cache["hits"]),
+        ("response_cache_misses", "Response cache misses.", cache["misses"]),
+        ("response_cache_hit_ratio", "Fraction of response cache lookups that hit.", cache["hit_rate"]),
+    ]
+    return PlainTextResponse(metrics.render(gauges), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+def require_admin(token: Optional[str]) -> None:
+    """
+    Check the admin token of a request.
+
+    Args:
+        token: The X-Admin-Token header value.
+
+    Raises:
+        HTTPException: If admin endpoints are disabled or the token is wrong.
+    """
+    if not ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Admin endpoints are disabled; set QUIZMASTER_ADMIN_TOKEN")
+    if token is None or not hmac.compare_digest(token.encode("utf-8"), ADMIN_TOKEN.encode("utf-8")):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+
+def profile_response(stacks: str, samples: int, headers: Optional[Dict[str, str]] = None) -> PlainTextResponse:
+    """Build a collapsed-stacks download from a profile."""
+    headers = dict(headers or {})
+    headers["X-Profile-Samples"] = str(samples)
+    headers["Content-Disposition"] = 'attachment; filename="quizmaster-profile.folded"'
+    return PlainTextResponse(stacks, headers=headers)
+
+
+@app.post("/admin/profile", response_class=PlainTextResponse)
+async def profile_server(
+    seconds: float = Query(5.0, gt=0, le=60, description="How long to sample"),
+    interval_ms: float = Query(5.0, ge=1, le=1000, description="Milliseconds between samples"),
+    x_admin_token: Optional[str] = Header(None)
+):
+    """Sample the stacks of all server threads for a while and return them as collapsed stacks."""
+    require_admin(x_admin_token)
+    if profiling.busy:
+        raise HTTPException(status_code=409, detail="A profile is already running")
+
+    stacks, samples = await profiling.profile_for(seconds, interval_ms / 1000)
+    return profile_response(stacks, samples)
+
+
+@app.post("/admin/profile/requests", response_class=PlainTextResponse)
+async def profile_requests(
+    route: str = Query(..., description="The route template, for example /quizzes/{quiz_id}"),
+    method: Optional[str] = Query(None, description="Only profile this HTTP method"),
+    count: int = Query(10, ge=1, le=10000, description="How many requests to profile"),
+    timeout: float = Query(60.0, gt=0, le=600, description="The longest time to wait for the requests"),
+    interval_ms: float = Query(1.0, ge=1, le=1000, description="Milliseconds between samples"),
+    x_admin_token: Optional[str] = Header(None)
+):
+    """Sample the server while it handles the next requests to a route and return collapsed stacks."""
+    require_admin(x_admin_token)
+    routes = [
+        r for r in app.routes
+        if getattr(r, "path", None) == route and (method is None or method.upper() in getattr(r, "methods", ()))
+    ]
+    if not routes:
+        raise HTTPException(status_code=404, detail="Route not found")
+    if profiling.busy:
+        raise HTTPException(status_code=409, detail="A profile is already running")
+
+    stacks, samples, completed = await profiling.profile_requests(routes, count, timeout, interval_ms / 1000)
+    return profile_response(stacks, samples, {"X-Profiled-Requests": str(completed)})
+
+
+def parse_arguments(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse the command-line arguments of the server."""
+    parser = argparse.ArgumentParser(description="Run the QuizMaster API server")
+    parser.add_argument("--host", default="0.0.0.0", help="Host address to bind (default: 0.0.0.0)")
+    parser.add_argument("--port", type=int, default=8091, help="Port to listen on (default: 8091)")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.environ.get("QUIZMASTER_WORKERS", 1)),
+        help="Number of worker processes; 0 starts one per CPU core (default: 1)"
+    )
+    return parser.parse_args(argv)
+
 
-    bot = QuizBot()
-    quiz_id = quiz_id_counter
-    quiz_id_counter += 1
+def shared_store_url(store_url: str) -> str:
+    """
+    Get a storage URL that every worker process can share.
+
+    Workers are separate processes, so the in-memory store would give each of them a
+    different set of quizzes. In that case the SQLite store is used instead, whose
+    quiz IDs are allocated atomically in the database.
+
+    Args:
+        store_url: The configured storage URL.
+
+    Returns:
+        The storage URL to use with multiple workers.
 
-    quizzes[quiz_id] = bot.quiz
-    return quiz_to_model(bot.quiz, quiz_id)
+    Raises:
+        ValueError: If the URL names a journal store, whose directory belongs to one process.
+    """
+    if store_url == "memory":
+        return "sqlite:///quizmaster.db"
+    if store_url.startswith("journal:///"):
+        raise ValueError("A journal store cannot be shared by several workers; use a sqlite:/// store")
+    return store_url
 
 
-def main():
+def main(argv: Optional[List[str]] = None):
     """
     Main function to run the QuizMaster application.
 
-    This function starts the FastAPI application using Uvicorn.
+    This function starts the FastAPI application using Uvicorn. With a single worker the
+    server reloads on code changes for development. With more workers (production mode)
+    reloading is off and the workers share a SQLite store, so a quiz created through one
+    worker is immediately visible in all of them.
     """
-    uvicorn.run("quizmaster.main:app", host="0.0.0.0", port=8091, reload=True)
+    # Imported here so importing the app (tests, other ASGI servers) does not load the server
+    import uvicorn
+
+    args = parse_arguments(argv)
+    workers = args.workers or os.cpu_count() or 1
+
+    if workers == 1:
+        uvicorn.run("quizmaster.main:app", host=args.host, port=args.port, reload=True)
+        return
+
+    store_url = shared_store_url(os.environ.get("QUIZMASTER_STORE", "memory"))
+    # Worker processes inherit the environment and create their stores from it
+    os.environ["QUIZMASTER_STORE"] = store_url
+    print(f"Starting {workers} workers sharing {store_url}")
+    uvicorn.run("quizmaster.main:app", host=args.host, port=args.port, workers=workers)
 
 
 if __name__ == "__main__":
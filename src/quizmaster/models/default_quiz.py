@@ -0,0 +1,66 @@
+"""
+Default quiz module.
+
+This module holds the built-in Python programming quiz as frozen data. The quiz is
+built once, on first use, and callers get cheap copies of it, so starting the CLI or
+initializing the default quiz through the API does not rebuild it question by question.
+"""
+
+from typing import Optional, Tuple
+
+from quizmaster.models.quiz import Quiz
+
+DEFAULT_TITLE = "Python Programming Quiz"
+DEFAULT_DESCRIPTION = "Test your knowledge of Python programming basics"
+
+# (question, answers, correct answer index)
+DEFAULT_QUESTIONS: Tuple[Tuple[str, Tuple[str, ...], int], ...] = (
+    (
+        "What is the correct way to create a variable named 'age' with the value 25?",
+        ("variable age = 25", "age = 25", "int age = 25", "age := 25"),
+        1,  # "age = 25"
+    ),
+    (
+        "Which of the following is a valid way to comment in Python?",
+        ("// This is a comment", "/* This is a comment */", "# This is a comment", "<!-- This is a comment -->"),
+        2,  # "# This is a comment"
+    ),
+    (
+        "What does the len() function do in Python?",
+        (
+            "Returns the largest item in an iterable",
+            "Returns the length of an object",
+            "Returns the lowest item in an iterable",
+            "Returns the last item in an iterable",
+        ),
+        1,  # "Returns the length of an object"
+    ),
+    (
+        "Which of the following is NOT a built-in data type in Python?",
+        ("list", "dictionary", "array", "tuple"),
+        2,  # "array"
+    ),
+    (
+        "What is the output of print(2 ** 3)?",
+        ("6", "8", "5", "Error"),
+        1,  # "8"
+    ),
+)
+
+_template: Optional[Quiz] = None
+
+
+def default_quiz() -> Quiz:
+    """
+    Get a new copy of the default Python programming quiz.
+
+    Returns:
+        A Quiz that the caller may change without affecting later copies.
+    """
+    global _template
+    if _template is None:
+        template = Quiz(DEFAULT_TITLE, DEFAULT_DESCRIPTION)
+        for question, answers, correct_answer_index in DEFAULT_QUESTIONS:
+            template.add_question(question, list(answers), correct_answer_index)
+        _template = template
+    return _template.copy()
@@ -1,69 +1,283 @@
 """
 Quiz model module.
 
-This module defines the Quiz class, which represents a quiz in the QuizMaster application.
+This module defines the Quiz class, which represents a quiz in the QuizMaster application,
+and the Question record returned when reading its questions.
 """
 
-from typing import List, Optional
+import sys
+from array import array
+from typing import Any, Iterator, List, Optional, Sequence, Union, overload
+
+
+# Answer keys are stored as unsigned bytes
+MAX_ANSWERS = 255
+
+# Dedup policies, configured per quiz and applied by quizmaster.services.dedup
+DEDUP_OFF = "off"        # Accept every question
+DEDUP_WARN = "warn"      # Accept duplicates but report them
+DEDUP_REJECT = "reject"  # Refuse duplicates
+DEDUP_MERGE = "merge"    # Skip duplicates and point to the existing question
+DEDUP_POLICIES = (DEDUP_OFF, DEDUP_WARN, DEDUP_REJECT, DEDUP_MERGE)
+
+
+class Question:
+    """
+    A single question of a quiz.
+
+    Questions are built on access from the quiz's compact storage. For compatibility
+    with code written against the old dict representation, fields can also be read
+    with item access, e.g. ``question["answers"]``.
+
+    Attributes:
+        question (str): The question text.
+        answers (List[str]): The possible answers.
+        correct_answer_index (int): The index of the correct answer in the answers list.
+    """
+
+    __slots__ = ("question", "answers", "correct_answer_index")
+
+    def __init__(self, question: str, answers: List[str], correct_answer_index: int):
+        """
+        Initialize a new Question.
+
+        Args:
+            question: The question text.
+            answers: The possible answers.
+            correct_answer_index: The index of the correct answer.
+        """
+        self.question = question
+        self.answers = answers
+        self.correct_answer_index = correct_answer_index
+
+    def __getitem__(self, key: str) -> Any:
+        """
+        Read a field by name.
+
+        Raises:
+            KeyError: If the field does not exist.
+        """
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def to_dict(self) -> dict:
+        """
+        Convert the question to a plain dictionary.
+
+        Returns:
+            A dictionary with the question, answers and correct_answer_index keys.
+        """
+        return {
+            "question": self.question,
+            "answers": self.answers,
+            "correct_answer_index": self.correct_answer_index
+        }
+
+    def __eq__(self, other: object) -> bool:
+        """Compare with another Question or a dict in the old representation."""
+        if isinstance(other, Question):
+            other = other.to_dict()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        """Return a debugging representation of the question."""
+        return f"Question({self.question!r}, {self.answers!r}, {self.correct_answer_index!r})"
+
+
+class QuestionList(Sequence):
+    """
+    A read-only sequence view over the questions of a quiz.
+
+    Items are Question records built on access, so no per-question objects are kept in memory.
+    """
+
+    __slots__ = ("_quiz",)
+
+    def __init__(self, quiz: "Quiz"):
+        """
+        Initialize a new QuestionList.
+
+        Args:
+            quiz: The quiz whose questions are viewed.
+        """
+        self._quiz = quiz
+
+    def __len__(self) -> int:
+        """Return the number of questions."""
+        return self._quiz.get_question_count()
+
+    @overload
+    def __getitem__(self, index: int) -> Question: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Question]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Question, List[Question]]:
+        """Return the question at the given index, or a list of questions for a slice."""
+        if isinstance(index, slice):
+            return [self._quiz.get_question(i) for i in range(*index.indices(len(self)))]
+        return self._quiz.get_question(index)
+
+    def __iter__(self) -> Iterator[Question]:
+        """Iterate over the questions."""
+        for i in range(len(self)):
+            yield self._quiz.get_question(i)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare element-wise with another sequence of questions."""
+        if isinstance(other, (list, tuple, QuestionList)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        """Return a debugging representation of the questions."""
+        return repr(list(self))
 
 
 class Quiz:
     """
     Represents a quiz with questions and answers.
-    
+
+    Questions are stored column-wise to keep memory use low with very large quizzes:
+    question texts in one list, all answer texts in one flat list (interned, so
+    repeated answers such as "True"/"False" are shared), the offset of each question's
+    first answer in an ``array('I')`` and the answer keys in an ``array('B')``.
+
     Attributes:
         title (str): The title of the quiz.
         description (str): A description of the quiz.
-        questions (List[dict]): A list of questions, each with answers and correct answer.
+        questions (QuestionList): A read-only view of the questions, each with answers and correct answer.
+        version (int): A counter incremented on every change to the quiz content.
+            Readers can use it to tell whether cached data is stale.
+        dedup_policy (str): How duplicate questions are handled when they are added through
+            the API: "off", "warn", "reject" or "merge" (see quizmaster.services.dedup).
     """
-    
-    def __init__(self, title: str, description: Optional[str] = None):
+
+    __slots__ = ("title", "description", "version", "dedup_policy", "_texts", "_answer_texts", "_answer_offsets", "_answer_keys")
+
+    def __init__(self, title: str, description: Optional[str] = None, dedup_policy: str = "off"):
         """
         Initialize a new Quiz.
-        
+
         Args:
             title: The title of the quiz.
             description: An optional description of the quiz.
+            dedup_policy: How duplicate questions are handled.
         """
         self.title = title
         self.description = description or ""
-        self.questions: List[dict] = []
-    
+        self.version = 0
+        self.dedup_policy = dedup_policy
+        self._texts: List[str] = []
+        self._answer_texts: List[str] = []
+        self._answer_offsets = array("I", [0])
+        self._answer_keys = array("B")
+
+    @property
+    def questions(self) -> QuestionList:
+        """A read-only view of the questions."""
+        return QuestionList(self)
+
+    @property
+    def answer_keys(self) -> array:
+        """The correct answer index of every question, in question order. Do not modify."""
+        return self._answer_keys
+
+    @property
+    def answer_offsets(self) -> array:
+        """The offset of each question's first answer, plus the total answer count at the end. Do not modify."""
+        return self._answer_offsets
+
     def add_question(self, question: str, answers: List[str], correct_answer_index: int) -> None:
         """
         Add a question to the quiz.
-        
+
         Args:
             question: The question text.
             answers: A list of possible answers.
             correct_answer_index: The index of the correct answer in the answers list.
-        
+
         Raises:
-            ValueError: If correct_answer_index is out of range.
+            ValueError: If correct_answer_index is out of range or there are more than 255 answers.
+        """
+        self.validate_question(answers, correct_answer_index)
+
+        self._texts.append(question)
+        self._answer_texts.extend(sys.intern(answer) for answer in answers)
+        self._answer_offsets.append(len(self._answer_texts))
+        self._answer_keys.append(correct_answer_index)
+        self.version += 1
+
+    @staticmethod
+    def validate_question(answers: List[str], correct_answer_index: int) -> None:
+        """
+        Check that a question can be stored.
+
+        Args:
+            answers: A list of possible answers.
+            correct_answer_index: The index of the correct answer in the answers list.
+
+        Raises:
+            ValueError: If correct_answer_index is out of range or there are more than 255 answers.
         """
         if not 0 <= correct_answer_index < len(answers):
             raise ValueError("Correct answer index out of range")
-        
-        self.questions.append({
-            "question": question,
-            "answers": answers,
-            "correct_answer_index": correct_answer_index
-        })
-    
+        if len(answers) > MAX_ANSWERS:
+            raise ValueError(f"A question can have at most {MAX_ANSWERS} answers")
+
+    def get_question(self, index: int) -> Question:
+        """
+        Get a question by its position.
+
+        Args:
+            index: The zero-based position of the question.
+
+        Returns:
+            The question record.
+
+        Raises:
+            IndexError: If there is no question at that position.
+        """
+        if index < 0:
+            index += len(self._texts)
+        if not 0 <= index < len(self._texts):
+            raise IndexError("Question index out of range")
+        start = self._answer_offsets[index]
+        end = self._answer_offsets[index + 1]
+        return Question(self._texts[index], self._answer_texts[start:end], self._answer_keys[index])
+
+    def copy(self) -> "Quiz":
+        """
+        Copy the quiz without revalidating its questions.
+
+        Returns:
+            A new Quiz with the same content and version that can be changed independently.
+        """
+        quiz = Quiz(self.title, self.description, self.dedup_policy)
+        quiz.version = self.version
+        quiz._texts = self._texts.copy()
+        quiz._answer_texts = self._answer_texts.copy()
+        quiz._answer_offsets = array("I", self._answer_offsets)
+        quiz._answer_keys = array("B", self._answer_keys)
+        return quiz
+
     def get_question_count(self) -> int:
         """
         Get the number of questions in the quiz.
-        
+
         Returns:
             The number of questions.
         """
-        return len(self.questions)
-    
+        return len(self._texts)
+
     def __str__(self) -> str:
         """
         Return a string representation of the quiz.
-        
+
         Returns:
             A string representation.
         """
-        return f"Quiz: {self.title} ({self.get_question_count()} questions)"
\ No newline at end of file
+        return f"Quiz: {self.title} ({self.get_question_count()} questions)"
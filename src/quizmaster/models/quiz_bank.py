@@ -0,0 +1,275 @@
+"""
+Quiz bank module.
+
+This module defines a compact, read-only file format for large question banks and
+QuizBank, a Quiz-compatible view that memory-maps such a file. Opening a bank reads
+only its header: questions are decoded from the mapped pages when they are accessed,
+so a million-question bank opens instantly, costs almost no private memory, and
+worker processes that map the same file share its pages through the OS page cache.
+
+File layout (little-endian):
+
+    header          HEADER
+    metadata        JSON object with title, description and dedup_policy
+    string heap     UTF-8 text of every question followed by its answers, back to back
+    (padding to 8 bytes)
+    string offsets  uint64 file offset of every string, plus the end of the heap
+    answer offsets  uint32 index of each question's first answer, plus the answer count
+    answer keys     uint8 correct answer index of every question
+
+The answer offsets match Quiz.answer_offsets, so question i's text is string
+i + answer_offsets[i] and its answers are the strings after it.
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Iterable, Optional, Tuple
+
+from quizmaster.models.quiz import Question, QuestionList, Quiz
+
+
+MAGIC = b"QMB1"
+FORMAT_VERSION = 1
+
+# Magic, format version, reserved, question count, answer count, metadata offset and
+# length, string offsets offset, answer offsets offset, answer keys offset
+HEADER = struct.Struct("<4sHHQQQQQQQ")
+
+# A question to write: question text, answers and correct answer index
+BankRow = Tuple[str, Iterable[str], int]
+
+
+def _section(mapped: mmap.mmap, offset: int, count: int, typecode: str):
+    """View count items of a typed array stored at an offset, without copying where possible."""
+    itemsize = array(typecode).itemsize
+    view = memoryview(mapped)[offset:offset + count * itemsize]
+    if itemsize == 1 or sys.byteorder == "little":
+        return view.cast(typecode)
+    # Big-endian machines get a byte-swapped copy
+    copy = array(typecode, view.tobytes())
+    view.release()
+    copy.byteswap()
+    return copy
+
+
+def write_quiz_bank(
+    path: str, title: str, rows: Iterable[BankRow], description: str = "", dedup_policy: str = "off"
+) -> int:
+    """
+    Write a quiz bank file.
+
+    Strings are streamed to the file as rows arrive; only the offset tables are kept
+    in memory.
+
+    Args:
+        path: The file to write.
+        title: The title of the quiz.
+        rows: The questions, in order.
+        description: The description of the quiz.
+        dedup_policy: The dedup policy reported by the quiz.
+
+    Returns:
+        The number of questions written.
+
+    Raises:
+        ValueError: If a row is invalid; the file is left incomplete.
+    """
+    metadata = json.dumps(
+        {"title": title, "description": description, "dedup_policy": dedup_policy}, ensure_ascii=False
+    ).encode("utf-8")
+    string_offsets = array("Q")
+    answer_offsets = array("I", [0])
+    answer_keys = array("B")
+
+    with open(path, "wb") as file:
+        file.write(bytes(HEADER.size))
+        file.write(metadata)
+        position = HEADER.size + len(metadata)
+        for text, answers, correct_answer_index in rows:
+            answers = list(answers)
+            Quiz.validate_question(answers, correct_answer_index)
+            for string in [text] + answers:
+                data = string.encode("utf-8")
+                string_offsets.append(position)
+                file.write(data)
+                position += len(data)
+            answer_offsets.append(answer_offsets[-1] + len(answers))
+            answer_keys.append(correct_answer_index)
+        string_offsets.append(position)
+
+        padding = -position % 8
+        file.write(bytes(padding))
+        string_offsets_offset = position + padding
+        answer_offsets_offset = string_offsets_offset + 8 * len(string_offsets)
+        answer_keys_offset = answer_offsets_offset + 4 * len(answer_offsets)
+        if sys.byteorder == "big":
+            string_offsets.byteswap()
+            answer_offsets.byteswap()
+        string_offsets.tofile(file)
+        answer_offsets.tofile(file)
+        answer_keys.tofile(file)
+
+        file.seek(0)
+        file.write(HEADER.pack(
+            MAGIC, FORMAT_VERSION, 0, len(answer_keys), len(string_offsets) - 1 - len(answer_keys),
+            HEADER.size, len(metadata), string_offsets_offset, answer_offsets_offset, answer_keys_offset
+        ))
+    return len(answer_keys)
+
+
+class QuizBank:
+    """
+    A read-only quiz backed by a memory-mapped quiz bank file.
+
+    It offers the reading interface of Quiz (questions, get_question, answer_keys,
+    answer_offsets, ...), so stores and the API serve it like any other quiz.
+    add_question raises ValueError, which stores report as a per-row error.
+
+    Attributes:
+        path (str): The absolute path of the bank file.
+        title (str): The title of the quiz.
+        description (str): The description of the quiz.
+        version (int): The content version, equal to the number of questions.
+        dedup_policy (str): Reported for compatibility; banks never change.
+    """
+
+    def __init__(self, path: str):
+        """
+        Map a quiz bank file.
+
+        Args:
+            path: The bank file.
+
+        Raises:
+            ValueError: If the file is not a quiz bank.
+        """
+        self.path = os.path.abspath(path)
+        with open(self.path, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            if size < HEADER.size:
+                raise ValueError(f"{path} is not a quiz bank")
+            self._mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (magic, version, _, question_count, answer_count, metadata_offset, metadata_length,
+         string_offsets_offset, answer_offsets_offset, answer_keys_offset) = HEADER.unpack_from(self._mapped)
+        if magic != MAGIC or version != FORMAT_VERSION or answer_keys_offset + question_count > size:
+            self._mapped.close()
+            raise ValueError(f"{path} is not a quiz bank")
+
+        metadata = json.loads(self._mapped[metadata_offset:metadata_offset + metadata_length])
+        self.title: str = metadata["title"]
+        self.description: str = metadata.get("description") or ""
+        self.dedup_policy: str = metadata.get("dedup_policy", "off")
+        self.version = question_count
+        self._question_count = question_count
+        self._string_offsets = _section(
+            self._mapped, string_offsets_offset, question_count + answer_count + 1, "Q"
+        )
+        self._answer_offsets = _section(self._mapped, answer_offsets_offset, question_count + 1, "I")
+        self._answer_keys = _section(self._mapped, answer_keys_offset, question_count, "B")
+
+    @property
+    def questions(self) -> QuestionList:
+        """A read-only view of the questions, decoded on access."""
+        return QuestionList(self)
+
+    @property
+    def answer_keys(self) -> memoryview:
+        """The correct answer index of every question, straight from the mapped file."""
+        return self._answer_keys
+
+    @property
+    def answer_offsets(self) -> memoryview:
+        """The offset of each question's first answer, plus the total answer count at the end."""
+        return self._answer_offsets
+
+    def add_question(self, question: str, answers, correct_answer_index: int) -> None:
+        """
+        Refuse to add a question.
+
+        Raises:
+            ValueError: Always; quiz banks are read-only.
+        """
+        raise ValueError("Quiz banks are read-only")
+
+    validate_question = staticmethod(Quiz.validate_question)
+
+    def get_question(self, index: int) -> Question:
+        """
+        Decode a question by its position.
+
+        Args:
+            index: The zero-based position of the question.
+
+        Returns:
+            The question record.
+
+        Raises:
+            IndexError: If there is no question at that position.
+        """
+        if index < 0:
+            index += self._question_count
+        if not 0 <= index < self._question_count:
+            raise IndexError("Question index out of range")
+        # Each question's text is followed by its answers
+        text = index + self._answer_offsets[index]
+        end = index + 1 + self._answer_offsets[index + 1]
+        return Question(
+            self._string(text),
+            [self._string(i) for i in range(text + 1, end)],
+            self._answer_keys[index]
+        )
+
+    def get_question_count(self) -> int:
+        """Get the number of questions in the bank."""
+        return self._question_count
+
+    def copy(self) -> Quiz:
+        """
+        Load the bank into a regular, writable Quiz.
+
+        Returns:
+            A new Quiz with the same content and version.
+        """
+        quiz = Quiz(self.title, self.description, self.dedup_policy)
+        for question in self.questions:
+            quiz.add_question(question.question, question.answers, question.correct_answer_index)
+        return quiz
+
+    def close(self) -> None:
+        """Unmap the file; the bank cannot be read afterwards."""
+        for view in (self._string_offsets, self._answer_offsets, self._answer_keys):
+            if isinstance(view, memoryview):
+                view.release()
+        self._mapped.close()
+
+    def _string(self, index: int) -> str:
+        """Decode a string from the heap."""
+        return self._mapped[self._string_offsets[index]:self._string_offsets[index + 1]].decode("utf-8")
+
+    def __str__(self) -> str:
+        """Return a string representation of the bank."""
+        return f"Quiz: {self.title} ({self._question_count} questions)"
+
+
+def open_quiz_bank(path: str) -> Optional[QuizBank]:
+    """
+    Open a quiz bank if the file exists.
+
+    Args:
+        path: The bank file.
+
+    Returns:
+        The bank, or None if the file is missing.
+
+    Raises:
+        ValueError: If the file is not a quiz bank.
+    """
+    try:
+        return QuizBank(path)
+    except FileNotFoundError:
+        return None
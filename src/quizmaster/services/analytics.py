@@ -0,0 +1,143 @@
+"""
+Answer analytics module.
+
+This module defines AnswerStats, which counts how often each answer of each question
+is chosen and how often it is correct, so questions that are too easy, too hard or
+broken can be spotted.
+"""
+
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from quizmaster.services.grading import GradingResult
+
+
+# Per question: a count for every answer choice followed by the number of correct answers
+Counters = List[int]
+
+
+class QuestionStats:
+    """
+    The aggregated answers to one question.
+
+    Attributes:
+        question_id (int): The position of the question in the quiz.
+        answer_counts (List[int]): How often each answer was chosen.
+        correct (int): How many answers were correct.
+    """
+
+    __slots__ = ("question_id", "answer_counts", "correct")
+
+    def __init__(self, question_id: int, answer_counts: List[int], correct: int):
+        """
+        Initialize a new QuestionStats.
+
+        Args:
+            question_id: The position of the question in the quiz.
+            answer_counts: How often each answer was chosen.
+            correct: How many answers were correct.
+        """
+        self.question_id = question_id
+        self.answer_counts = answer_counts
+        self.correct = correct
+
+    @property
+    def submissions(self) -> int:
+        """The total number of answers."""
+        return sum(self.answer_counts)
+
+    @property
+    def correct_rate(self) -> Optional[float]:
+        """The fraction of correct answers, or None if there are no answers."""
+        submissions = self.submissions
+        return self.correct / submissions if submissions else None
+
+
+class AnswerStats:
+    """
+    Answer counters by quiz and question.
+
+    Answers are recorded by async routes, which all run on the event loop's thread, so
+    the counters are plain dictionaries and lists updated without a lock.
+
+    Counts are kept in the current process; with several workers each one reports the
+    answers it graded.
+    """
+
+    def __init__(self):
+        """Initialize new, empty AnswerStats."""
+        self._counters: Dict[int, Dict[int, Counters]] = {}
+
+    def _quiz_counters(self, quiz_id: int) -> Dict[int, Counters]:
+        """Get the counters of a quiz, creating them on first use."""
+        quiz_counters = self._counters.get(quiz_id)
+        if quiz_counters is None:
+            quiz_counters = self._counters[quiz_id] = {}
+        return quiz_counters
+
+    def record(self, quiz_id: int, question_id: int, answer_index: int, answer_count: int, is_correct: bool) -> None:
+        """
+        Count one answer to a question.
+
+        Args:
+            quiz_id: The quiz ID.
+            question_id: The position of the question in the quiz.
+            answer_index: The chosen answer.
+            answer_count: The number of answers the question has.
+            is_correct: Whether the chosen answer is correct.
+        """
+        quiz_counters = self._quiz_counters(quiz_id)
+        counters = quiz_counters.get(question_id)
+        if counters is None:
+            counters = quiz_counters[question_id] = [0] * (answer_count + 1)
+        counters[answer_index] += 1
+        if is_correct:
+            counters[-1] += 1
+
+    def record_sheets(self, quiz_id: int, result: "GradingResult") -> None:
+        """
+        Count the answers of graded answer sheets.
+
+        Args:
+            quiz_id: The quiz ID.
+            result: The grading result of the sheets.
+        """
+        # Imported here so counting single answers does not load NumPy
+        import numpy as np
+
+        from quizmaster.services.grading import UNANSWERED
+
+        quiz_counters = self._quiz_counters(quiz_id)
+        answers = result.answers
+        correct_counts = result.question_correct_counts.tolist()
+        for question_id in np.flatnonzero((answers != UNANSWERED).any(axis=0)).tolist():
+            answer_count = int(result.answer_counts[question_id])
+            column = answers[:, question_id]
+            histogram = np.bincount(column[column != UNANSWERED], minlength=answer_count)
+            counters = quiz_counters.get(question_id)
+            if counters is None:
+                counters = quiz_counters[question_id] = [0] * (answer_count + 1)
+            for answer_index, count in enumerate(histogram.tolist()):
+                counters[answer_index] += count
+            counters[-1] += correct_counts[question_id]
+
+    def question_stats(self, quiz_id: int) -> Dict[int, QuestionStats]:
+        """
+        Get the statistics of one quiz.
+
+        Args:
+            quiz_id: The quiz ID.
+
+        Returns:
+            The statistics of every answered question, by question ID.
+        """
+        quiz_counters = self._counters.get(quiz_id, {})
+        # Copying the items is atomic, so adaptive sessions can read the rates from the executor
+        return {
+            question_id: QuestionStats(question_id, counters[:-1], counters[-1])
+            for question_id, counters in list(quiz_counters.items())
+        }
+
+    def clear(self) -> None:
+        """Reset every counter."""
+        self._counters.clear()
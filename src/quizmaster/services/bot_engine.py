@@ -0,0 +1,254 @@
+"""
+Bot engine module.
+
+This module splits the quiz bot's question, answer and feedback logic out of the
+terminal loop. A Conversation is a small synchronous state machine that turns user
+input into reply messages; BotEngine drives conversations over pluggable transports
+on an asyncio event loop, so one process can host thousands of chats at once.
+
+Transports for the terminal and for in-memory use (tests, load generators) are
+defined here; the WebSocket transport lives with the API in quizmaster.main so the
+CLI never loads the web stack.
+"""
+
+import asyncio
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from quizmaster.models.quiz import Quiz
+
+ANSWER_PROMPT = "\nYour answer (or 'q' to quit): "
+
+QUIT_COMMAND = "q"
+
+
+class Conversation:
+    """
+    The state of one chat with the quiz bot.
+
+    A conversation only references the shared quiz and keeps a few integers, so
+    thousands of them fit in little memory.
+
+    Attributes:
+        quiz (Quiz): The quiz being asked.
+        index (int): The index of the current question.
+        correct (int): The number of correct answers.
+        finished (bool): Whether the quiz was completed or the user quit.
+    """
+
+    __slots__ = ("quiz", "index", "correct", "finished")
+
+    def __init__(self, quiz: Quiz, index: int = 0):
+        """
+        Initialize a new Conversation.
+
+        Args:
+            quiz: The quiz to ask.
+            index: The index of the first question to ask.
+        """
+        self.quiz = quiz
+        self.index = index
+        self.correct = 0
+        self.finished = False
+
+    def start(self) -> List[str]:
+        """
+        Begin the conversation.
+
+        Returns:
+            The welcome messages followed by the first question.
+        """
+        messages = [
+            f"Welcome to the {self.quiz.title}!",
+            f"{self.quiz.description}\n",
+            "For each question, enter the number of your answer or 'q' to quit.",
+        ]
+        return messages + self._next()
+
+    def handle(self, text: str) -> List[str]:
+        """
+        Handle one message from the user.
+
+        Args:
+            text: The user's input: an answer number or 'q' to quit.
+
+        Returns:
+            The reply messages: feedback and the next question, or the closing messages.
+        """
+        if self.finished:
+            return []
+
+        text = text.strip().lower()
+        if text == QUIT_COMMAND:
+            self.finished = True
+            return ["Thanks for playing!"]
+
+        question_data = self.quiz.get_question(self.index)
+        try:
+            answer_index = int(text) - 1  # Convert to 0-based index
+        except ValueError:
+            return ["Please enter a valid number or 'q' to quit"] + self._next()
+        if not 0 <= answer_index < len(question_data.answers):
+            return [f"Please enter a number between 1 and {len(question_data.answers)}"] + self._next()
+
+        if answer_index == question_data.correct_answer_index:
+            self.correct += 1
+            messages = ["Correct! Well done!"]
+        else:
+            correct_answer = question_data.answers[question_data.correct_answer_index]
+            messages = [f"Sorry, that's incorrect. The correct answer is: {correct_answer}"]
+        self.index += 1
+        return messages + self._next()
+
+    def _next(self) -> List[str]:
+        """Get the messages presenting the current question, or the completion messages."""
+        if self.index >= self.quiz.get_question_count():
+            self.finished = True
+            return ["\nCongratulations! You've completed the quiz.", "Thanks for playing!"]
+
+        question_data = self.quiz.get_question(self.index)
+        messages = [f"\nQuestion {self.index + 1}: {question_data.question}"]
+        messages.extend(f"{i + 1}. {answer}" for i, answer in enumerate(question_data.answers))
+        return messages
+
+
+class Transport(ABC):
+    """A channel that carries one conversation's messages."""
+
+    @abstractmethod
+    async def receive(self) -> Optional[str]:
+        """
+        Wait for the next message from the user.
+
+        Returns:
+            The message, or None when the user has gone away.
+        """
+
+    @abstractmethod
+    async def send(self, text: str) -> None:
+        """
+        Send a reply to the user.
+
+        Args:
+            text: The reply; multiple lines are separated by newlines.
+        """
+
+    async def close(self) -> None:
+        """Close the channel after the conversation ends."""
+
+
+class TerminalTransport(Transport):
+    """
+    Talks to the user on standard input and output.
+
+    input() runs in a worker thread so the event loop is never blocked.
+    """
+
+    def __init__(self, prompt: str = ANSWER_PROMPT):
+        """
+        Initialize a new TerminalTransport.
+
+        Args:
+            prompt: The prompt shown when waiting for input.
+        """
+        self.prompt = prompt
+
+    async def receive(self) -> Optional[str]:
+        """Read a line from the terminal; None at end of input."""
+        try:
+            return await asyncio.get_running_loop().run_in_executor(None, input, self.prompt)
+        except EOFError:
+            return None
+
+    async def send(self, text: str) -> None:
+        """Print a reply."""
+        print(text)
+
+
+class MemoryTransport(Transport):
+    """
+    Exchanges messages through in-memory queues, for tests and load generators.
+
+    Attributes:
+        replies (asyncio.Queue): The replies sent by the bot, in order.
+    """
+
+    def __init__(self):
+        """Initialize empty queues."""
+        self._inbox: asyncio.Queue = asyncio.Queue()
+        self.replies: asyncio.Queue = asyncio.Queue()
+        self.closed = False
+
+    def put(self, text: Optional[str]) -> None:
+        """Queue a message from the user; None hangs up."""
+        self._inbox.put_nowait(text)
+
+    async def ask(self, text: str) -> str:
+        """
+        Send a message as the user and wait for the bot's reply.
+
+        Args:
+            text: The user's message.
+
+        Returns:
+            The reply.
+        """
+        self.put(text)
+        return await self.replies.get()
+
+    async def receive(self) -> Optional[str]:
+        """Wait for the next queued user message."""
+        return await self._inbox.get()
+
+    async def send(self, text: str) -> None:
+        """Queue a reply."""
+        self.replies.put_nowait(text)
+
+    async def close(self) -> None:
+        """Mark the transport as closed."""
+        self.closed = True
+
+
+class BotEngine:
+    """
+    Drives quiz bot conversations over transports.
+
+    Each conversation is a coroutine waiting on its transport, so any number of them
+    share one event loop.
+
+    Attributes:
+        active (int): The number of conversations in progress.
+        completed (int): The number of conversations that have ended.
+    """
+
+    def __init__(self):
+        """Initialize an idle engine."""
+        self.active = 0
+        self.completed = 0
+
+    async def serve(self, transport: Transport, quiz: Quiz, index: int = 0) -> Conversation:
+        """
+        Run one conversation until the quiz is finished or the user goes away.
+
+        Args:
+            transport: The channel to the user.
+            quiz: The quiz to ask.
+            index: The index of the first question to ask.
+
+        Returns:
+            The finished conversation.
+        """
+        conversation = Conversation(quiz, index)
+        self.active += 1
+        try:
+            await transport.send("\n".join(conversation.start()))
+            while not conversation.finished:
+                text = await transport.receive()
+                if text is None:
+                    break
+                await transport.send("\n".join(conversation.handle(text)))
+        finally:
+            self.active -= 1
+            self.completed += 1
+            await transport.close()
+        return conversation
@@ -0,0 +1,319 @@
+"""
+Duplicate detection module.
+
+This module detects duplicate questions when they are added to a quiz. Exact duplicates
+(same normalized question and answers) are found through a content hash. Near duplicates
+(question texts that differ only slightly) are found through MinHash signatures stored in
+locality-sensitive hashing (LSH) buckets, so a lookup only compares against a handful of
+candidates instead of every question in the quiz.
+"""
+
+import hashlib
+import re
+import threading
+import zlib
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+
+# The dedup policies are defined with the Quiz model, so they can be used without NumPy
+from quizmaster.models.quiz import DEDUP_MERGE, DEDUP_OFF, DEDUP_POLICIES, DEDUP_REJECT, DEDUP_WARN  # noqa: F401
+from quizmaster.services.quiz_store import QuestionRow, QuizStore
+
+# MinHash parameters: 64 permutations in 16 bands of 4 rows make questions with a
+# Jaccard similarity of 0.8 share a bucket with a probability above 99.9%.
+NUM_PERMUTATIONS = 64
+BANDS = 16
+ROWS_PER_BAND = NUM_PERMUTATIONS // BANDS
+SHINGLE_SIZE = 3
+
+_random = np.random.default_rng(0x5EED)
+_PERMUTATION_A = _random.integers(0, 2 ** 64, size=NUM_PERMUTATIONS, dtype=np.uint64, endpoint=False) | np.uint64(1)
+_PERMUTATION_B = _random.integers(0, 2 ** 64, size=NUM_PERMUTATIONS, dtype=np.uint64, endpoint=False)
+
+_NON_WORD = re.compile(r"[^\w]+")
+
+
+def normalize(text: str) -> str:
+    """
+    Normalize text for comparison: lowercase, punctuation removed, whitespace collapsed.
+
+    Args:
+        text: The text to normalize.
+
+    Returns:
+        The normalized text.
+    """
+    return _NON_WORD.sub(" ", text.lower()).strip()
+
+
+class Fingerprint:
+    """
+    The values used to compare a question with others.
+
+    Attributes:
+        content_hash (bytes): A hash of the normalized question and its answers in any order.
+        signature (np.ndarray): The MinHash signature of the normalized question text.
+    """
+
+    __slots__ = ("content_hash", "signature")
+
+    def __init__(self, content_hash: bytes, signature: np.ndarray):
+        """
+        Initialize a new Fingerprint.
+
+        Args:
+            content_hash: The content hash.
+            signature: The MinHash signature.
+        """
+        self.content_hash = content_hash
+        self.signature = signature
+
+
+def fingerprint(question: str, answers: List[str]) -> Fingerprint:
+    """
+    Compute the fingerprint of a question.
+
+    Args:
+        question: The question text.
+        answers: The possible answers.
+
+    Returns:
+        The fingerprint.
+    """
+    text = normalize(question)
+    content = "\x1f".join([text] + sorted(normalize(answer) for answer in answers))
+    content_hash = hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+
+    shingles = {text[i:i + SHINGLE_SIZE] for i in range(max(len(text) - SHINGLE_SIZE + 1, 1))}
+    hashes = np.fromiter(
+        (zlib.crc32(shingle.encode("utf-8")) for shingle in shingles), dtype=np.uint64, count=len(shingles)
+    )
+    # Multiply-shift hashing: the high 32 bits of a*x + b (mod 2**64), with random 64-bit a and b
+    permuted = (_PERMUTATION_A[:, None] * hashes[None, :] + _PERMUTATION_B[:, None]) >> np.uint64(32)
+    signature = permuted.min(axis=1).astype(np.uint32)
+    return Fingerprint(content_hash, signature)
+
+
+class DuplicateMatch:
+    """
+    An existing question that a new question duplicates.
+
+    Attributes:
+        question_id (int): The ID of the existing question.
+        exact (bool): Whether the questions are identical after normalization.
+        similarity (float): The estimated Jaccard similarity of the question texts.
+    """
+
+    __slots__ = ("question_id", "exact", "similarity")
+
+    def __init__(self, question_id: int, exact: bool, similarity: float):
+        """
+        Initialize a new DuplicateMatch.
+
+        Args:
+            question_id: The ID of the existing question.
+            exact: Whether the match is exact.
+            similarity: The estimated similarity.
+        """
+        self.question_id = question_id
+        self.exact = exact
+        self.similarity = similarity
+
+    def describe(self, subject: str = "question") -> str:
+        """
+        Return a human-readable description of the match.
+
+        Args:
+            subject: What question_id numbers, e.g. "line" for rows that are not stored yet.
+        """
+        if self.exact:
+            return f"Duplicate of {subject} {self.question_id}"
+        return f"Near duplicate of {subject} {self.question_id} ({self.similarity:.0%} similar)"
+
+
+class DedupIndex:
+    """
+    The duplicate-detection index of one quiz.
+
+    Content hashes map to question IDs in a dictionary. Signatures are rows of a matrix
+    indexed by question ID, and each band of a signature is a key into a bucket
+    dictionary, so near-duplicate candidates are found without scanning the quiz and
+    are then compared in one vectorized step.
+
+    Attributes:
+        threshold (float): The estimated similarity at which a question counts as a near duplicate.
+    """
+
+    def __init__(self, threshold: float = 0.8):
+        """
+        Initialize a new, empty DedupIndex.
+
+        Args:
+            threshold: The estimated similarity at which a question counts as a near duplicate.
+        """
+        self.threshold = threshold
+        self._exact: Dict[bytes, int] = {}
+        self._signatures = np.zeros((64, NUM_PERMUTATIONS), dtype=np.uint32)
+        self._buckets: List[Dict[bytes, Union[int, List[int]]]] = [{} for _ in range(BANDS)]
+        self._count = 0
+
+    @property
+    def count(self) -> int:
+        """The number of indexed questions; the next question ID the index expects."""
+        return self._count
+
+    def find(self, print_: Fingerprint) -> Optional[DuplicateMatch]:
+        """
+        Find an indexed question that the fingerprinted question duplicates.
+
+        Args:
+            print_: The fingerprint of the new question.
+
+        Returns:
+            The best match, or None if the question is new.
+        """
+        question_id = self._exact.get(print_.content_hash)
+        if question_id is not None:
+            return DuplicateMatch(question_id, True, 1.0)
+
+        candidates = set()
+        for band, key in enumerate(self._band_keys(print_.signature)):
+            bucket = self._buckets[band].get(key)
+            if isinstance(bucket, int):
+                candidates.add(bucket)
+            elif bucket is not None:
+                candidates.update(bucket)
+
+        if not candidates:
+            return None
+        ids = np.fromiter(candidates, dtype=np.int64, count=len(candidates))
+        similarities = (self._signatures[ids] == print_.signature).sum(axis=1) / NUM_PERMUTATIONS
+        best = int(similarities.argmax())
+        if similarities[best] < self.threshold:
+            return None
+        return DuplicateMatch(int(ids[best]), False, float(similarities[best]))
+
+    def add(self, question_id: int, print_: Fingerprint) -> None:
+        """
+        Index a question. Questions must be added in ID order; IDs already indexed are ignored.
+
+        Args:
+            question_id: The ID of the question.
+            print_: Its fingerprint.
+        """
+        if question_id < self._count:
+            return
+        if question_id >= len(self._signatures):
+            grown = np.zeros((max(question_id + 1, 2 * len(self._signatures)), NUM_PERMUTATIONS), dtype=np.uint32)
+            grown[:len(self._signatures)] = self._signatures
+            self._signatures = grown
+
+        self._exact.setdefault(print_.content_hash, question_id)
+        self._signatures[question_id] = print_.signature
+        for band, key in enumerate(self._band_keys(print_.signature)):
+            bucket = self._buckets[band].get(key)
+            if bucket is None:
+                self._buckets[band][key] = question_id
+            elif isinstance(bucket, int):
+                self._buckets[band][key] = [bucket, question_id]
+            else:
+                bucket.append(question_id)
+        self._count = question_id + 1
+
+    @staticmethod
+    def _band_keys(signature: np.ndarray) -> List[bytes]:
+        """Split a signature into its band keys."""
+        raw = signature.tobytes()
+        size = ROWS_PER_BAND * 4
+        return [raw[i:i + size] for i in range(0, len(raw), size)]
+
+
+class DedupRegistry:
+    """
+    The dedup indexes of all quizzes that have duplicate detection turned on.
+
+    Indexes are built from the stored questions the first time a quiz is checked and are
+    kept current through on_questions_added, which is registered as a store listener.
+    Questions appended by other processes sharing the store are picked up the next time
+    the index is requested.
+
+    A duplicate check is only valid until the next write to the quiz, so writers hold the
+    quiz's lock_for lock from the check until the store has appended their rows.
+    """
+
+    def __init__(self, threshold: float = 0.8):
+        """
+        Initialize a new, empty DedupRegistry.
+
+        Args:
+            threshold: The near-duplicate threshold of the indexes.
+        """
+        self.threshold = threshold
+        self._indexes: Dict[int, DedupIndex] = {}
+        self._quiz_locks: Dict[int, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def lock_for(self, quiz_id: int) -> threading.Lock:
+        """
+        Get the lock that serializes duplicate checks and appends for a quiz.
+
+        Args:
+            quiz_id: The quiz ID.
+
+        Returns:
+            The quiz's lock.
+        """
+        with self._lock:
+            return self._quiz_locks.setdefault(quiz_id, threading.Lock())
+
+    def index_for(self, store: QuizStore, quiz_id: int) -> DedupIndex:
+        """
+        Get the index of a quiz, indexing any stored questions it has not seen yet.
+
+        Args:
+            store: The store holding the quiz.
+            quiz_id: The quiz ID.
+
+        Returns:
+            The quiz's index.
+        """
+        info = store.get_quiz_info(quiz_id)
+        with self._lock:
+            index = self._indexes.get(quiz_id)
+            if index is None:
+                index = self._indexes[quiz_id] = DedupIndex(self.threshold)
+            if info is not None and index.count < info.question_count:
+                if index.count == 0:
+                    quiz = store.get_quiz(quiz_id)
+                    missing = list(quiz.questions) if quiz is not None else []
+                else:
+                    missing = [store.get_question(quiz_id, i) for i in range(index.count, info.question_count)]
+                for question in missing:
+                    if question is not None:
+                        index.add(index.count, fingerprint(question.question, question.answers))
+            return index
+
+    def on_questions_added(self, quiz_id: int, first_question_id: int, rows: List[QuestionRow]) -> None:
+        """
+        Index appended questions of quizzes that have an index.
+
+        The signature matches QuizStore listeners. Questions the index already holds are
+        skipped, and rows after a gap are left to index_for, which reads them from the store.
+
+        Args:
+            quiz_id: The quiz ID.
+            first_question_id: The ID of the first question in rows.
+            rows: The appended questions.
+        """
+        with self._lock:
+            index = self._indexes.get(quiz_id)
+            if index is None or first_question_id > index.count:
+                return
+            for question, answers, _ in rows[index.count - first_question_id:]:
+                index.add(index.count, fingerprint(question, answers))
+
+    def clear(self) -> None:
+        """Drop all indexes."""
+        with self._lock:
+            self._indexes.clear()
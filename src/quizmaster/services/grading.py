@@ -0,0 +1,142 @@
+"""
+Grading module.
+
+This module grades whole answer sheets against a quiz. All sheets of a batch are
+graded at once by comparing a matrix of submitted answers with the quiz's answer-key
+vector in NumPy.
+"""
+
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from quizmaster.models.quiz import Quiz
+
+
+# Marker for a question left unanswered on a sheet
+UNANSWERED = -1
+
+
+class GradingResult:
+    """
+    The result of grading a batch of answer sheets.
+
+    Attributes:
+        correct (np.ndarray): A boolean matrix with one row per sheet and one column per question.
+        scores (np.ndarray): The number of correct answers on each sheet.
+        answered (np.ndarray): The number of answered questions on each sheet.
+        question_correct_counts (np.ndarray): For each question, the number of sheets that got it right.
+        answers (np.ndarray): The submitted answer matrix, UNANSWERED where a question was left blank.
+        answer_counts (np.ndarray): The number of answers of each question.
+    """
+
+    def __init__(self, correct: np.ndarray, answered: np.ndarray, answers: np.ndarray, answer_counts: np.ndarray):
+        """
+        Initialize a new GradingResult.
+
+        Args:
+            correct: The per-question correctness matrix.
+            answered: The number of answered questions on each sheet.
+            answers: The submitted answer matrix.
+            answer_counts: The number of answers of each question.
+        """
+        self.correct = correct
+        self.answers = answers
+        self.answer_counts = answer_counts
+        self.scores = correct.sum(axis=1)
+        self.answered = answered
+        self.question_correct_counts = correct.sum(axis=0)
+
+    @property
+    def question_count(self) -> int:
+        """The number of questions graded on each sheet."""
+        return self.correct.shape[1]
+
+    def __len__(self) -> int:
+        """Return the number of sheets."""
+        return self.correct.shape[0]
+
+
+def answer_key_vector(quiz: Quiz) -> np.ndarray:
+    """
+    Get the correct answer index of every question as a vector.
+
+    The keys are copied so the quiz's array can keep growing while the vector is in use.
+
+    Args:
+        quiz: The quiz.
+
+    Returns:
+        An int16 vector with one entry per question.
+    """
+    return np.frombuffer(quiz.answer_keys.tobytes(), dtype=np.uint8).astype(np.int16)
+
+
+def answer_count_vector(quiz: Quiz) -> np.ndarray:
+    """
+    Get the number of answers of every question as a vector.
+
+    Args:
+        quiz: The quiz.
+
+    Returns:
+        An int16 vector with one entry per question.
+    """
+    offsets = np.frombuffer(quiz.answer_offsets.tobytes(), dtype=np.uint32)
+    return np.diff(offsets).astype(np.int16)
+
+
+def sheets_to_matrix(sheets: Sequence[Sequence[Optional[int]]], question_count: int) -> np.ndarray:
+    """
+    Build the matrix of submitted answers.
+
+    Missing answers (None, or sheets shorter than the quiz) become UNANSWERED.
+
+    Args:
+        sheets: One list of answer indices per sheet.
+        question_count: The number of questions in the quiz.
+
+    Returns:
+        An int16 matrix with one row per sheet and one column per question.
+
+    Raises:
+        ValueError: If a sheet has more answers than the quiz has questions.
+    """
+    matrix = np.full((len(sheets), question_count), UNANSWERED, dtype=np.int16)
+    for row, sheet in enumerate(sheets):
+        if len(sheet) > question_count:
+            raise ValueError(f"Sheet {row} has {len(sheet)} answers but the quiz has {question_count} questions")
+        if sheet:
+            matrix[row, :len(sheet)] = [UNANSWERED if answer is None else answer for answer in sheet]
+    return matrix
+
+
+def grade_sheets(quiz: Quiz, sheets: Sequence[Sequence[Optional[int]]]) -> GradingResult:
+    """
+    Grade a batch of answer sheets against a quiz.
+
+    Args:
+        quiz: The quiz.
+        sheets: One list of answer indices per sheet, in question order.
+
+    Returns:
+        The per-question correctness and totals of every sheet.
+
+    Raises:
+        ValueError: If a sheet is too long or contains an answer index that is out of range.
+    """
+    question_count = quiz.get_question_count()
+    try:
+        matrix = sheets_to_matrix(sheets, question_count)
+    except OverflowError:
+        raise ValueError("Invalid answer index")
+
+    counts = answer_count_vector(quiz)
+    invalid = (matrix < UNANSWERED) | (matrix >= counts)
+    if invalid.any():
+        sheet, question = (int(i) for i in np.argwhere(invalid)[0])
+        raise ValueError(f"Invalid answer index on sheet {sheet} for question {question}")
+
+    correct = matrix == answer_key_vector(quiz)
+    answered = (matrix != UNANSWERED).sum(axis=1)
+    return GradingResult(correct, answered, matrix, counts)
@@ -0,0 +1,483 @@
+"""
+Item response theory module.
+
+This module implements adaptive testing under the two-parameter logistic (2PL) model,
+where a learner with ability theta answers question i correctly with probability
+
+    P_i(theta) = 1 / (1 + exp(-a_i * (theta - b_i)))
+
+with discrimination a_i and difficulty b_i.
+
+- ResponseLog collects (learner, question, correct) triples from graded sheets and
+  finished sessions in compact columns.
+- calibrate estimates a and b for every question from a log by marginal maximum
+  likelihood (EM over a fixed ability grid), vectorized with NumPy over all responses.
+- ItemBank holds calibrated parameters with tables precomputed on the ability grid,
+  so updating a learner's ability after an answer is a single vector addition and
+  picking the most informative next question rarely looks past the first few
+  candidates of a presorted list.
+"""
+
+import math
+import threading
+from array import array
+from typing import Callable, Dict, Iterable, Mapping, Optional, Set, Tuple
+
+import numpy as np
+
+# Ability grid for estimation; abilities are on a standard normal scale
+GRID = np.linspace(-4.0, 4.0, 41)
+GRID_STEP = GRID[1] - GRID[0]
+
+# Standard normal prior over the grid, as unnormalized log densities
+LOG_PRIOR = -0.5 * GRID ** 2
+
+# Coarser grid for calibration, where every node costs a pass over all responses
+QUADRATURE = np.linspace(-4.0, 4.0, 21)
+QUADRATURE_LOG_PRIOR = -0.5 * QUADRATURE ** 2
+
+# Bounds that keep item parameters finite for questions everyone (or no one) gets right
+MIN_DISCRIMINATION, MAX_DISCRIMINATION = 0.05, 5.0
+MIN_DIFFICULTY, MAX_DIFFICULTY = -5.0, 5.0
+
+# Priors used in calibration: discrimination ~ N(1, 1), intercept ~ N(0, 3^2)
+DISCRIMINATION_PRIOR_VARIANCE = 1.0
+INTERCEPT_PRIOR_VARIANCE = 9.0
+
+
+def logistic(x: np.ndarray) -> np.ndarray:
+    """Compute the logistic function without overflow warnings."""
+    return 0.5 * (1.0 + np.tanh(0.5 * x))
+
+
+class ResponseLog:
+    """
+    The scored responses to the questions of one quiz.
+
+    Responses are kept in three parallel arrays (learner, question, correct) that grow
+    in place, so millions of responses take a few bytes each. Only the newest
+    max_responses are kept, so the log of a busy quiz does not grow without bound.
+
+    Attributes:
+        persons (int): The number of learners logged.
+        max_responses (int): The most responses kept.
+    """
+
+    def __init__(self, max_responses: int = 500_000):
+        """
+        Initialize an empty log.
+
+        Args:
+            max_responses: The most responses kept. When the log outgrows it, the oldest
+                responses are dropped down to three quarters of it, so the arrays are
+                shifted once per quarter of the limit rather than on every addition.
+        """
+        self.persons = 0
+        self.max_responses = max_responses
+        self._person_ids = array("I")
+        self._question_ids = array("I")
+        self._correct = array("B")
+        self._lock = threading.Lock()
+
+    def add_person(self, question_ids: Iterable[int], correct: Iterable[bool]) -> None:
+        """
+        Log the responses of one learner.
+
+        Args:
+            question_ids: The questions the learner answered.
+            correct: Whether each answer was correct.
+        """
+        question_ids = array("I", question_ids)
+        correct = array("B", correct)
+        with self._lock:
+            person = self.persons
+            self.persons += 1
+            self._person_ids.extend([person] * len(question_ids))
+            self._question_ids.extend(question_ids)
+            self._correct.extend(correct)
+            self._trim()
+
+    def add_sheets(self, correct: np.ndarray, answered: np.ndarray) -> None:
+        """
+        Log graded answer sheets, one learner per sheet; blank answers are skipped.
+
+        Args:
+            correct: A boolean matrix with one row per sheet and one column per question.
+            answered: A boolean matrix marking the answered questions.
+        """
+        rows, columns = np.nonzero(answered)
+        with self._lock:
+            self._person_ids.frombytes((rows + self.persons).astype(np.uint32).tobytes())
+            self._question_ids.frombytes(columns.astype(np.uint32).tobytes())
+            self._correct.frombytes(correct[rows, columns].astype(np.uint8).tobytes())
+            self.persons += correct.shape[0]
+            self._trim()
+
+    def _trim(self) -> None:
+        """Drop the oldest responses once the log outgrows its limit; called with the lock held."""
+        excess = len(self._correct) - self.max_responses
+        if excess > 0:
+            drop = excess + self.max_responses // 4
+            del self._person_ids[:drop]
+            del self._question_ids[:drop]
+            del self._correct[:drop]
+
+    def arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get a snapshot of the log.
+
+        Returns:
+            The learner, question and correctness of every response.
+        """
+        with self._lock:
+            return (
+                np.frombuffer(self._person_ids.tobytes(), dtype=np.uint32).astype(np.intp),
+                np.frombuffer(self._question_ids.tobytes(), dtype=np.uint32).astype(np.intp),
+                np.frombuffer(self._correct.tobytes(), dtype=np.uint8).astype(bool),
+            )
+
+    def __len__(self) -> int:
+        """Return the number of responses."""
+        return len(self._correct)
+
+
+class AdaptiveState:
+    """
+    A learner's ability estimate during an adaptive test.
+
+    Attributes:
+        log_posterior (np.ndarray): The log posterior of the ability over GRID.
+        administered (Set[int]): The questions asked so far.
+        max_questions (int): The most questions to ask.
+    """
+
+    __slots__ = ("log_posterior", "administered", "max_questions")
+
+    def __init__(self, max_questions: int):
+        """
+        Initialize a new AdaptiveState at the prior.
+
+        Args:
+            max_questions: The most questions to ask.
+        """
+        self.log_posterior = LOG_PRIOR.copy()
+        self.administered: Set[int] = set()
+        self.max_questions = max_questions
+
+    def estimate(self) -> Tuple[float, float]:
+        """
+        Get the expected a posteriori ability and its standard error.
+
+        Returns:
+            The ability and its standard error.
+        """
+        weights = np.exp(self.log_posterior - self.log_posterior.max())
+        weights /= weights.sum()
+        theta = float(weights @ GRID)
+        return theta, math.sqrt(float(weights @ (GRID - theta) ** 2))
+
+    @property
+    def finished(self) -> bool:
+        """Whether the test has asked its maximum number of questions."""
+        return len(self.administered) >= self.max_questions
+
+
+class ItemBank:
+    """
+    Calibrated 2PL parameters of the questions of a quiz.
+
+    Attributes:
+        discrimination (np.ndarray): a for every question.
+        difficulty (np.ndarray): b for every question.
+    """
+
+    def __init__(self, discrimination: np.ndarray, difficulty: np.ndarray):
+        """
+        Initialize a new ItemBank and precompute its grid tables.
+
+        Args:
+            discrimination: a for every question.
+            difficulty: b for every question.
+        """
+        self.discrimination = np.asarray(discrimination, dtype=float)
+        self.difficulty = np.asarray(difficulty, dtype=float)
+        self._log_p, self._log_q, self._order, self._ranked = self._tables(self.discrimination, self.difficulty)
+
+    @staticmethod
+    def _tables(
+        discrimination: np.ndarray, difficulty: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Compute the grid tables of questions.
+
+        Returns:
+            The log probabilities of a correct and of a wrong answer (one row per question),
+            and for every grid point the questions ordered from most to least informative
+            with their negated information (one row per grid point).
+        """
+        p = logistic(discrimination[:, None] * (GRID[None, :] - difficulty[:, None]))
+        p = np.clip(p, 1e-12, 1 - 1e-12)
+        negated_information = -(discrimination[:, None] ** 2 * p * (1 - p)).T
+        order = np.argsort(negated_information, axis=1, kind="stable")
+        ranked = np.take_along_axis(negated_information, order, axis=1)
+        return np.log(p), np.log1p(-p), order.astype(np.int32), ranked
+
+    def extend(self, discrimination: np.ndarray, difficulty: np.ndarray) -> "ItemBank":
+        """
+        Get a bank with more questions appended, reusing this bank's tables.
+
+        Only the new questions' tables are computed, and they are merged into the
+        presorted lists, so growing a bank by a few questions copies its tables instead
+        of sorting them again. The result is the same as building the bank from scratch.
+
+        Args:
+            discrimination: a for every new question.
+            difficulty: b for every new question.
+
+        Returns:
+            The extended bank; this one is unchanged.
+        """
+        discrimination = np.asarray(discrimination, dtype=float)
+        difficulty = np.asarray(difficulty, dtype=float)
+        log_p, log_q, order, ranked = self._tables(discrimination, difficulty)
+        count = len(self)
+
+        bank = ItemBank.__new__(ItemBank)
+        bank.discrimination = np.concatenate([self.discrimination, discrimination])
+        bank.difficulty = np.concatenate([self.difficulty, difficulty])
+        bank._log_p = np.concatenate([self._log_p, log_p])
+        bank._log_q = np.concatenate([self._log_q, log_q])
+        bank._order = np.empty((len(GRID), len(bank)), dtype=np.int32)
+        bank._ranked = np.empty((len(GRID), len(bank)))
+        for column in range(len(GRID)):
+            # New questions go after existing ones with the same information, as in a stable sort
+            positions = np.searchsorted(self._ranked[column], ranked[column], side="right")
+            bank._order[column] = np.insert(self._order[column], positions, order[column] + count)
+            bank._ranked[column] = np.insert(self._ranked[column], positions, ranked[column])
+        return bank
+
+    def __len__(self) -> int:
+        """Return the number of questions."""
+        return len(self.difficulty)
+
+    def update(self, state: AdaptiveState, question_id: int, is_correct: bool) -> None:
+        """
+        Update an ability estimate with an answer.
+
+        Args:
+            state: The learner's state.
+            question_id: The question answered.
+            is_correct: Whether the answer was correct.
+        """
+        state.administered.add(question_id)
+        if question_id < len(self):
+            state.log_posterior += (self._log_p if is_correct else self._log_q)[question_id]
+
+    def select(self, state: AdaptiveState) -> Optional[int]:
+        """
+        Pick the question with the most information at the current ability estimate.
+
+        Args:
+            state: The learner's state.
+
+        Returns:
+            The question ID, or None if the test is finished or every question was asked.
+        """
+        if state.finished:
+            return None
+        theta, _ = state.estimate()
+        column = min(max(int(round((theta - GRID[0]) / GRID_STEP)), 0), len(GRID) - 1)
+        administered = state.administered
+        for question_id in self._order[column]:
+            question_id = int(question_id)
+            if question_id not in administered:
+                return question_id
+        return None
+
+
+def calibrate(
+    person_ids: np.ndarray, question_ids: np.ndarray, correct: np.ndarray, question_count: int,
+    max_iterations: int = 50, tolerance: float = 1e-3
+) -> Tuple[ItemBank, int]:
+    """
+    Estimate 2PL parameters from scored responses by marginal maximum likelihood.
+
+    Each EM iteration computes every learner's posterior over the quadrature grid from
+    all of their responses, turns it into expected correct and total counts per
+    question and grid point, and takes Newton steps on each question's parameters.
+    Every step is vectorized over responses or questions.
+
+    Args:
+        person_ids: The learner of each response.
+        question_ids: The question of each response.
+        correct: Whether each response was correct.
+        question_count: The number of questions; questions without responses keep a=1, b=0.
+        max_iterations: The most EM iterations.
+        tolerance: Stop when no parameter changes by more than this.
+
+    Returns:
+        The calibrated item bank and the number of iterations run.
+
+    Raises:
+        ValueError: If there are no responses.
+    """
+    if len(correct) == 0:
+        raise ValueError("No responses to calibrate from")
+
+    _, person_ids = np.unique(person_ids, return_inverse=True)
+    person_count = int(person_ids.max()) + 1
+    correct = correct.astype(bool)
+    # The correct responses alone, for the sums that only count those
+    right_persons = person_ids[correct]
+    right_questions = question_ids[correct]
+
+    # Start from a = 1 and difficulties from the observed correct rates
+    totals = np.bincount(question_ids, minlength=question_count).astype(float)
+    rights = np.bincount(right_questions, minlength=question_count).astype(float)
+    rate = (rights + 0.5) / (totals + 1.0)
+    a = np.ones(question_count)
+    c = np.log(rate / (1 - rate))  # the intercept, c = -a * b
+
+    nodes = QUADRATURE
+    iterations = 0
+    for iterations in range(1, max_iterations + 1):
+        # E-step: each learner's log likelihood at every node. A response contributes
+        # log(1 - P) plus, if correct, the logit a * theta + c, so only the log(1 - P)
+        # part needs a pass per node; the logit part is two sums over correct answers.
+        log_q = -np.logaddexp(0.0, nodes[:, None] * a[None, :] + c[None, :])  # nodes x questions
+        log_posterior = np.empty((len(nodes), person_count))
+        for q in range(len(nodes)):
+            log_posterior[q] = np.bincount(person_ids, weights=log_q[q][question_ids], minlength=person_count)
+        right_a = np.bincount(right_persons, weights=a[right_questions], minlength=person_count)
+        right_c = np.bincount(right_persons, weights=c[right_questions], minlength=person_count)
+        log_posterior += nodes[:, None] * right_a[None, :] + right_c[None, :] + QUADRATURE_LOG_PRIOR[:, None]
+        log_posterior -= log_posterior.max(axis=0, keepdims=True)
+        posterior = np.exp(log_posterior)
+        posterior /= posterior.sum(axis=0, keepdims=True)
+
+        # Expected responses (n) and correct responses (r) per question and node
+        n = np.empty((question_count, len(nodes)))
+        r = np.empty((question_count, len(nodes)))
+        for q in range(len(nodes)):
+            n[:, q] = np.bincount(question_ids, weights=posterior[q][person_ids], minlength=question_count)
+            r[:, q] = np.bincount(right_questions, weights=posterior[q][right_persons], minlength=question_count)
+
+        # M-step: Newton steps on (a, c) for all questions at once
+        old_a, old_c = a.copy(), c.copy()
+        for _ in range(3):
+            p = logistic(a[:, None] * nodes[None, :] + c[:, None])
+            residual = r - n * p
+            w = n * p * (1 - p)
+            g_a = residual @ nodes - (a - 1.0) / DISCRIMINATION_PRIOR_VARIANCE
+            g_c = residual.sum(axis=1) - c / INTERCEPT_PRIOR_VARIANCE
+            h_aa = -(w @ nodes ** 2) - 1.0 / DISCRIMINATION_PRIOR_VARIANCE
+            h_ac = -(w @ nodes)
+            h_cc = -w.sum(axis=1) - 1.0 / INTERCEPT_PRIOR_VARIANCE
+            det = h_aa * h_cc - h_ac ** 2
+            a = np.clip(a - (h_cc * g_a - h_ac * g_c) / det, MIN_DISCRIMINATION, MAX_DISCRIMINATION)
+            c = c - (h_aa * g_c - h_ac * g_a) / det
+            c = np.clip(c, -a * MAX_DIFFICULTY, -a * MIN_DIFFICULTY)
+
+        if max(np.abs(a - old_a).max(), np.abs(c - old_c).max()) < tolerance:
+            break
+
+    return ItemBank(a, -c / a), iterations
+
+
+class ItemBanks:
+    """
+    The response logs and item banks of all quizzes.
+
+    A quiz uses its calibrated bank once it has one. Questions without calibrated
+    parameters get provisional ones, a = 1 and a difficulty from their observed correct
+    rate when they are first needed. The bank is extended with ItemBank.extend as the
+    quiz grows and kept until the quiz is calibrated again.
+    """
+
+    def __init__(self, max_responses: int = 500_000):
+        """
+        Initialize empty registries.
+
+        Args:
+            max_responses: The most responses kept in each quiz's log.
+        """
+        self.max_responses = max_responses
+        self._logs: Dict[int, ResponseLog] = {}
+        self._calibrated: Dict[int, ItemBank] = {}
+        self._provisional: Dict[int, ItemBank] = {}
+        self._lock = threading.Lock()
+
+    def log(self, quiz_id: int) -> ResponseLog:
+        """Get the response log of a quiz, creating it if needed."""
+        with self._lock:
+            response_log = self._logs.get(quiz_id)
+            if response_log is None:
+                response_log = self._logs[quiz_id] = ResponseLog(self.max_responses)
+            return response_log
+
+    def calibrate(self, quiz_id: int, question_count: int) -> Tuple[ItemBank, int, int, int]:
+        """
+        Calibrate a quiz from its response log and keep the result.
+
+        Args:
+            quiz_id: The quiz ID.
+            question_count: The number of questions of the quiz.
+
+        Returns:
+            The item bank, the number of iterations, responses and learners used.
+
+        Raises:
+            ValueError: If the quiz has no logged responses.
+        """
+        response_log = self.log(quiz_id)
+        person_ids, question_ids, correct = response_log.arrays()
+        bank, iterations = calibrate(person_ids, question_ids, correct, question_count)
+        with self._lock:
+            self._calibrated[quiz_id] = bank
+            self._provisional.pop(quiz_id, None)
+        return bank, iterations, len(correct), len(np.unique(person_ids))
+
+    def bank(self, quiz_id: int, question_count: int, correct_rates: Callable[[], Mapping[int, float]]) -> ItemBank:
+        """
+        Get the item bank to run an adaptive test with.
+
+        Questions added since the last calibration get provisional parameters until
+        the next one. They are appended to the bank in use, whose tables are reused.
+
+        Args:
+            quiz_id: The quiz ID.
+            question_count: The number of questions of the quiz.
+            correct_rates: Returns the observed correct rates by question; only called
+                when provisional parameters are needed.
+
+        Returns:
+            The calibrated bank, extended or replaced by provisional parameters as needed.
+        """
+        with self._lock:
+            calibrated = self._calibrated.get(quiz_id)
+            # A provisional bank is dropped on calibration, so one that exists is newer
+            bank = self._provisional.get(quiz_id, calibrated)
+        if bank is not None and len(bank) >= question_count:
+            return bank
+
+        known = len(bank) if bank is not None else 0
+        rates = np.full(question_count - known, 0.5)
+        for question_id, rate in correct_rates().items():
+            if known <= question_id < question_count:
+                rates[question_id - known] = rate
+        rates = np.clip(rates, 0.02, 0.98)
+        discrimination = np.ones(question_count - known)
+        difficulty = -np.log(rates / (1 - rates))
+        bank = bank.extend(discrimination, difficulty) if bank is not None else ItemBank(discrimination, difficulty)
+        with self._lock:
+            # Keep the bank unless a calibration finished in the meantime
+            if self._calibrated.get(quiz_id) is calibrated:
+                self._provisional[quiz_id] = bank
+        return bank
+
+    def clear(self) -> None:
+        """Drop all logs and banks."""
+        with self._lock:
+            self._logs.clear()
+            self._calibrated.clear()
+            self._provisional.clear()
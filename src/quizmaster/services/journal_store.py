@@ -0,0 +1,620 @@
+"""
+Journal quiz store module.
+
+This module defines JournalQuizStore, a MemoryQuizStore that survives restarts: every
+mutation is appended to a binary write-ahead journal before it is acknowledged, and
+the quizzes are rebuilt from disk when the store is opened.
+
+- Appends from concurrent requests are written and fsynced together by one writer
+  thread (group commit), so durability costs one fsync per group, not per request.
+- A background thread periodically writes a snapshot of all quizzes and starts a new
+  journal, so opening the store replays the snapshot and only the journal tail written
+  since, however long the store has been in use.
+
+The directory holds files named by generation: snapshot-G holds every quiz as of the
+start of journal-G, and journal-G every mutation after it. Both use the same record
+format, so recovery is "replay the newest snapshot, then every journal from its
+generation on".
+
+Mounted quiz banks are recorded by path, not content, so a bank keeps its quiz ID
+across restarts and is remapped when the store is opened.
+"""
+
+import os
+import secrets
+import struct
+import sys
+import threading
+import zlib
+from array import array
+from itertools import accumulate
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from quizmaster.models.quiz import Quiz
+from quizmaster.models.quiz_bank import QuizBank, open_quiz_bank
+from quizmaster.services.quiz_store import MemoryQuizStore, QuestionRow
+
+# Every file starts with the magic number and the store's epoch
+MAGIC = b"QMJ1"
+EPOCH_BYTES = 8
+HEADER_SIZE = len(MAGIC) + EPOCH_BYTES
+
+# Record frame: payload length and CRC-32 of the payload
+FRAME = struct.Struct("<II")
+
+# Record payloads start with an opcode
+OP_QUIZ = 1  # quiz_id, title, description, dedup_policy
+OP_QUESTIONS = 2  # quiz_id, first_question_id, row count, rows
+OP_MOUNT = 3  # quiz_id, path of a quiz bank file
+
+QUIZ_HEADER = struct.Struct("<BI")
+QUESTIONS_HEADER = struct.Struct("<BIII")
+LENGTH = struct.Struct("<I")
+
+# Questions per record when writing a snapshot
+SNAPSHOT_CHUNK = 4096
+
+SNAPSHOT_PREFIX = "snapshot-"
+JOURNAL_PREFIX = "journal-"
+
+
+def _pack_string(parts: List[bytes], text: str) -> None:
+    """Append a length-prefixed UTF-8 string to a record being built."""
+    data = text.encode("utf-8")
+    parts.append(LENGTH.pack(len(data)))
+    parts.append(data)
+
+
+def _frame(payload: bytes) -> bytes:
+    """Wrap a payload in a record frame."""
+    return FRAME.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+def encode_quiz(quiz_id: int, quiz: Quiz) -> bytes:
+    """
+    Encode the creation of a quiz, without its questions.
+
+    Args:
+        quiz_id: The quiz ID.
+        quiz: The quiz.
+
+    Returns:
+        The framed record.
+    """
+    parts = [QUIZ_HEADER.pack(OP_QUIZ, quiz_id)]
+    _pack_string(parts, quiz.title)
+    _pack_string(parts, quiz.description)
+    _pack_string(parts, quiz.dedup_policy)
+    return _frame(b"".join(parts))
+
+
+def encode_questions(quiz_id: int, first_question_id: int, rows: List[QuestionRow]) -> bytes:
+    """
+    Encode questions appended to a quiz.
+
+    The payload is laid out column-wise so it decodes with one UTF-8 decode and a
+    few slices: the answer count and key of every row, the length in characters of
+    every string (each question text followed by its answers), then all strings
+    concatenated.
+
+    Args:
+        quiz_id: The quiz ID.
+        first_question_id: The ID of the first row.
+        rows: The appended questions, already validated.
+
+    Returns:
+        The framed record.
+    """
+    strings: List[str] = []
+    for text, answers, _ in rows:
+        strings.append(text)
+        strings.extend(answers)
+    lengths = array("I", map(len, strings))
+    if sys.byteorder == "big":
+        lengths.byteswap()
+    return _frame(b"".join((
+        QUESTIONS_HEADER.pack(OP_QUESTIONS, quiz_id, first_question_id, len(rows)),
+        bytes(len(answers) for _, answers, _ in rows),
+        bytes(correct_answer_index for _, _, correct_answer_index in rows),
+        lengths.tobytes(),
+        "".join(strings).encode("utf-8"),
+    )))
+
+
+def encode_mount(quiz_id: int, path: str) -> bytes:
+    """
+    Encode the mounting of a quiz bank; the bank itself stays in its own file.
+
+    Args:
+        quiz_id: The quiz ID of the bank.
+        path: The absolute path of the bank file.
+
+    Returns:
+        The framed record.
+    """
+    parts = [QUIZ_HEADER.pack(OP_MOUNT, quiz_id)]
+    _pack_string(parts, path)
+    return _frame(b"".join(parts))
+
+
+def iter_records(data: bytes, offset: int = HEADER_SIZE) -> Iterator[Tuple[int, bytes]]:
+    """
+    Iterate over the intact records of a file.
+
+    Iteration stops at the first record that is cut short or fails its checksum,
+    which is where a crash interrupted the last write.
+
+    Args:
+        data: The file contents.
+        offset: Where the first record starts.
+
+    Yields:
+        The offset just past each record and its payload.
+    """
+    end = len(data)
+    while offset + FRAME.size <= end:
+        length, checksum = FRAME.unpack_from(data, offset)
+        start = offset + FRAME.size
+        if start + length > end:
+            return
+        payload = data[start:start + length]
+        if zlib.crc32(payload) != checksum:
+            return
+        offset = start + length
+        yield offset, payload
+
+
+def _unpack_string(payload: bytes, offset: int) -> Tuple[str, int]:
+    """Read a length-prefixed UTF-8 string; return it and the offset after it."""
+    (length,) = LENGTH.unpack_from(payload, offset)
+    offset += LENGTH.size
+    return payload[offset:offset + length].decode("utf-8"), offset + length
+
+
+def decode_questions(payload: bytes) -> Tuple[int, int, List[QuestionRow]]:
+    """
+    Decode an OP_QUESTIONS payload.
+
+    Returns:
+        The quiz ID, the ID of the first question and the rows.
+    """
+    _, quiz_id, first_question_id, count = QUESTIONS_HEADER.unpack_from(payload)
+    offset = QUESTIONS_HEADER.size
+    answer_counts = payload[offset:offset + count]
+    keys = payload[offset + count:offset + 2 * count]
+    offset += 2 * count
+    string_count = count + sum(answer_counts)
+    lengths = array("I")
+    lengths.frombytes(payload[offset:offset + 4 * string_count])
+    if sys.byteorder == "big":
+        lengths.byteswap()
+    text = payload[offset + 4 * string_count:].decode("utf-8")
+
+    bounds = list(accumulate(lengths, initial=0))
+    strings = [text[bounds[i]:bounds[i + 1]] for i in range(string_count)]
+    rows: List[QuestionRow] = []
+    position = 0
+    for answer_count, key in zip(answer_counts, keys):
+        rows.append((strings[position], strings[position + 1:position + 1 + answer_count], key))
+        position += 1 + answer_count
+    return quiz_id, first_question_id, rows
+
+
+def _fsync_directory(path: str) -> None:
+    """Make renames and deletions in a directory durable, where the platform allows it."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class JournalWriter:
+    """
+    Appends records to a file from many threads with group commit.
+
+    Callers queue records and wait for their sequence number to become durable. A
+    single writer thread takes everything queued so far, writes it in one call and
+    fsyncs once, so N concurrent appends cost one fsync instead of N.
+
+    Attributes:
+        records (int): The number of records written.
+        groups (int): The number of write-and-fsync rounds.
+        bytes_written (int): The bytes written to the current file.
+    """
+
+    def __init__(self, file, sync: bool = True):
+        """
+        Initialize a new JournalWriter and start its thread.
+
+        Args:
+            file: A binary file opened for appending.
+            sync: Whether to fsync after every group; without it, records reach the OS
+                but may be lost if the machine crashes.
+        """
+        self.records = 0
+        self.groups = 0
+        self.bytes_written = 0
+        self._file = file
+        self._sync = sync
+        self._pending: List[bytes] = []
+        self._queued = 0
+        self._durable = 0
+        self._error: Optional[BaseException] = None
+        self._closing = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="journal-writer", daemon=True)
+        self._thread.start()
+
+    def append(self, record: bytes) -> int:
+        """
+        Queue a record.
+
+        Args:
+            record: The framed record.
+
+        Returns:
+            The sequence number to pass to wait.
+
+        Raises:
+            OSError: If an earlier write failed.
+        """
+        with self._condition:
+            if self._error is not None:
+                raise OSError("The journal can no longer be written") from self._error
+            self._pending.append(record)
+            self._queued += 1
+            self._condition.notify_all()
+            return self._queued
+
+    def wait(self, sequence: int) -> None:
+        """
+        Wait until a record is durable.
+
+        Args:
+            sequence: The sequence number returned by append.
+
+        Raises:
+            OSError: If the record could not be written.
+        """
+        with self._condition:
+            while self._durable < sequence and self._error is None:
+                self._condition.wait()
+            if self._durable < sequence:
+                raise OSError("The journal could not be written") from self._error
+
+    def flush(self) -> None:
+        """Wait until every queued record is durable."""
+        with self._condition:
+            sequence = self._queued
+        self.wait(sequence)
+
+    def swap(self, file):
+        """
+        Flush and continue in another file.
+
+        The caller must stop other threads from appending while swapping.
+
+        Args:
+            file: The new file, opened for appending.
+
+        Returns:
+            The previous file, not closed.
+        """
+        self.flush()
+        with self._condition:
+            previous, self._file = self._file, file
+            self.bytes_written = 0
+        return previous
+
+    def close(self) -> None:
+        """Flush, stop the writer thread and close the file."""
+        with self._condition:
+            self._closing = True
+            self._condition.notify_all()
+        self._thread.join()
+        self._file.close()
+
+    def _run(self) -> None:
+        """Write queued records in groups until closed."""
+        while True:
+            with self._condition:
+                while not self._pending and not self._closing:
+                    self._condition.wait()
+                if not self._pending:
+                    return
+                batch, self._pending = self._pending, []
+                sequence = self._queued
+                file = self._file
+
+            data = b"".join(batch)
+            try:
+                file.write(data)
+                file.flush()
+                if self._sync:
+                    os.fsync(file.fileno())
+            except BaseException as e:
+                with self._condition:
+                    self._error = e
+                    self._condition.notify_all()
+                return
+
+            with self._condition:
+                self.records += len(batch)
+                self.groups += 1
+                self.bytes_written += len(data)
+                self._durable = sequence
+                self._condition.notify_all()
+
+
+class JournalQuizStore(MemoryQuizStore):
+    """
+    An in-memory store made durable with a write-ahead journal and snapshots.
+
+    Reads are served from memory exactly like MemoryQuizStore. A mutation is visible to
+    readers as soon as it is applied, and acknowledged once its journal record is
+    durable. The directory belongs to one process; use the SQLite store to share
+    quizzes between workers.
+
+    Attributes:
+        directory (str): The directory holding the snapshot and journal files.
+        generation (int): The generation of the current journal.
+        recovered_records (int): The records replayed from journals when the store was opened.
+        writer (JournalWriter): Appends to the current journal; its counters show how
+            well commits are grouped.
+    """
+
+    def __init__(
+        self, directory: str, sync: bool = True, compact_interval: float = 60.0, compact_min_bytes: int = 1 << 20
+    ):
+        """
+        Open a store, recovering its quizzes from the directory.
+
+        Args:
+            directory: The directory for the store's files; created if missing.
+            sync: Whether to fsync the journal before acknowledging a mutation.
+            compact_interval: Seconds between checks for compaction; 0 disables the
+                background thread (compact can still be called directly).
+            compact_min_bytes: The journal size that triggers a compaction.
+        """
+        super().__init__()
+        self.directory = directory
+        self.generation = 0
+        self.recovered_records = 0
+        # Banks named by the journal whose files are gone, kept so their IDs stay taken
+        self._missing_banks: Dict[int, str] = {}
+        self._compact_lock = threading.Lock()
+        self._compact_min_bytes = compact_min_bytes
+        os.makedirs(directory, exist_ok=True)
+
+        self._recover()
+        self.writer = JournalWriter(self._open_journal(self.generation), sync=sync)
+
+        self._stopped = threading.Event()
+        self._compactor: Optional[threading.Thread] = None
+        if compact_interval > 0:
+            self._compactor = threading.Thread(
+                target=self._compact_periodically, args=(compact_interval,), name="journal-compactor", daemon=True
+            )
+            self._compactor.start()
+
+    @property
+    def journal_bytes(self) -> int:
+        """The bytes appended to the current journal since it was opened."""
+        return self.writer.bytes_written
+
+    def add_quiz(self, quiz: Quiz) -> int:
+        """Store a quiz and return its ID once it is journaled."""
+        rows = [(q.question, q.answers, q.correct_answer_index) for q in quiz.questions]
+        with self._lock:
+            quiz_id = self._next_id
+            self._next_id += 1
+            self._quizzes[quiz_id] = quiz
+            self._record_change(quiz_id)
+            record = encode_quiz(quiz_id, quiz)
+            if rows:
+                record += encode_questions(quiz_id, 0, rows)
+            sequence = self.writer.append(record)
+        self.writer.wait(sequence)
+        self._notify(quiz_id, 0, rows)
+        return quiz_id
+
+    def add_questions(self, quiz_id: int, rows: Iterable[QuestionRow]) -> List[Optional[str]]:
+        """Append questions to a quiz and return the per-row errors once they are journaled."""
+        errors: List[Optional[str]] = []
+        added: List[QuestionRow] = []
+        sequence = 0
+        with self._lock:
+            quiz = self._quizzes[quiz_id]
+            first_question_id = quiz.get_question_count()
+            for row in rows:
+                try:
+                    quiz.add_question(*row)
+                except ValueError as e:
+                    errors.append(str(e))
+                else:
+                    errors.append(None)
+                    added.append(row)
+            if added:
+                self._record_change(quiz_id)
+                sequence = self.writer.append(encode_questions(quiz_id, first_question_id, added))
+        if added:
+            self.writer.wait(sequence)
+        self._notify(quiz_id, first_question_id, added)
+        return errors
+
+    def mount_bank(self, path: str) -> int:
+        """Mount a quiz bank and journal its path, so it is mounted again under the same ID on restart."""
+        quiz_id = super().mount_bank(path)
+        self.writer.flush()
+        return quiz_id
+
+    def _bank_mounted(self, quiz_id: int, bank: QuizBank) -> None:
+        """Journal a new mount; called with the lock held."""
+        self.writer.append(encode_mount(quiz_id, bank.path))
+
+    def compact(self) -> None:
+        """
+        Write a snapshot of every quiz and drop the journal it replaces.
+
+        Mutations are blocked only while the journal is switched; the snapshot is
+        written afterwards from the quizzes' current prefixes, which never change
+        because quizzes only grow.
+        """
+        with self._compact_lock:
+            with self._lock:
+                generation = self.generation + 1
+                self.writer.swap(self._open_journal(generation)).close()
+                self.generation = generation
+                quizzes = [(quiz_id, quiz, quiz.get_question_count()) for quiz_id, quiz in self._quizzes.items()]
+                missing_banks = list(self._missing_banks.items())
+
+            path = self._path(SNAPSHOT_PREFIX, generation)
+            with open(path + ".tmp", "wb") as file:
+                file.write(self._header())
+                for quiz_id, path in missing_banks:
+                    file.write(encode_mount(quiz_id, path))
+                for quiz_id, quiz, count in quizzes:
+                    if isinstance(quiz, QuizBank):
+                        file.write(encode_mount(quiz_id, quiz.path))
+                        continue
+                    file.write(encode_quiz(quiz_id, quiz))
+                    for start in range(0, count, SNAPSHOT_CHUNK):
+                        rows = [
+                            (q.question, q.answers, q.correct_answer_index)
+                            for q in quiz.questions[start:min(start + SNAPSHOT_CHUNK, count)]
+                        ]
+                        file.write(encode_questions(quiz_id, start, rows))
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(path + ".tmp", path)
+            _fsync_directory(self.directory)
+
+            for prefix, old in self._files():
+                if old < generation:
+                    os.remove(self._path(prefix, old))
+
+    def close(self) -> None:
+        """Stop the compactor, flush the journal and close it."""
+        self._stopped.set()
+        if self._compactor is not None:
+            self._compactor.join()
+        self.writer.close()
+
+    def _compact_periodically(self, interval: float) -> None:
+        """Compact whenever the journal has grown enough, until the store is closed."""
+        while not self._stopped.wait(interval):
+            if self.journal_bytes >= self._compact_min_bytes:
+                try:
+                    self.compact()
+                except OSError:
+                    # The journal stays authoritative; try again on the next round
+                    continue
+
+    def _recover(self) -> None:
+        """Load the newest snapshot and replay the journals written after it."""
+        files = self._files()
+        snapshots = [generation for prefix, generation in files if prefix == SNAPSHOT_PREFIX]
+        start = max(snapshots, default=0)
+        journals = sorted(generation for prefix, generation in files if prefix == JOURNAL_PREFIX and generation >= start)
+
+        self.epoch = ""
+        if snapshots:
+            self._replay(self._path(SNAPSHOT_PREFIX, start))
+        for generation in journals:
+            self.recovered_records += self._replay(self._path(JOURNAL_PREFIX, generation), truncate=True)
+        if not self.epoch:
+            self.epoch = secrets.token_hex(EPOCH_BYTES // 2)
+        self.generation = journals[-1] if journals else start
+
+    def _replay(self, path: str, truncate: bool = False) -> int:
+        """
+        Apply the records of a file to the in-memory quizzes.
+
+        Args:
+            path: The snapshot or journal file.
+            truncate: Cut off a torn record at the end so appends continue after the last good one.
+
+        Returns:
+            The number of records applied.
+        """
+        with open(path, "rb") as file:
+            data = file.read()
+        if len(data) < HEADER_SIZE or not data.startswith(MAGIC):
+            good = 0
+        else:
+            self.epoch = self.epoch or data[len(MAGIC):HEADER_SIZE].decode("ascii")
+            good = HEADER_SIZE
+
+        applied = 0
+        if good:
+            for good, payload in iter_records(data, good):
+                self._apply(payload)
+                applied += 1
+        if truncate and good < len(data):
+            with open(path, "r+b") as file:
+                file.truncate(good)
+        return applied
+
+    def _apply(self, payload: bytes) -> None:
+        """Apply one record to the in-memory quizzes."""
+        if payload[0] == OP_QUIZ:
+            _, quiz_id = QUIZ_HEADER.unpack_from(payload)
+            title, offset = _unpack_string(payload, QUIZ_HEADER.size)
+            description, offset = _unpack_string(payload, offset)
+            dedup_policy, _ = _unpack_string(payload, offset)
+            self._quizzes[quiz_id] = Quiz(title, description, dedup_policy)
+            self._next_id = max(self._next_id, quiz_id + 1)
+            self._record_change(quiz_id)
+        elif payload[0] == OP_MOUNT:
+            _, quiz_id = QUIZ_HEADER.unpack_from(payload)
+            path, _ = _unpack_string(payload, QUIZ_HEADER.size)
+            self._next_id = max(self._next_id, quiz_id + 1)
+            try:
+                bank = open_quiz_bank(path)
+            except ValueError:
+                bank = None
+            if bank is None:
+                self._missing_banks[quiz_id] = path
+            else:
+                self._quizzes[quiz_id] = bank
+                self._record_change(quiz_id)
+        elif payload[0] == OP_QUESTIONS:
+            quiz_id, first_question_id, rows = decode_questions(payload)
+            quiz = self._quizzes[quiz_id]
+            # Skip rows the quiz already has, so a record applied twice does no harm
+            for row in rows[max(quiz.get_question_count() - first_question_id, 0):]:
+                quiz.add_question(*row)
+            self._record_change(quiz_id)
+
+    def _open_journal(self, generation: int):
+        """Open a journal for appending, writing its header if it is new."""
+        file = open(self._path(JOURNAL_PREFIX, generation), "ab")
+        if file.tell() == 0:
+            file.write(self._header())
+            file.flush()
+            os.fsync(file.fileno())
+            _fsync_directory(self.directory)
+        return file
+
+    def _header(self) -> bytes:
+        """The header every file of this store starts with."""
+        return MAGIC + self.epoch.encode("ascii")
+
+    def _path(self, prefix: str, generation: int) -> str:
+        """The path of a snapshot or journal file."""
+        return os.path.join(self.directory, f"{prefix}{generation:08d}")
+
+    def _files(self) -> List[Tuple[str, int]]:
+        """The snapshot and journal files in the directory, as (prefix, generation)."""
+        files = []
+        for name in os.listdir(self.directory):
+            for prefix in (SNAPSHOT_PREFIX, JOURNAL_PREFIX):
+                if name.startswith(prefix) and name[len(prefix):].isdigit():
+                    files.append((prefix, int(name[len(prefix):])))
+        return files
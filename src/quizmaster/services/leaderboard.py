@@ -0,0 +1,185 @@
+"""
+Leaderboard module.
+
+This module defines Leaderboard, which ranks users of one quiz by their best score,
+and Leaderboards, which holds the leaderboard of every quiz.
+"""
+
+import threading
+from itertools import islice
+from typing import Dict, List, Optional, Tuple
+
+from quizmaster.utils.fenwick import FenwickTree
+
+
+# A ranked entry: rank, user ID and score
+RankedEntry = Tuple[int, str, int]
+
+
+class Leaderboard:
+    """
+    The best score of every user on one quiz, ranked.
+
+    A Fenwick tree counts the users at each score, so the number of users ahead of any
+    score is a prefix sum. Users with the same score are kept in an insertion-ordered
+    dictionary per score, so ties are listed in the order the scores were reached.
+    Recording a score, getting a user's rank and locating the start of a page all take
+    O(log S), where S is the highest score, whatever the number of users.
+
+    Ranks use standard competition ranking: users with equal scores share a rank, and
+    the next score's rank skips accordingly (1, 2, 2, 4).
+    """
+
+    def __init__(self):
+        """Initialize a new, empty Leaderboard."""
+        self._scores: Dict[str, int] = {}
+        self._buckets: Dict[int, Dict[str, None]] = {}
+        self._counts = FenwickTree()
+        self._lock = threading.Lock()
+
+    def record(self, user_id: str, score: int) -> bool:
+        """
+        Record a graded attempt. Only a user's best score is kept.
+
+        Args:
+            user_id: The user who made the attempt.
+            score: The attempt's score.
+
+        Returns:
+            True if the leaderboard changed.
+        """
+        with self._lock:
+            previous = self._scores.get(user_id)
+            if previous is not None:
+                if score <= previous:
+                    return False
+                del self._buckets[previous][user_id]
+                if not self._buckets[previous]:
+                    del self._buckets[previous]
+                self._counts.add(previous, -1)
+
+            self._scores[user_id] = score
+            self._buckets.setdefault(score, {})[user_id] = None
+            self._counts.add(score, 1)
+            return True
+
+    def _ahead_of(self, score: int) -> int:
+        """Count the users with a higher score. The caller must hold the lock."""
+        return self._counts.total - self._counts.prefix_sum(score)
+
+    def rank(self, user_id: str) -> Optional[Tuple[int, int]]:
+        """
+        Get a user's rank and best score.
+
+        Args:
+            user_id: The user.
+
+        Returns:
+            The one-based rank and the score, or None if the user has no score.
+        """
+        with self._lock:
+            score = self._scores.get(user_id)
+            if score is None:
+                return None
+            return self._ahead_of(score) + 1, score
+
+    def page(self, offset: int = 0, limit: int = 10) -> List[RankedEntry]:
+        """
+        Get a slice of the leaderboard, best scores first.
+
+        The start of the page and each next occupied score are found through the Fenwick
+        tree, so a page costs O(log S) per distinct score on it, however deep it is and
+        however far apart the scores are; only ties within the starting score are skipped.
+
+        Args:
+            offset: The number of entries to skip.
+            limit: The maximum number of entries to return.
+
+        Returns:
+            Tuples of rank, user ID and score.
+        """
+        with self._lock:
+            total = self._counts.total
+            if offset >= total or limit <= 0:
+                return []
+
+            # The entry at offset is the (total - 1 - offset)-th lowest score
+            score = self._counts.find(total - 1 - offset)
+            ahead = self._ahead_of(score)
+            skip = offset - ahead
+            entries: List[RankedEntry] = []
+            while True:
+                bucket = self._buckets[score]
+                for user_id in islice(bucket, skip, skip + limit - len(entries)):
+                    entries.append((ahead + 1, user_id, score))
+                ahead += len(bucket)
+                if len(entries) >= limit or ahead >= total:
+                    return entries
+                # Jump straight to the next lower score that has users
+                score = self._counts.find(total - 1 - ahead)
+                skip = 0
+
+    def top(self, k: int = 10) -> List[RankedEntry]:
+        """
+        Get the k best entries.
+
+        Args:
+            k: The number of entries.
+
+        Returns:
+            Tuples of rank, user ID and score.
+        """
+        return self.page(0, k)
+
+    def __len__(self) -> int:
+        """Return the number of ranked users."""
+        return len(self._scores)
+
+
+class Leaderboards:
+    """
+    The leaderboards of all quizzes, created on first use.
+
+    Leaderboards are kept in the current process; with several workers each one ranks
+    the attempts it graded.
+    """
+
+    def __init__(self):
+        """Initialize an empty set of leaderboards."""
+        self._boards: Dict[int, Leaderboard] = {}
+        self._lock = threading.Lock()
+
+    def get(self, quiz_id: int) -> Optional[Leaderboard]:
+        """
+        Get the leaderboard of a quiz.
+
+        Args:
+            quiz_id: The quiz ID.
+
+        Returns:
+            The leaderboard, or None if no score was recorded for the quiz.
+        """
+        return self._boards.get(quiz_id)
+
+    def record(self, quiz_id: int, user_id: str, score: int) -> bool:
+        """
+        Record a graded attempt on a quiz's leaderboard.
+
+        Args:
+            quiz_id: The quiz ID.
+            user_id: The user who made the attempt.
+            score: The attempt's score.
+
+        Returns:
+            True if the leaderboard changed.
+        """
+        board = self._boards.get(quiz_id)
+        if board is None:
+            with self._lock:
+                board = self._boards.setdefault(quiz_id, Leaderboard())
+        return board.record(user_id, score)
+
+    def clear(self) -> None:
+        """Remove all leaderboards."""
+        with self._lock:
+            self._boards.clear()
@@ -0,0 +1,436 @@
+"""
+Live rooms module.
+
+This module runs live multiplayer quizzes: a host advances through the questions of a
+quiz and every participant in the room receives them at the same time over a
+WebSocket. To scale to thousands of participants per room:
+
+- each broadcast message is serialized to JSON once and the same string is queued
+  for every participant;
+- every participant has a bounded outgoing queue, and a participant that falls too
+  far behind is dropped instead of slowing down the room;
+- answers go through a bounded per-room queue, so a flood of answers makes the
+  senders wait rather than growing memory;
+- answer counts are updated incrementally as answers arrive, and the tally is pushed
+  at most once per tally interval, however many answers come in.
+
+Rooms live on the event loop of the worker that created them. A room is removed from
+the registry as soon as it finishes, and rooms whose host stops advancing them are
+closed after a time-to-live.
+"""
+
+import asyncio
+import secrets
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+from quizmaster.models.quiz import Quiz
+from quizmaster.services.leaderboard import Leaderboard
+from quizmaster.services.serialization import dumps
+
+ROOM_WAITING = "waiting"
+ROOM_QUESTION = "question"
+ROOM_REVEALED = "revealed"
+ROOM_FINISHED = "finished"
+
+# WebSocket close code sent to participants that could not keep up
+CLOSE_TOO_SLOW = 4008
+
+
+class Participant:
+    """
+    A member of a live room.
+
+    Attributes:
+        participant_id (str): The ID allocated by the room.
+        name (str): The display name.
+        outbox (asyncio.Queue): Serialized messages waiting to be sent; None means disconnect.
+        score (int): The number of correct answers.
+        answered (int): The index of the last question answered, or -1.
+        dropped (bool): Whether the participant was dropped for falling behind.
+    """
+
+    __slots__ = ("participant_id", "name", "outbox", "score", "answered", "dropped")
+
+    def __init__(self, participant_id: str, name: str, queue_size: int):
+        """
+        Initialize a new Participant.
+
+        Args:
+            participant_id: The ID allocated by the room.
+            name: The display name.
+            queue_size: The most messages that may wait to be sent.
+        """
+        self.participant_id = participant_id
+        self.name = name
+        self.outbox: asyncio.Queue = asyncio.Queue(queue_size)
+        self.score = 0
+        self.answered = -1
+        self.dropped = False
+
+
+class Room:
+    """
+    A live quiz room.
+
+    Attributes:
+        room_id (str): The room ID.
+        quiz_id (int): The ID of the quiz being played.
+        quiz (Quiz): The quiz being played.
+        host_token (str): The secret that authorizes host actions.
+        state (str): ROOM_WAITING, ROOM_QUESTION, ROOM_REVEALED or ROOM_FINISHED.
+        question_index (int): The index of the current question, or -1 before the first.
+        counts (List[int]): How often each answer of the current question was chosen.
+        answered (int): How many participants answered the current question.
+        participants (Dict[str, Participant]): The connected participants by ID.
+        standings (Leaderboard): The score of everyone who joined, including those who left.
+        last_active (float): The clock time of the host's last action, set by the registry.
+    """
+
+    def __init__(self, room_id: str, quiz_id: int, quiz: Quiz, host_token: str,
+                 queue_size: int = 64, answer_queue_size: int = 1024, tally_interval: float = 0.25):
+        """
+        Initialize a new Room.
+
+        Args:
+            room_id: The room ID.
+            quiz_id: The ID of the quiz to play.
+            quiz: The quiz to play.
+            host_token: The secret that authorizes host actions.
+            queue_size: The most messages that may wait for one participant before it is dropped.
+            answer_queue_size: The most answers that may wait to be counted.
+            tally_interval: The shortest time in seconds between two tally messages.
+        """
+        self.room_id = room_id
+        self.quiz_id = quiz_id
+        self.quiz = quiz
+        self.host_token = host_token
+        self.state = ROOM_WAITING
+        self.question_index = -1
+        self.counts: List[int] = []
+        self.answered = 0
+        self.participants: Dict[str, Participant] = {}
+        self.standings = Leaderboard()
+        self.last_active = 0.0
+        self._names: Dict[str, str] = {}
+        # At least room for the final standings and the disconnect that follows them
+        self._queue_size = max(queue_size, 2)
+        self._answers: asyncio.Queue = asyncio.Queue(answer_queue_size)
+        self._tally_interval = tally_interval
+        self._tally_handle: Optional[asyncio.TimerHandle] = None
+        self._collector: Optional[asyncio.Task] = None
+
+    def join(self, name: str) -> Participant:
+        """
+        Add a participant, who first receives the current question if one is open.
+
+        Args:
+            name: The display name.
+
+        Returns:
+            The new participant.
+        """
+        if self._collector is None:
+            self._collector = asyncio.get_running_loop().create_task(self._collect())
+
+        participant = Participant(secrets.token_urlsafe(8), name, self._queue_size)
+        self.participants[participant.participant_id] = participant
+        self._names[participant.participant_id] = name
+        self.standings.record(participant.participant_id, 0)
+        self._send(participant, dumps({
+            "type": "joined", "room_id": self.room_id, "participant_id": participant.participant_id
+        }).decode("utf-8"))
+        if self.state == ROOM_QUESTION:
+            self._send(participant, self._question_message())
+        return participant
+
+    def leave(self, participant: Participant) -> None:
+        """Remove a participant; their score stays in the standings."""
+        self.participants.pop(participant.participant_id, None)
+
+    async def submit(self, participant: Participant, answer_index: int) -> None:
+        """
+        Queue an answer to the current question, waiting while the room's answer queue is full.
+
+        Args:
+            participant: The participant answering.
+            answer_index: The chosen answer.
+        """
+        await self._answers.put((participant, self.question_index, answer_index))
+
+    def advance(self) -> str:
+        """
+        Move the room on: reveal the open question, or open the next one, or finish.
+
+        Returns:
+            The new state.
+
+        Raises:
+            ValueError: If the room has already finished.
+        """
+        if self.state == ROOM_FINISHED:
+            raise ValueError("The room has finished")
+        if self.state == ROOM_QUESTION:
+            self._reveal()
+        elif self.question_index + 1 < self.quiz.get_question_count():
+            self._open_question(self.question_index + 1)
+        else:
+            self.finish()
+        return self.state
+
+    def finish(self) -> None:
+        """
+        Send the final standings, disconnect everyone and stop counting answers.
+
+        Participants who are behind lose their oldest queued messages instead of being
+        dropped, so everyone still connected receives the standings.
+        """
+        if self.state == ROOM_FINISHED:
+            return
+        self.state = ROOM_FINISHED
+        self._cancel_tally()
+        text = dumps({"type": "finished", "standings": self.top()}).decode("utf-8")
+        for participant in list(self.participants.values()):
+            outbox = participant.outbox
+            while outbox.maxsize and outbox.qsize() > outbox.maxsize - 2:
+                outbox.get_nowait()
+            outbox.put_nowait(text)
+            outbox.put_nowait(None)
+        if self._collector is not None:
+            self._collector.cancel()
+            self._collector = None
+
+    def top(self, k: int = 10) -> List[Dict[str, Any]]:
+        """
+        Get the best participants.
+
+        Args:
+            k: The number of entries.
+
+        Returns:
+            Dictionaries with rank, participant_id, name and score.
+        """
+        return [
+            {"rank": rank, "participant_id": participant_id, "name": self._names[participant_id], "score": score}
+            for rank, participant_id, score in self.standings.top(k)
+        ]
+
+    def _open_question(self, index: int) -> None:
+        """Open a question and send it to everyone."""
+        self.question_index = index
+        self.counts = [0] * len(self.quiz.get_question(index).answers)
+        self.answered = 0
+        self.state = ROOM_QUESTION
+        self._broadcast_text(self._question_message())
+
+    def _question_message(self) -> str:
+        """Serialize the open question, without its answer key."""
+        question = self.quiz.get_question(self.question_index)
+        return dumps({
+            "type": "question",
+            "index": self.question_index,
+            "question_count": self.quiz.get_question_count(),
+            "text": question.question,
+            "answers": question.answers,
+        }).decode("utf-8")
+
+    def _reveal(self) -> None:
+        """Close the open question and send the answer key with the final counts."""
+        self.state = ROOM_REVEALED
+        self._cancel_tally()
+        self._broadcast({
+            "type": "reveal",
+            "index": self.question_index,
+            "correct_answer_index": self.quiz.answer_keys[self.question_index],
+            "counts": self.counts,
+            "answered": self.answered,
+        })
+
+    async def _collect(self) -> None:
+        """Count queued answers as they arrive."""
+        while True:
+            participant, question_index, answer_index = await self._answers.get()
+            if (
+                self.state != ROOM_QUESTION
+                or question_index != self.question_index
+                or participant.answered >= question_index
+                or not 0 <= answer_index < len(self.counts)
+            ):
+                continue
+
+            participant.answered = question_index
+            self.counts[answer_index] += 1
+            self.answered += 1
+            if answer_index == self.quiz.answer_keys[question_index]:
+                participant.score += 1
+                self.standings.record(participant.participant_id, participant.score)
+            if self._tally_handle is None:
+                self._tally_handle = asyncio.get_running_loop().call_later(self._tally_interval, self._push_tally)
+
+    def _push_tally(self) -> None:
+        """Send the running counts of the open question."""
+        self._tally_handle = None
+        if self.state == ROOM_QUESTION:
+            self._broadcast({
+                "type": "tally",
+                "index": self.question_index,
+                "counts": self.counts,
+                "answered": self.answered,
+                "participants": len(self.participants),
+            })
+
+    def _cancel_tally(self) -> None:
+        """Drop a pending tally message."""
+        if self._tally_handle is not None:
+            self._tally_handle.cancel()
+            self._tally_handle = None
+
+    def _broadcast(self, message: Dict[str, Any]) -> None:
+        """Serialize a message once and queue it for every participant."""
+        self._broadcast_text(dumps(message).decode("utf-8"))
+
+    def _broadcast_text(self, text: str) -> None:
+        """Queue a serialized message for every participant."""
+        for participant in list(self.participants.values()):
+            self._send(participant, text)
+
+    def _send(self, participant: Participant, text: Optional[str]) -> None:
+        """Queue a message for one participant, dropping them if their queue is full."""
+        try:
+            participant.outbox.put_nowait(text)
+        except asyncio.QueueFull:
+            # Too far behind: discard the backlog and tell the sender to disconnect
+            participant.dropped = True
+            self.leave(participant)
+            while not participant.outbox.empty():
+                participant.outbox.get_nowait()
+            participant.outbox.put_nowait(None)
+
+
+class RoomRegistry:
+    """
+    The live rooms of this worker.
+
+    Like SessionEngine, rooms live in an OrderedDict ordered by the host's last action,
+    so the rooms that expire first are always at the front and expiry only ever looks
+    at the oldest entries. Expired rooms are finished, which disconnects their
+    participants.
+
+    Attributes:
+        queue_size (int): Passed to every new room.
+        tally_interval (float): Passed to every new room.
+        ttl (float): Seconds without a host action after which a room is closed.
+        expired (int): The number of rooms closed because they were idle.
+    """
+
+    def __init__(
+        self, queue_size: int = 64, tally_interval: float = 0.25, ttl: float = 3600.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize an empty registry.
+
+        Args:
+            queue_size: The most messages that may wait for one participant.
+            tally_interval: The shortest time in seconds between two tally messages.
+            ttl: Seconds without a host action after which a room is closed.
+            clock: The time source, replaceable in tests.
+        """
+        self.queue_size = queue_size
+        self.tally_interval = tally_interval
+        self.ttl = ttl
+        self.expired = 0
+        self._clock = clock
+        self._rooms: "OrderedDict[str, Room]" = OrderedDict()
+
+    def create(self, quiz_id: int, quiz: Quiz) -> Room:
+        """
+        Open a room for a quiz.
+
+        Args:
+            quiz_id: The quiz ID.
+            quiz: The quiz.
+
+        Returns:
+            The new room.
+        """
+        now = self._clock()
+        self._expire(now)
+        room = Room(
+            secrets.token_urlsafe(6), quiz_id, quiz, secrets.token_urlsafe(16),
+            queue_size=self.queue_size, tally_interval=self.tally_interval
+        )
+        room.last_active = now
+        self._rooms[room.room_id] = room
+        return room
+
+    def get(self, room_id: str) -> Optional[Room]:
+        """Get a room by ID, or None if it does not exist, has finished or has expired."""
+        self._expire(self._clock())
+        return self._rooms.get(room_id)
+
+    def advance(self, room: Room) -> str:
+        """
+        Advance a room on behalf of its host, removing it once it finishes.
+
+        Args:
+            room: The room.
+
+        Returns:
+            The new state.
+
+        Raises:
+            ValueError: If the room has already finished.
+        """
+        state = room.advance()
+        if state == ROOM_FINISHED:
+            self._rooms.pop(room.room_id, None)
+        elif room.room_id in self._rooms:
+            room.last_active = self._clock()
+            self._rooms.move_to_end(room.room_id)
+        return state
+
+    def close(self, room_id: str) -> bool:
+        """
+        Finish and remove a room.
+
+        Returns:
+            True if the room existed.
+        """
+        room = self._rooms.pop(room_id, None)
+        if room is None:
+            return False
+        room.finish()
+        return True
+
+    def expire(self) -> int:
+        """
+        Close all rooms whose host has been idle longer than the TTL.
+
+        Returns:
+            The number of rooms closed.
+        """
+        return self._expire(self._clock())
+
+    def _expire(self, now: float) -> int:
+        """Close idle rooms from the front of the queue."""
+        removed = 0
+        deadline = now - self.ttl
+        while self._rooms:
+            oldest = next(iter(self._rooms.values()))
+            if oldest.last_active > deadline:
+                break
+            self._rooms.popitem(last=False)
+            oldest.finish()
+            removed += 1
+        self.expired += removed
+        return removed
+
+    def participant_count(self) -> int:
+        """Return the number of participants in all rooms."""
+        return sum(len(room.participants) for room in self._rooms.values())
+
+    def __len__(self) -> int:
+        """Return the number of open rooms."""
+        return len(self._rooms)
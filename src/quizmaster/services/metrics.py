@@ -0,0 +1,187 @@
+"""
+Metrics module.
+
+This module collects request metrics for the REST API and renders them in the
+Prometheus text exposition format. MetricsMiddleware is a plain ASGI middleware, so
+it adds only a few dictionary operations per request.
+"""
+
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+# Upper bounds of the latency histogram buckets, in seconds
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# The route label of requests that matched no route, so unknown paths cannot grow the label set
+UNMATCHED_ROUTE = "unmatched"
+
+PREFIX = "quizmaster"
+
+
+def escape_label(value: str) -> str:
+    """Escape a label value for the Prometheus text format."""
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def format_labels(labels: Iterable[Tuple[str, str]]) -> str:
+    """Format label pairs as {name="value",...}."""
+    return "{" + ",".join(f'{name}="{escape_label(value)}"' for name, value in labels) + "}"
+
+
+def format_value(value: float) -> str:
+    """Format a sample value, writing whole numbers without a decimal point."""
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Metrics:
+    """
+    Request counters and latency histograms keyed by method and route template.
+
+    Using the route template ("/quizzes/{quiz_id}") rather than the raw path keeps the
+    number of series bounded. Updates happen on the event loop thread, where the
+    middleware runs, so no locking is needed.
+
+    Attributes:
+        in_flight (int): The number of requests being handled.
+    """
+
+    def __init__(self):
+        """Initialize empty metrics."""
+        self.in_flight = 0
+        self._requests: Dict[Tuple[str, str, int], int] = {}
+        self._latency: Dict[Tuple[str, str], List[float]] = {}
+
+    def observe(self, method: str, route: str, status_code: int, seconds: float) -> None:
+        """
+        Record a finished request.
+
+        Args:
+            method: The HTTP method.
+            route: The route template.
+            status_code: The response status code.
+            seconds: How long the request took.
+        """
+        key = (method, route, status_code)
+        self._requests[key] = self._requests.get(key, 0) + 1
+
+        histogram = self._latency.get((method, route))
+        if histogram is None:
+            # One count per bucket plus +Inf, then the sum of observed values
+            histogram = self._latency[(method, route)] = [0] * (len(LATENCY_BUCKETS) + 1) + [0.0]
+        histogram[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        histogram[-1] += seconds
+
+    def render(self, gauges: Iterable[Tuple[str, str, float]] = ()) -> str:
+        """
+        Render all metrics in the Prometheus text format.
+
+        Args:
+            gauges: Extra gauges as (name, help text, value); names get the quizmaster_ prefix.
+
+        Returns:
+            The exposition text.
+        """
+        lines = [
+            f"# HELP {PREFIX}_http_requests_total Handled HTTP requests.",
+            f"# TYPE {PREFIX}_http_requests_total counter",
+        ]
+        for (method, route, status_code), count in sorted(self._requests.items()):
+            labels = format_labels([("method", method), ("route", route), ("status", str(status_code))])
+            lines.append(f"{PREFIX}_http_requests_total{labels} {count}")
+
+        lines.append(f"# HELP {PREFIX}_http_request_duration_seconds HTTP request latency by route template.")
+        lines.append(f"# TYPE {PREFIX}_http_request_duration_seconds histogram")
+        for (method, route), histogram in sorted(self._latency.items()):
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS + (float("inf"),), histogram):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else format_value(bound)
+                labels = format_labels([("method", method), ("route", route), ("le", le)])
+                lines.append(f"{PREFIX}_http_request_duration_seconds_bucket{labels} {cumulative}")
+            labels = format_labels([("method", method), ("route", route)])
+            lines.append(f"{PREFIX}_http_request_duration_seconds_sum{labels} {format_value(histogram[-1])}")
+            lines.append(f"{PREFIX}_http_request_duration_seconds_count{labels} {cumulative}")
+
+        lines.append(f"# HELP {PREFIX}_http_requests_in_flight HTTP requests being handled.")
+        lines.append(f"# TYPE {PREFIX}_http_requests_in_flight gauge")
+        lines.append(f"{PREFIX}_http_requests_in_flight {self.in_flight}")
+
+        for name, help_text, value in gauges:
+            lines.append(f"# HELP {PREFIX}_{name} {help_text}")
+            lines.append(f"# TYPE {PREFIX}_{name} gauge")
+            lines.append(f"{PREFIX}_{name} {format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        """Reset the request metrics."""
+        self._requests.clear()
+        self._latency.clear()
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware that feeds a Metrics instance.
+
+    The route template is read from the scope after the router has matched the
+    request; the in-flight gauge counts requests until their response is complete.
+    """
+
+    def __init__(self, app: Callable, metrics: Metrics, clock: Callable[[], float] = time.perf_counter):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: The wrapped ASGI application.
+            metrics: Where to record requests.
+            clock: The time source, replaceable in tests.
+        """
+        self.app = app
+        self.metrics = metrics
+        self.clock = clock
+        self._endpoint_paths: Dict[Any, str] = {}
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        """Handle an ASGI call, timing HTTP requests."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: dict) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        metrics = self.metrics
+        metrics.in_flight += 1
+        start = self.clock()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            metrics.in_flight -= 1
+            metrics.observe(scope["method"], self._route_template(scope), status_code, self.clock() - start)
+
+    def _route_template(self, scope: dict) -> str:
+        """Get the path template of the matched route."""
+        route = scope.get("route")
+        if route is not None:
+            return getattr(route, "path", UNMATCHED_ROUTE)
+
+        # Older Starlette versions only record the endpoint
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return UNMATCHED_ROUTE
+        path = self._endpoint_paths.get(endpoint)
+        if path is None:
+            app = scope.get("app")
+            for candidate in getattr(app, "routes", ()):
+                if getattr(candidate, "endpoint", None) is endpoint:
+                    path = candidate.path
+                    break
+            path = self._endpoint_paths[endpoint] = path or UNMATCHED_ROUTE
+        return path
@@ -0,0 +1,280 @@
+"""
+Profiler module.
+
+This module provides a statistical sampling profiler that can be switched on in a
+running server. A background thread periodically reads the stack of every thread with
+sys._current_frames() and counts identical stacks, so the app keeps serving traffic
+with little overhead. Results are collapsed stacks ("frame;frame;frame count" per line),
+which flamegraph.pl, speedscope and similar tools read directly.
+
+A profile either runs for a fixed time, or covers the next requests to one route, in
+which case samples are only taken while such a request is in flight.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Tuple
+
+from starlette.routing import Match
+
+# Innermost frames of threads that are waiting rather than working: the event loop
+# waiting for I/O and thread pool workers waiting for a job
+IDLE_FRAMES = {
+    ("selectors.py", "select"),
+    ("threading.py", "wait"),
+    ("queue.py", "get"),
+    ("thread.py", "_worker"),
+}
+
+
+def frame_label(code) -> str:
+    """Label a code object as "function (package/module.py:line)"."""
+    path = code.co_filename.replace("\\", "/").split("/")
+    return f"{code.co_name} ({'/'.join(path[-2:])}:{code.co_firstlineno})"
+
+
+class SamplingProfiler:
+    """
+    Samples the stacks of all threads from a background thread.
+
+    Attributes:
+        interval (float): Seconds between samples.
+        include_idle (bool): Whether to keep samples of waiting threads.
+        max_depth (int): The number of innermost frames kept per stack.
+        samples (int): The number of stacks recorded.
+    """
+
+    def __init__(self, interval: float = 0.005, include_idle: bool = False, max_depth: int = 128,
+                 should_sample: Optional[Callable[[], bool]] = None):
+        """
+        Initialize a new SamplingProfiler.
+
+        Args:
+            interval: Seconds between samples.
+            include_idle: Whether to keep samples of waiting threads.
+            max_depth: The number of innermost frames kept per stack.
+            should_sample: Called before each sample; sampling is skipped while it returns False.
+        """
+        self.interval = interval
+        self.include_idle = include_idle
+        self.max_depth = max_depth
+        self.samples = 0
+        self._should_sample = should_sample
+        self._stacks: Counter = Counter()
+        self._labels: Dict[object, str] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def sample(self) -> None:
+        """Record the current stack of every thread except the profiler's own."""
+        own_id = threading.get_ident()
+        labels = self._labels
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_id:
+                continue
+            code = frame.f_code
+            if not self.include_idle and (os.path.basename(code.co_filename), code.co_name) in IDLE_FRAMES:
+                continue
+
+            stack: List[str] = []
+            while frame is not None and len(stack) < self.max_depth:
+                code = frame.f_code
+                label = labels.get(code)
+                if label is None:
+                    label = labels[code] = frame_label(code)
+                stack.append(label)
+                frame = frame.f_back
+            stack.reverse()
+            self._stacks[tuple(stack)] += 1
+            self.samples += 1
+
+    def start(self) -> None:
+        """Start sampling in a background thread."""
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="quizmaster-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the background thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        """Sample until stopped."""
+        while not self._stop.wait(self.interval):
+            if self._should_sample is None or self._should_sample():
+                self.sample()
+
+    def collapsed(self) -> str:
+        """
+        Get the recorded stacks in the collapsed format.
+
+        Returns:
+            One "outermost;...;innermost count" line per distinct stack, most frequent first.
+        """
+        return "".join(f"{';'.join(stack)} {count}\n" for stack, count in self._stacks.most_common())
+
+
+class RouteProfile:
+    """
+    Profiles the next requests to one route.
+
+    Samples are taken only while a matching request is in flight. Requests to other
+    routes that run at the same time are sampled too, which is the usual trade-off of a
+    statistical profiler.
+
+    Attributes:
+        routes (list): The app routes that count as the profiled route.
+        count (int): How many requests to profile.
+        completed (int): How many matching requests have finished.
+        profiler (SamplingProfiler): The profiler collecting the samples.
+    """
+
+    def __init__(self, routes: list, count: int, interval: float, loop: asyncio.AbstractEventLoop):
+        """
+        Initialize a new RouteProfile.
+
+        Args:
+            routes: The app routes to profile.
+            count: How many requests to profile.
+            interval: Seconds between samples.
+            loop: The event loop of the request waiting for the profile.
+        """
+        self.routes = routes
+        self.count = count
+        self.completed = 0
+        self.profiler = SamplingProfiler(interval, should_sample=lambda: self._in_flight > 0)
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._loop = loop
+        self._done = asyncio.Event()
+
+    def matches(self, scope: dict) -> bool:
+        """Check whether a request goes to the profiled route."""
+        return any(route.matches(scope)[0] is Match.FULL for route in self.routes)
+
+    def request_started(self) -> bool:
+        """
+        Count a matching request as in flight.
+
+        Returns:
+            False if enough requests have already been profiled.
+        """
+        with self._lock:
+            if self.completed + self._in_flight >= self.count:
+                return False
+            self._in_flight += 1
+            return True
+
+    def request_finished(self) -> None:
+        """Count a matching request as finished."""
+        with self._lock:
+            self._in_flight -= 1
+            self.completed += 1
+            done = self.completed >= self.count
+        if done:
+            self._loop.call_soon_threadsafe(self._done.set)
+
+    async def wait(self, timeout: float) -> None:
+        """Wait until enough requests have finished, or the timeout passes."""
+        try:
+            await asyncio.wait_for(self._done.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+
+class Profiling:
+    """
+    The profiling state of the app; only one profile runs at a time.
+
+    Attributes:
+        busy (bool): Whether a profile is running.
+        route_profile (RouteProfile): The armed route profile, if any.
+    """
+
+    def __init__(self):
+        """Initialize idle profiling state."""
+        self.busy = False
+        self.route_profile: Optional[RouteProfile] = None
+
+    async def profile_for(self, seconds: float, interval: float) -> Tuple[str, int]:
+        """
+        Sample all threads for a fixed time.
+
+        Args:
+            seconds: How long to sample.
+            interval: Seconds between samples.
+
+        Returns:
+            The collapsed stacks and the number of samples.
+        """
+        profiler = SamplingProfiler(interval)
+        self.busy = True
+        profiler.start()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            profiler.stop()
+            self.busy = False
+        return profiler.collapsed(), profiler.samples
+
+    async def profile_requests(self, routes: list, count: int, timeout: float, interval: float) -> Tuple[str, int, int]:
+        """
+        Sample while the next requests to a route are handled.
+
+        Args:
+            routes: The app routes to profile.
+            count: How many requests to profile.
+            timeout: The longest time to wait for the requests.
+            interval: Seconds between samples.
+
+        Returns:
+            The collapsed stacks, the number of samples and the number of profiled requests.
+        """
+        profile = RouteProfile(routes, count, interval, asyncio.get_running_loop())
+        self.busy = True
+        profile.profiler.start()
+        self.route_profile = profile
+        try:
+            await profile.wait(timeout)
+        finally:
+            self.route_profile = None
+            profile.profiler.stop()
+            self.busy = False
+        return profile.profiler.collapsed(), profile.profiler.samples, profile.completed
+
+
+class ProfilerMiddleware:
+    """
+    ASGI middleware that tells an armed route profile when its requests start and end.
+
+    While no route profile is armed it costs one attribute check per request.
+    """
+
+    def __init__(self, app: Callable, profiling: Profiling):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: The wrapped ASGI application.
+            profiling: The profiling state.
+        """
+        self.app = app
+        self.profiling = profiling
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        """Handle an ASGI call, tracking requests to a profiled route."""
+        profile = self.profiling.route_profile
+        if profile is None or scope["type"] != "http" or not profile.matches(scope) or not profile.request_started():
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            profile.request_finished()
@@ -0,0 +1,338 @@
+"""
+Question import module.
+
+This module parses question banks streamed as JSONL or CSV and appends them to a quiz
+in chunks, collecting per-row errors instead of failing the whole import.
+
+JSONL rows have the same shape as the single-question endpoint::
+
+    {"text": "What is 2 + 2?", "answers": ["3", "4"], "correct_answer_index": 1}
+
+CSV rows hold the question, then the answers, then the correct answer index::
+
+    What is 2 + 2?,3,4,1
+
+A CSV header row is skipped when its last column is not a number. Each record must
+fit on one line.
+
+When the quiz has a dedup policy, every row is checked against the quiz's questions
+and the rows before it in the same import.
+"""
+
+import asyncio
+import codecs
+import csv
+import json
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from quizmaster.models.quiz import DEDUP_MERGE, DEDUP_OFF, DEDUP_REJECT, Quiz
+from quizmaster.services.quiz_store import QuizStore
+
+if TYPE_CHECKING:
+    from quizmaster.services.dedup import DedupIndex, DedupRegistry
+
+
+# A parsed row: question text, answers and correct answer index
+ParsedQuestion = Tuple[str, List[str], int]
+
+FORMAT_JSONL = "jsonl"
+FORMAT_CSV = "csv"
+
+CONTENT_TYPES = {
+    "application/x-ndjson": FORMAT_JSONL,
+    "application/jsonl": FORMAT_JSONL,
+    "application/json-lines": FORMAT_JSONL,
+    "text/csv": FORMAT_CSV,
+}
+
+
+def format_for_content_type(content_type: str) -> str:
+    """
+    Get the import format for a Content-Type header.
+
+    Args:
+        content_type: The Content-Type header value, possibly with parameters.
+
+    Returns:
+        FORMAT_JSONL or FORMAT_CSV.
+
+    Raises:
+        ValueError: If the content type is not supported.
+    """
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    if media_type not in CONTENT_TYPES:
+        supported = ", ".join(sorted(CONTENT_TYPES))
+        raise ValueError(f"Unsupported content type '{media_type}', expected one of: {supported}")
+    return CONTENT_TYPES[media_type]
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """
+    Split a stream of UTF-8 bytes into lines without buffering the whole body.
+
+    Args:
+        chunks: The body chunks, e.g. from Request.stream().
+
+    Yields:
+        Each line without its line terminator.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending.rstrip("\r")
+
+
+def parse_jsonl_row(line: str) -> ParsedQuestion:
+    """
+    Parse one JSONL row.
+
+    Args:
+        line: The JSON object text.
+
+    Returns:
+        The parsed question.
+
+    Raises:
+        ValueError: If the row is not valid JSON or has the wrong shape.
+    """
+    try:
+        row = json.loads(line)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON: {e.msg}")
+    if not isinstance(row, dict):
+        raise ValueError("Row must be a JSON object")
+
+    text = row.get("text")
+    answers = row.get("answers")
+    correct_answer_index = row.get("correct_answer_index")
+    if not isinstance(text, str):
+        raise ValueError("'text' must be a string")
+    if not isinstance(answers, list) or not all(isinstance(a, str) for a in answers):
+        raise ValueError("'answers' must be a list of strings")
+    if not isinstance(correct_answer_index, int) or isinstance(correct_answer_index, bool):
+        raise ValueError("'correct_answer_index' must be an integer")
+    return text, answers, correct_answer_index
+
+
+def parse_csv_row(line: str) -> ParsedQuestion:
+    """
+    Parse one CSV row.
+
+    Args:
+        line: The CSV record text.
+
+    Returns:
+        The parsed question.
+
+    Raises:
+        ValueError: If the row has too few columns or a non-numeric answer index.
+    """
+    fields = next(csv.reader([line]))
+    if len(fields) < 3:
+        raise ValueError("Expected a question, at least one answer and the correct answer index")
+    try:
+        correct_answer_index = int(fields[-1])
+    except ValueError:
+        raise ValueError(f"Correct answer index '{fields[-1]}' is not an integer")
+    return fields[0], fields[1:-1], correct_answer_index
+
+
+def is_csv_header(line: str) -> bool:
+    """
+    Check whether a CSV row looks like a header, i.e. its last column is not a number.
+
+    Args:
+        line: The CSV record text.
+
+    Returns:
+        True if the row should be treated as a header.
+    """
+    fields = next(csv.reader([line]), [])
+    try:
+        int(fields[-1])
+    except (IndexError, ValueError):
+        return bool(fields)
+    return False
+
+
+PARSERS: Dict[str, Callable[[str], ParsedQuestion]] = {
+    FORMAT_JSONL: parse_jsonl_row,
+    FORMAT_CSV: parse_csv_row,
+}
+
+
+class QuestionImporter:
+    """
+    Appends parsed rows to a stored quiz in chunks and keeps an import summary.
+
+    Attributes:
+        imported (int): The number of questions added.
+        failed (int): The number of rows rejected.
+        errors (List[Tuple[int, str]]): Line numbers and messages of the first rejected rows.
+        merged (int): The number of duplicate rows skipped under the "merge" policy.
+        warnings (List[Tuple[int, str]]): Line numbers and messages of the first duplicate
+            rows that were accepted or merged.
+    """
+
+    def __init__(
+        self,
+        store: QuizStore,
+        quiz_id: int,
+        chunk_size: int = 1000,
+        max_errors: int = 100,
+        dedup: Optional["DedupRegistry"] = None,
+        dedup_policy: str = DEDUP_OFF
+    ):
+        """
+        Initialize a new QuestionImporter.
+
+        Args:
+            store: The store holding the quiz.
+            quiz_id: The ID of the quiz to append questions to.
+            chunk_size: The number of parsed rows to collect before appending them.
+            max_errors: The maximum number of row errors (and warnings) kept for the summary.
+            dedup: The dedup indexes, required unless dedup_policy is "off".
+            dedup_policy: How duplicate rows are handled.
+        """
+        self.store = store
+        self.quiz_id = quiz_id
+        self.chunk_size = chunk_size
+        self.max_errors = max_errors
+        self.imported = 0
+        self.failed = 0
+        self.errors: List[Tuple[int, str]] = []
+        self.merged = 0
+        self.warnings: List[Tuple[int, str]] = []
+        self.dedup = dedup
+        self.dedup_policy = dedup_policy
+        self._chunk: List[Tuple[int, ParsedQuestion]] = []
+
+    def add_error(self, line_number: int, message: str) -> None:
+        """Record a rejected row."""
+        self.failed += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append((line_number, message))
+
+    def add_warning(self, line_number: int, message: str) -> None:
+        """Record a duplicate row that was not rejected."""
+        if len(self.warnings) < self.max_errors:
+            self.warnings.append((line_number, message))
+
+    def add_row(self, line_number: int, row: ParsedQuestion) -> bool:
+        """
+        Queue a parsed row for appending.
+
+        Returns:
+            True if the chunk is full and should be flushed.
+        """
+        self._chunk.append((line_number, row))
+        return len(self._chunk) >= self.chunk_size
+
+    def flush(self) -> None:
+        """
+        Append the queued rows to the quiz, recording rows the store rejects.
+
+        With a dedup policy, the quiz's dedup lock is held from the duplicate check until
+        the rows are appended, so no other write to the quiz can slip in between. The
+        appended rows reach the index through the store listener, under the IDs the
+        store gave them.
+        """
+        if self.dedup_policy == DEDUP_OFF:
+            self._append()
+            return
+        with self.dedup.lock_for(self.quiz_id):
+            self._dedup_chunk(self.dedup.index_for(self.store, self.quiz_id))
+            self._append()
+
+    def _append(self) -> None:
+        """Append the queued rows and record the result of each."""
+        if not self._chunk:
+            return
+        errors = self.store.add_questions(self.quiz_id, [row for _, row in self._chunk])
+        for (line_number, _), error in zip(self._chunk, errors):
+            if error is None:
+                self.imported += 1
+            else:
+                self.add_error(line_number, error)
+        self._chunk.clear()
+
+    def _dedup_chunk(self, index: "DedupIndex") -> None:
+        """
+        Apply the dedup policy to the queued rows.
+
+        Rows are checked against the quiz's index and against the rows kept before them
+        in the chunk, which are held in a separate index numbered by position in the
+        chunk until the store has appended them. Invalid rows are rejected first, so
+        they are never reported as the original of a duplicate.
+
+        Args:
+            index: The quiz's dedup index.
+        """
+        # Imported here so importing the module does not load NumPy
+        from quizmaster.services.dedup import DedupIndex, DuplicateMatch, fingerprint
+
+        pending = DedupIndex(index.threshold)
+        kept: List[Tuple[int, ParsedQuestion]] = []
+        for line_number, row in self._chunk:
+            question, answers, correct_answer_index = row
+            try:
+                Quiz.validate_question(answers, correct_answer_index)
+            except ValueError as e:
+                self.add_error(line_number, str(e))
+                continue
+
+            print_ = fingerprint(question, answers)
+            match = index.find(print_)
+            description = match.describe() if match is not None else None
+            if match is None:
+                match = pending.find(print_)
+                if match is not None:
+                    original = kept[match.question_id][0]
+                    description = DuplicateMatch(original, match.exact, match.similarity).describe("line")
+            if match is not None:
+                if self.dedup_policy == DEDUP_REJECT:
+                    self.add_error(line_number, description)
+                    continue
+                self.add_warning(line_number, description)
+                if self.dedup_policy == DEDUP_MERGE:
+                    self.merged += 1
+                    continue
+            pending.add(pending.count, print_)
+            kept.append((line_number, row))
+        self._chunk = kept
+
+    async def run(self, lines: AsyncIterator[str], import_format: str) -> None:
+        """
+        Parse and append all rows of a stream.
+
+        Every chunk is appended in the event loop's default executor, so other requests
+        keep being served while the store writes (and, for a journal store, waits for
+        the fsync).
+
+        Args:
+            lines: The lines of the body.
+            import_format: FORMAT_JSONL or FORMAT_CSV.
+        """
+        parse = PARSERS[import_format]
+        loop = asyncio.get_running_loop()
+        line_number = 0
+        async for line in lines:
+            line_number += 1
+            if not line.strip():
+                continue
+            if import_format == FORMAT_CSV and line_number == 1 and is_csv_header(line):
+                continue
+            try:
+                row = parse(line)
+            except ValueError as e:
+                self.add_error(line_number, str(e))
+                continue
+            if self.add_row(line_number, row):
+                await loop.run_in_executor(None, self.flush)
+        await loop.run_in_executor(None, self.flush)
@@ -0,0 +1,424 @@
+"""
+Quiz store module.
+
+This module defines the QuizStore interface used by the REST API to keep quizzes,
+the in-memory MemoryQuizStore backend and create_store, which picks a backend from
+a storage URL.
+
+Supported URLs:
+    memory                      Quizzes live in the process and are lost on restart (default).
+    sqlite:///path/to/file.db   Quizzes live in a SQLite database (see SQLiteQuizStore).
+    journal:///path/to/dir      Quizzes live in memory, journaled to a directory (see JournalQuizStore).
+"""
+
+import secrets
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from quizmaster.models.quiz import Question, Quiz
+from quizmaster.models.quiz_bank import QuizBank
+
+
+# A question to add: question text, answers and correct answer index
+QuestionRow = Tuple[str, List[str], int]
+
+# Called with the quiz ID, the ID of the first appended question and the appended rows
+QuestionsAddedListener = Callable[[int, int, List[QuestionRow]], None]
+
+
+class QuizInfo:
+    """
+    The metadata of a stored quiz, without its questions.
+
+    Attributes:
+        id (int): The quiz ID.
+        title (str): The title of the quiz.
+        description (str): The description of the quiz.
+        version (int): The content version of the quiz.
+        question_count (int): The number of questions in the quiz.
+        dedup_policy (str): How duplicate questions are handled.
+    """
+
+    __slots__ = ("id", "title", "description", "version", "question_count", "dedup_policy")
+
+    def __init__(
+        self, id: int, title: str, description: str, version: int, question_count: int, dedup_policy: str = "off"
+    ):
+        """
+        Initialize a new QuizInfo.
+
+        Args:
+            id: The quiz ID.
+            title: The title of the quiz.
+            description: The description of the quiz.
+            version: The content version of the quiz.
+            question_count: The number of questions in the quiz.
+            dedup_policy: How duplicate questions are handled.
+        """
+        self.id = id
+        self.title = title
+        self.description = description
+        self.version = version
+        self.question_count = question_count
+        self.dedup_policy = dedup_policy
+
+
+class QuizStore(ABC):
+    """
+    Storage for quizzes, addressed by sequentially allocated integer IDs.
+
+    Quizzes only grow by appending questions, and every appended question increments
+    the quiz version, so a quiz's version always equals its number of questions.
+
+    Listeners registered with add_listener are called after questions are appended,
+    so derived structures such as search indexes can be kept up to date.
+
+    Attributes:
+        epoch (str): A tag identifying this storage instance. It changes whenever IDs
+            could be reused (e.g. a new in-memory store), so it is part of every ETag.
+    """
+
+    epoch: str
+    _listeners: List[QuestionsAddedListener]
+
+    @abstractmethod
+    def add_quiz(self, quiz: Quiz) -> int:
+        """
+        Store a quiz, including any questions it already has.
+
+        Args:
+            quiz: The quiz to store.
+
+        Returns:
+            The ID allocated to the quiz.
+        """
+
+    @abstractmethod
+    def get_quiz(self, quiz_id: int) -> Optional[Quiz]:
+        """
+        Get a quiz with all its questions.
+
+        Args:
+            quiz_id: The quiz ID.
+
+        Returns:
+            The quiz, or None if it does not exist. Do not modify the returned quiz directly.
+        """
+
+    @abstractmethod
+    def get_quiz_info(self, quiz_id: int) -> Optional[QuizInfo]:
+        """
+        Get the metadata of a quiz without loading its questions.
+
+        Args:
+            quiz_id: The quiz ID.
+
+        Returns:
+            The quiz metadata, or None if the quiz does not exist.
+        """
+
+    @abstractmethod
+    def iter_quiz_infos(self, after: Optional[int] = None, limit: Optional[int] = None) -> Iterator[QuizInfo]:
+        """
+        Iterate over the metadata of stored quizzes in ID order.
+
+        Args:
+            after: Only yield quizzes with an ID greater than this cursor.
+            limit: The maximum number of quizzes to yield.
+
+        Yields:
+            Quiz metadata.
+        """
+
+    @abstractmethod
+    def get_question(self, quiz_id: int, question_id: int) -> Optional[Question]:
+        """
+        Get a single question.
+
+        Args:
+            quiz_id: The quiz ID.
+            question_id: The position of the question in the quiz.
+
+        Returns:
+            The question, or None if the quiz or question does not exist.
+        """
+
+    @abstractmethod
+    def add_questions(self, quiz_id: int, rows: Iterable[QuestionRow]) -> List[Optional[str]]:
+        """
+        Append questions to a quiz.
+
+        Rows are validated one by one; invalid rows are skipped and the others are appended.
+
+        Args:
+            quiz_id: The quiz ID.
+            rows: The questions to append.
+
+        Returns:
+            For every row, None if it was appended or the validation error message.
+
+        Raises:
+            KeyError: If the quiz does not exist.
+        """
+
+    @abstractmethod
+    def mount_bank(self, path: str) -> int:
+        """
+        Serve a read-only quiz bank file (see quizmaster.models.quiz_bank) as a quiz.
+
+        The bank is memory-mapped rather than copied into the store, and listeners are
+        not called, so mounting takes the same time whatever the bank's size; its
+        questions are not indexed for search. Mounting the same file again returns
+        the existing ID.
+
+        Args:
+            path: The bank file.
+
+        Returns:
+            The quiz ID of the bank.
+
+        Raises:
+            ValueError: If the file is not a quiz bank.
+            FileNotFoundError: If the file does not exist.
+        """
+
+    @abstractmethod
+    def changes_since(self, change: Optional[int]) -> Tuple[int, List[QuizInfo]]:
+        """
+        Get the quizzes that were created or appended to after a change.
+
+        Every write is numbered, so a reader that passes back the number it got last
+        time learns what changed without reading the metadata of every quiz.
+
+        Args:
+            change: A change number returned by an earlier call, or None for all quizzes.
+
+        Returns:
+            The number of the latest change, and the metadata of the changed quizzes in ID order.
+        """
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Return the number of stored quizzes."""
+
+    def add_question(self, quiz_id: int, question: str, answers: List[str], correct_answer_index: int) -> None:
+        """
+        Append a single question to a quiz.
+
+        Args:
+            quiz_id: The quiz ID.
+            question: The question text.
+            answers: A list of possible answers.
+            correct_answer_index: The index of the correct answer in the answers list.
+
+        Raises:
+            KeyError: If the quiz does not exist.
+            ValueError: If the question is invalid.
+        """
+        error = self.add_questions(quiz_id, [(question, answers, correct_answer_index)])[0]
+        if error is not None:
+            raise ValueError(error)
+
+    def count_questions(self) -> int:
+        """Return the total number of questions in all stored quizzes."""
+        return sum(info.question_count for info in self.iter_quiz_infos())
+
+    def get_questions(self, quiz_id: int, start: int = 0) -> Optional[List[Question]]:
+        """
+        Get the questions of a quiz from a position onwards.
+
+        Because questions are only ever appended and each one increments the version,
+        get_questions(quiz_id, v) returns exactly the questions added since version v.
+
+        Args:
+            quiz_id: The quiz ID.
+            start: The position of the first question to return.
+
+        Returns:
+            The questions, or None if the quiz does not exist.
+        """
+        quiz = self.get_quiz(quiz_id)
+        if quiz is None:
+            return None
+        return quiz.questions[max(start, 0):]
+
+    def add_listener(self, listener: QuestionsAddedListener) -> None:
+        """
+        Register a function to call after questions are appended to a quiz.
+
+        Args:
+            listener: Called with the quiz ID, the ID of the first new question and the new rows.
+        """
+        self._listeners.append(listener)
+
+    def _notify(self, quiz_id: int, first_question_id: int, rows: List[QuestionRow]) -> None:
+        """Call the listeners for appended questions."""
+        if rows:
+            for listener in self._listeners:
+                listener(quiz_id, first_question_id, rows)
+
+    def __contains__(self, quiz_id: object) -> bool:
+        """Return whether a quiz with the given ID exists."""
+        return isinstance(quiz_id, int) and self.get_quiz_info(quiz_id) is not None
+
+    def close(self) -> None:
+        """Release any resources held by the store."""
+
+
+class MemoryQuizStore(QuizStore):
+    """
+    A store that keeps Quiz objects in a dictionary in the current process.
+    """
+
+    def __init__(self):
+        """Initialize a new, empty MemoryQuizStore."""
+        self.epoch = secrets.token_hex(4)
+        self._listeners = []
+        self._quizzes: Dict[int, Quiz] = {}
+        self._next_id = 0
+        # The latest change number and the quizzes by the number of their latest change, oldest first
+        self._change = 0
+        self._changes: "OrderedDict[int, int]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add_quiz(self, quiz: Quiz) -> int:
+        """Store a quiz and return its ID."""
+        with self._lock:
+            quiz_id = self._next_id
+            self._next_id += 1
+            self._quizzes[quiz_id] = quiz
+            self._record_change(quiz_id)
+        if self._listeners:
+            self._notify(quiz_id, 0, [(q.question, q.answers, q.correct_answer_index) for q in quiz.questions])
+        return quiz_id
+
+    def mount_bank(self, path: str) -> int:
+        """Map a quiz bank file and store it under a new ID, or return the ID it already has."""
+        bank = QuizBank(path)
+        with self._lock:
+            for quiz_id, quiz in self._quizzes.items():
+                if isinstance(quiz, QuizBank) and quiz.path == bank.path:
+                    bank.close()
+                    return quiz_id
+            quiz_id = self._next_id
+            self._next_id += 1
+            self._quizzes[quiz_id] = bank
+            self._record_change(quiz_id)
+            self._bank_mounted(quiz_id, bank)
+        return quiz_id
+
+    def _bank_mounted(self, quiz_id: int, bank: QuizBank) -> None:
+        """Hook called with the lock held after a bank is mounted."""
+
+    def get_quiz(self, quiz_id: int) -> Optional[Quiz]:
+        """Get a quiz by ID."""
+        return self._quizzes.get(quiz_id)
+
+    def get_quiz_info(self, quiz_id: int) -> Optional[QuizInfo]:
+        """Get the metadata of a quiz."""
+        quiz = self._quizzes.get(quiz_id)
+        if quiz is None:
+            return None
+        return QuizInfo(
+            quiz_id, quiz.title, quiz.description, quiz.version, quiz.get_question_count(), quiz.dedup_policy
+        )
+
+    def iter_quiz_infos(self, after: Optional[int] = None, limit: Optional[int] = None) -> Iterator[QuizInfo]:
+        """
+        Iterate over quiz metadata in ID order.
+
+        IDs are allocated sequentially, so resuming after a cursor does not scan the quizzes before it.
+        """
+        start = 0 if after is None else max(after + 1, 0)
+        count = 0
+        for quiz_id in range(start, self._next_id):
+            if limit is not None and count >= limit:
+                return
+            info = self.get_quiz_info(quiz_id)
+            if info is not None:
+                count += 1
+                yield info
+
+    def get_question(self, quiz_id: int, question_id: int) -> Optional[Question]:
+        """Get a single question."""
+        quiz = self._quizzes.get(quiz_id)
+        if quiz is None or not 0 <= question_id < quiz.get_question_count():
+            return None
+        return quiz.get_question(question_id)
+
+    def add_questions(self, quiz_id: int, rows: Iterable[QuestionRow]) -> List[Optional[str]]:
+        """
+        Append questions to a quiz and return the per-row errors.
+
+        Writes come from the API's thread pool, so the appends and the listener calls
+        happen under the lock: a quiz's column arrays are never appended to by two
+        threads at once, and listeners see the questions in ID order.
+        """
+        errors: List[Optional[str]] = []
+        added: List[QuestionRow] = []
+        with self._lock:
+            quiz = self._quizzes[quiz_id]
+            first_question_id = quiz.get_question_count()
+            for row in rows:
+                try:
+                    quiz.add_question(*row)
+                except ValueError as e:
+                    errors.append(str(e))
+                else:
+                    errors.append(None)
+                    added.append(row)
+            if added:
+                self._record_change(quiz_id)
+            self._notify(quiz_id, first_question_id, added)
+        return errors
+
+    def changes_since(self, change: Optional[int]) -> Tuple[int, List[QuizInfo]]:
+        """Get the quizzes changed after a change, walking the change log back from the latest."""
+        with self._lock:
+            latest = self._change
+            if change is None:
+                quiz_ids = list(self._quizzes)
+            else:
+                quiz_ids = []
+                for quiz_id, quiz_change in reversed(self._changes.items()):
+                    if quiz_change <= change:
+                        break
+                    quiz_ids.append(quiz_id)
+        infos = [self.get_quiz_info(quiz_id) for quiz_id in sorted(quiz_ids)]
+        return latest, [info for info in infos if info is not None]
+
+    def _record_change(self, quiz_id: int) -> None:
+        """Number a write to a quiz; called with the lock held."""
+        self._change += 1
+        self._changes[quiz_id] = self._change
+        self._changes.move_to_end(quiz_id)
+
+    def __len__(self) -> int:
+        """Return the number of stored quizzes."""
+        return len(self._quizzes)
+
+
+def create_store(url: str = "memory") -> QuizStore:
+    """
+    Create a quiz store from a storage URL.
+
+    Args:
+        url: "memory", "sqlite:///<path>" or "journal:///<directory>".
+
+    Returns:
+        The store.
+
+    Raises:
+        ValueError: If the URL scheme is not supported.
+    """
+    if url == "memory":
+        return MemoryQuizStore()
+    if url.startswith("sqlite:///"):
+        from quizmaster.services.sqlite_store import SQLiteQuizStore
+        return SQLiteQuizStore(url[len("sqlite:///"):])
+    if url.startswith("journal:///"):
+        from quizmaster.services.journal_store import JournalQuizStore
+        return JournalQuizStore(url[len("journal:///"):])
+    raise ValueError(f"Unsupported storage URL: {url}")
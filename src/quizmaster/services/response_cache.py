@@ -0,0 +1,127 @@
+"""
+Response cache module.
+
+This module defines the ResponseCache class, which keeps serialized API responses
+for quizzes so that repeated reads do not rebuild and re-serialize the same data.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class ResponseCache:
+    """
+    An LRU cache of serialized response bodies with a byte budget.
+
+    Each entry is stored under a key (usually a quiz ID) together with the version
+    of the data it was built from. A lookup with a different version counts as a
+    miss and drops the stale entry, so writers never have to invalidate explicitly.
+
+    Attributes:
+        max_bytes (int): The maximum total size of the cached bodies.
+        hits (int): The number of lookups that returned a cached body.
+        misses (int): The number of lookups that found nothing usable.
+        evictions (int): The number of entries removed to stay within the budget.
+        invalidations (int): The number of entries dropped because they were stale.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Initialize a new ResponseCache.
+
+        Args:
+            max_bytes: The maximum total size in bytes of the cached bodies.
+        """
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._entries: "OrderedDict[Hashable, Tuple[int, bytes]]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, version: int) -> Optional[bytes]:
+        """
+        Look up a cached body.
+
+        Args:
+            key: The cache key.
+            version: The current version of the underlying data.
+
+        Returns:
+            The cached body, or None if there is no entry for this version.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry[0] != version:
+                self._remove(key)
+                self.invalidations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, version: int, body: bytes) -> None:
+        """
+        Store a body in the cache, evicting the least recently used entries if needed.
+
+        Bodies larger than the whole budget are not cached.
+
+        Args:
+            key: The cache key.
+            version: The version of the data the body was built from.
+            body: The serialized body.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if len(body) > self.max_bytes:
+                return
+            self._entries[key] = (version, body)
+            self._size += len(body)
+            while self._size > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the cache statistics.
+
+        Returns:
+            A dictionary with hit and miss counts, the hit rate, eviction counts and memory use.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+    def _remove(self, key: Hashable) -> None:
+        """Remove an entry and update the size. The caller must hold the lock."""
+        _, body = self._entries.pop(key)
+        self._size -= len(body)
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
@@ -0,0 +1,298 @@
+"""
+Sampling module.
+
+This module draws random questions from large question banks without copying them:
+
+- sample_uniform picks K of n positions in O(K);
+- WeightedSampler picks K positions without replacement, each draw proportional to
+  its weight, in O(K log n) from a precomputed Fenwick tree;
+- AliasTable picks positions with replacement in O(1) per draw;
+- reservoir_sample picks K items, uniformly or by weight, from a stream whose length
+  is not known in advance, keeping only K items in memory.
+
+Every function takes a random.Random, so a draw is reproducible from its seed.
+Weights are quantized to integers so the Fenwick tree sums stay exact.
+"""
+
+import heapq
+import math
+import random
+import threading
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, TypeVar
+
+from quizmaster.utils.fenwick import FenwickTree
+
+T = TypeVar("T")
+
+# Weight units per 1.0 of weight
+WEIGHT_SCALE = 1 << 16
+
+
+def weight_units(weight: float) -> int:
+    """
+    Quantize a weight to integer units.
+
+    Raises:
+        ValueError: If the weight is negative or not finite.
+    """
+    if not (weight >= 0 and math.isfinite(weight)):
+        raise ValueError(f"Invalid weight {weight}")
+    if weight == 0:
+        return 0
+    # Keep tiny positive weights drawable
+    return max(1, round(weight * WEIGHT_SCALE))
+
+
+def sample_uniform(n: int, k: int, rng: random.Random) -> List[int]:
+    """
+    Pick k distinct positions out of n uniformly at random in O(k).
+
+    Args:
+        n: The number of positions.
+        k: The number to pick; at most n.
+        rng: The random number generator.
+
+    Returns:
+        The positions in the order drawn.
+
+    Raises:
+        ValueError: If k is negative or greater than n.
+    """
+    return rng.sample(range(n), k)
+
+
+def weights_for_topics(topics: Sequence[str], topic_weights: Mapping[str, float], default: float = 1.0) -> List[float]:
+    """
+    Turn per-topic weights into per-question weights.
+
+    Args:
+        topics: The topic of every question.
+        topic_weights: The weight of each topic.
+        default: The weight of topics not listed.
+
+    Returns:
+        The weight of every question.
+    """
+    return [topic_weights.get(topic, default) for topic in topics]
+
+
+class WeightedSampler:
+    """
+    Draws positions without replacement, each with probability proportional to its weight.
+
+    The weights live in a Fenwick tree built once in O(n). A draw temporarily zeroes
+    the picked positions and restores them afterwards, so the sampler can be reused
+    and never copies the weights.
+    """
+
+    def __init__(self, weights: Sequence[float] = ()):
+        """
+        Initialize a new WeightedSampler.
+
+        Args:
+            weights: The weight of every position.
+
+        Raises:
+            ValueError: If a weight is negative or not finite.
+        """
+        self._tree = FenwickTree.from_counts([weight_units(w) for w in weights])
+        self._size = len(weights)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of positions."""
+        return self._size
+
+    def append(self, weight: float) -> None:
+        """Add a position at the end."""
+        with self._lock:
+            self._tree.add(self._size, weight_units(weight))
+            self._size += 1
+
+    def set_weight(self, index: int, weight: float) -> None:
+        """Change the weight of a position."""
+        with self._lock:
+            self._tree.add(index, weight_units(weight) - self._tree.get(index))
+
+    def sample(self, k: int, rng: random.Random, overrides: Optional[Mapping[int, float]] = None) -> List[int]:
+        """
+        Draw k distinct positions.
+
+        Args:
+            k: The number of positions to draw.
+            rng: The random number generator.
+            overrides: Weights to use instead of the stored ones for this draw only.
+
+        Returns:
+            The positions in the order drawn.
+
+        Raises:
+            ValueError: If an override is invalid or fewer than k positions have a positive weight.
+        """
+        with self._lock:
+            tree = self._tree
+            changes: List[Tuple[int, int]] = []
+            try:
+                for index, weight in (overrides or {}).items():
+                    if not 0 <= index < self._size:
+                        raise ValueError(f"Question {index} does not exist")
+                    delta = weight_units(weight) - tree.get(index)
+                    tree.add(index, delta)
+                    changes.append((index, delta))
+
+                picked = []
+                for _ in range(k):
+                    if tree.total <= 0:
+                        raise ValueError(f"Only {len(picked)} questions have a positive weight")
+                    index = tree.find(rng.randrange(tree.total))
+                    units = tree.get(index)
+                    tree.add(index, -units)
+                    changes.append((index, -units))
+                    picked.append(index)
+                return picked
+            finally:
+                for index, delta in reversed(changes):
+                    tree.add(index, -delta)
+
+
+class AliasTable:
+    """
+    Draws positions with replacement in O(1) each, using Vose's alias method.
+
+    Building the table takes O(n); use it when the same weights are drawn from many times.
+    """
+
+    def __init__(self, weights: Sequence[float]):
+        """
+        Build the table.
+
+        Args:
+            weights: The weight of every position.
+
+        Raises:
+            ValueError: If no weight is positive or a weight is invalid.
+        """
+        n = len(weights)
+        total = sum(weight_units(w) for w in weights)
+        if total <= 0:
+            raise ValueError("At least one weight must be positive")
+
+        scaled = [weight_units(w) * n / total for w in weights]
+        self._probability = [1.0] * n
+        self._alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self._probability[less] = scaled[less]
+            self._alias[less] = more
+            scaled[more] -= 1.0 - scaled[less]
+            (small if scaled[more] < 1.0 else large).append(more)
+
+    def __len__(self) -> int:
+        """Return the number of positions."""
+        return len(self._alias)
+
+    def sample(self, k: int, rng: random.Random) -> List[int]:
+        """
+        Draw k positions, possibly repeating.
+
+        Args:
+            k: The number of draws.
+            rng: The random number generator.
+
+        Returns:
+            The positions drawn.
+        """
+        n = len(self._alias)
+        probability = self._probability
+        alias = self._alias
+        picked = []
+        for _ in range(k):
+            column = rng.randrange(n)
+            picked.append(column if rng.random() < probability[column] else alias[column])
+        return picked
+
+
+def reservoir_sample(
+    items: Iterable[T], k: int, rng: random.Random, weight: Optional[Callable[[T], float]] = None
+) -> List[T]:
+    """
+    Pick k items from a stream of unknown length, keeping only k items in memory.
+
+    Without a weight function every item is equally likely (Algorithm R). With one,
+    items are picked without replacement with probability proportional to their
+    weight (Efraimidis-Spirakis A-Res).
+
+    Args:
+        items: The stream.
+        k: The number of items to keep.
+        rng: The random number generator.
+        weight: The weight of an item; items with weight 0 are never picked.
+
+    Returns:
+        The picked items; all of them if the stream has fewer than k.
+    """
+    if k <= 0:
+        return []
+
+    if weight is None:
+        reservoir: List[T] = []
+        for seen, item in enumerate(items):
+            if seen < k:
+                reservoir.append(item)
+            else:
+                slot = rng.randrange(seen + 1)
+                if slot < k:
+                    reservoir[slot] = item
+        return reservoir
+
+    # Keep the k items with the largest key u ** (1 / w), compared in log space
+    heap: List[Tuple[float, int, T]] = []
+    for seen, item in enumerate(items):
+        w = weight(item)
+        if w <= 0:
+            continue
+        key = math.log(1.0 - rng.random()) / w
+        if len(heap) < k:
+            heapq.heappush(heap, (key, seen, item))
+        elif key > heap[0][0]:
+            heapq.heapreplace(heap, (key, seen, item))
+    return [item for _, _, item in sorted(heap, reverse=True)]
+
+
+class SamplerRegistry:
+    """
+    Keeps a WeightedSampler per quiz, with every question at weight 1.
+
+    Quizzes only grow, so a sampler is extended with the new questions instead of rebuilt.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._samplers: Dict[int, WeightedSampler] = {}
+        self._lock = threading.Lock()
+
+    def get(self, quiz_id: int, question_count: int) -> WeightedSampler:
+        """
+        Get the sampler of a quiz, covering its first question_count questions.
+
+        Args:
+            quiz_id: The quiz ID.
+            question_count: The current number of questions of the quiz.
+
+        Returns:
+            The sampler.
+        """
+        with self._lock:
+            sampler = self._samplers.get(quiz_id)
+            if sampler is None:
+                sampler = self._samplers[quiz_id] = WeightedSampler([1.0] * question_count)
+            while len(sampler) < question_count:
+                sampler.append(1.0)
+            return sampler
+
+    def clear(self) -> None:
+        """Drop all samplers."""
+        with self._lock:
+            self._samplers.clear()
@@ -0,0 +1,286 @@
+"""
+Search module.
+
+This module defines SearchIndex, an inverted index over question and answer text that
+is updated incrementally as questions are added and ranks matches with BM25.
+"""
+
+import math
+import re
+import threading
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from typing import Dict, List, Optional, Set, Tuple
+
+from quizmaster.models.quiz_bank import QuizBank
+from quizmaster.services.quiz_store import QuestionRow, QuizInfo, QuizStore
+
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase word tokens.
+
+    Args:
+        text: The text to tokenize.
+
+    Returns:
+        The tokens, in order of appearance.
+    """
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def make_doc_id(quiz_id: int, question_id: int) -> int:
+    """Pack a quiz ID and question ID into a single document ID."""
+    return (quiz_id << 32) | question_id
+
+
+def split_doc_id(doc_id: int) -> Tuple[int, int]:
+    """Unpack a document ID into its quiz ID and question ID."""
+    return doc_id >> 32, doc_id & 0xFFFFFFFF
+
+
+class SearchIndex:
+    """
+    An inverted index over the text of questions and their answers.
+
+    Each term maps to per-quiz posting lists: three parallel arrays holding the IDs of
+    the questions that contain the term, the term's frequency in each and each
+    question's length. A search restricted to one quiz reads only that quiz's postings,
+    and the BM25 sum over all postings of a query is computed with NumPy. The
+    vocabulary is also kept sorted, so prefixes can be expanded with a binary search;
+    new terms are appended and merged into the sorted list on the next prefix lookup.
+
+    Every quiz's indexed questions are a prefix of its questions. Questions that arrive
+    out of order are left to index_store, which indexes what a store holds beyond that
+    prefix, so an index also catches up with questions added by other processes. It only
+    looks at quizzes the store reports as changed since its last catch-up, so catching up
+    costs nothing when no quiz has changed.
+
+    Attributes:
+        max_prefix_terms (int): The maximum number of terms a prefix expands to.
+    """
+
+    def __init__(self, max_prefix_terms: int = 50):
+        """
+        Initialize a new, empty SearchIndex.
+
+        Args:
+            max_prefix_terms: The maximum number of terms a prefix expands to.
+        """
+        self.max_prefix_terms = max_prefix_terms
+        self._postings: Dict[str, Dict[int, Tuple[array, array, array]]] = {}
+        self._document_counts: Dict[str, int] = {}
+        self._indexed: Dict[int, int] = {}
+        self._banks: Set[int] = set()
+        # The store change number index_store last caught up to, None before the first catch-up
+        self._change: Optional[int] = None
+        self._doc_count = 0
+        self._total_length = 0
+        self._vocabulary: List[str] = []
+        self._new_terms: List[str] = []
+        self._lock = threading.Lock()
+
+    def add_questions(self, quiz_id: int, first_question_id: int, rows: List[QuestionRow]) -> None:
+        """
+        Index newly appended questions.
+
+        The signature matches QuizStore listeners, so the index can be registered with
+        QuizStore.add_listener. Questions that are already indexed are skipped, and rows
+        after a gap are left for index_store.
+
+        Args:
+            quiz_id: The quiz ID.
+            first_question_id: The ID of the first question in rows.
+            rows: The appended questions.
+        """
+        with self._lock:
+            indexed = self._indexed.get(quiz_id, 0)
+            for offset, (question, answers, _) in enumerate(rows):
+                question_id = first_question_id + offset
+                if question_id < indexed:
+                    continue
+                if question_id > indexed:
+                    break
+                tokens = tokenize(question)
+                for answer in answers:
+                    tokens.extend(tokenize(answer))
+                length = min(len(tokens), 0xFFFF)
+
+                for term, frequency in Counter(tokens).items():
+                    quizzes = self._postings.get(term)
+                    if quizzes is None:
+                        quizzes = self._postings[term] = {}
+                        self._new_terms.append(term)
+                    postings = quizzes.get(quiz_id)
+                    if postings is None:
+                        postings = quizzes[quiz_id] = (array("I"), array("H"), array("H"))
+                    postings[0].append(question_id)
+                    postings[1].append(min(frequency, 0xFFFF))
+                    postings[2].append(length)
+                    self._document_counts[term] = self._document_counts.get(term, 0) + 1
+
+                indexed += 1
+                self._doc_count += 1
+                self._total_length += length
+            self._indexed[quiz_id] = indexed
+
+    def index_store(self, store: QuizStore, quiz_id: Optional[int] = None) -> None:
+        """
+        Index the questions a store holds that the index has not seen yet.
+
+        Like DedupRegistry.index_for, this compares each quiz's question count with
+        what the index holds, so only metadata is read for quizzes that are up to date.
+        Without quiz_id, only the quizzes changed since the last catch-up are compared
+        (see QuizStore.changes_since). Quiz banks are served straight from their files
+        and are not indexed.
+
+        Args:
+            store: The store to index.
+            quiz_id: Only catch up with this quiz.
+        """
+        if quiz_id is not None:
+            self._index_infos(store, [store.get_quiz_info(quiz_id)])
+            return
+        change, infos = store.changes_since(self._change)
+        self._index_infos(store, infos)
+        with self._lock:
+            if self._change is None or change > self._change:
+                self._change = change
+
+    def _index_infos(self, store: QuizStore, infos: List[Optional[QuizInfo]]) -> None:
+        """Index the questions of the given quizzes that the index has not seen yet."""
+        for info in infos:
+            if info is None or info.id in self._banks:
+                continue
+            start = self._indexed.get(info.id, 0)
+            if start >= info.question_count:
+                continue
+            if start == 0:
+                quiz = store.get_quiz(info.id)
+                if isinstance(quiz, QuizBank):
+                    with self._lock:
+                        self._banks.add(info.id)
+                    continue
+                questions = quiz.questions if quiz is not None else []
+            else:
+                questions = store.get_questions(info.id, start) or []
+            self.add_questions(info.id, start, [
+                (q.question, q.answers, q.correct_answer_index) for q in questions
+            ])
+
+    def search(
+        self, query: str, limit: int = 20, prefix: bool = True, quiz_id: Optional[int] = None
+    ) -> List[Tuple[int, int, float]]:
+        """
+        Find the questions that best match a query.
+
+        Args:
+            query: The search text.
+            limit: The maximum number of results.
+            prefix: Whether the last query word also matches longer words starting with it.
+            quiz_id: Only return questions of this quiz.
+
+        Returns:
+            Tuples of quiz ID, question ID and score, best match first; equal scores are
+            ordered by quiz ID and question ID.
+        """
+        # Imported here so importing the API does not load NumPy
+        import numpy as np
+
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+
+        with self._lock:
+            terms = [[token] for token in tokens]
+            if prefix:
+                terms[-1] = self._expand_prefix(tokens[-1])
+
+            average_length = self._total_length / self._doc_count if self._doc_count else 1.0
+            parts = [
+                self._score_term(np, term, average_length, quiz_id)
+                for alternatives in terms for term in alternatives if term in self._postings
+            ]
+        parts = [part for part in parts if part is not None]
+        if not parts:
+            return []
+
+        doc_ids, inverse = np.unique(np.concatenate([doc_ids for doc_ids, _ in parts]), return_inverse=True)
+        scores = np.bincount(inverse, weights=np.concatenate([weights for _, weights in parts]))
+        if len(scores) > limit:
+            best = np.argpartition(-scores, limit - 1)[:limit]
+            doc_ids, scores = doc_ids[best], scores[best]
+        order = np.lexsort((doc_ids, -scores))
+        return [
+            (*split_doc_id(int(doc_id)), float(score))
+            for doc_id, score in zip(doc_ids[order], scores[order])
+        ]
+
+    def _score_term(self, np, term: str, average_length: float, quiz_id: Optional[int]):
+        """
+        Get the document IDs containing a term and the term's BM25 contribution to each.
+
+        The arrays are copied, so the postings can grow once the lock is released. The
+        caller must hold the lock.
+
+        Returns:
+            A tuple of document IDs and scores, or None if no document matches.
+        """
+        quizzes = self._postings[term]
+        selected = [quiz_id] if quiz_id is not None else list(quizzes)
+        doc_ids, frequencies, lengths = [], [], []
+        for selected_id in selected:
+            postings = quizzes.get(selected_id)
+            if postings is None:
+                continue
+            doc_ids.append(np.frombuffer(postings[0], dtype=np.uint32).astype(np.uint64) | (selected_id << 32))
+            frequencies.append(np.frombuffer(postings[1], dtype=np.uint16))
+            lengths.append(np.frombuffer(postings[2], dtype=np.uint16))
+        if not doc_ids:
+            return None
+
+        document_count = self._document_counts[term]
+        idf = math.log(1 + (self._doc_count - document_count + 0.5) / (document_count + 0.5))
+        frequency = np.concatenate(frequencies).astype(np.float64)
+        norm = K1 * (1 - B + B * np.concatenate(lengths) / average_length)
+        return np.concatenate(doc_ids), idf * frequency * (K1 + 1) / (frequency + norm)
+
+    def _expand_prefix(self, prefix: str) -> List[str]:
+        """Get the indexed terms starting with a prefix. The caller must hold the lock."""
+        if self._new_terms:
+            # The vocabulary is a sorted run followed by new terms, which Timsort merges cheaply
+            self._vocabulary.extend(self._new_terms)
+            self._vocabulary.sort()
+            self._new_terms.clear()
+
+        matches = []
+        start = bisect_left(self._vocabulary, prefix)
+        for term in self._vocabulary[start:start + self.max_prefix_terms]:
+            if not term.startswith(prefix):
+                break
+            matches.append(term)
+        return matches
+
+    def clear(self) -> None:
+        """Remove everything from the index."""
+        with self._lock:
+            self._postings.clear()
+            self._document_counts.clear()
+            self._indexed.clear()
+            self._banks.clear()
+            self._doc_count = 0
+            self._total_length = 0
+            self._vocabulary.clear()
+            self._new_terms.clear()
+
+    def __len__(self) -> int:
+        """Return the number of indexed questions."""
+        return self._doc_count
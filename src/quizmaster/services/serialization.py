@@ -0,0 +1,132 @@
+"""
+Serialization module.
+
+This module turns quizzes straight into JSON bytes without building Pydantic models,
+and compresses response bodies with the best encoding a client accepts.
+
+orjson and brotli are optional: without orjson the standard json module is used, and
+without brotli only gzip is offered. Install both with ``pip install quizmaster[fast]``.
+"""
+
+import gzip
+import json
+from typing import Any, Optional
+
+from quizmaster.models.quiz import Quiz
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+
+ENCODING_GZIP = "gzip"
+ENCODING_BROTLI = "br"
+
+
+def dumps(data: Any) -> bytes:
+    """
+    Serialize plain data (dicts, lists, strings, numbers) to compact UTF-8 JSON.
+
+    The output is byte-for-byte the same with and without orjson.
+
+    Args:
+        data: The data to serialize.
+
+    Returns:
+        The JSON bytes.
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+def quiz_to_json(quiz: Quiz, quiz_id: int, version: Optional[int] = None) -> bytes:
+    """
+    Serialize a quiz with the same schema and key order as the API's QuizModel.
+
+    Args:
+        quiz: The quiz.
+        quiz_id: The quiz ID.
+        version: Serialize the quiz as it was at this version, i.e. its first `version`
+            questions, even if more were appended since. Defaults to the current version.
+
+    Returns:
+        The JSON bytes.
+    """
+    if version is None:
+        version = quiz.version
+    questions = []
+    for question_id, q in enumerate(quiz.questions[:version]):
+        correct_answer_index = q.correct_answer_index
+        questions.append({
+            "id": question_id,
+            "text": q.question,
+            "answers": [
+                {"text": answer, "is_correct": i == correct_answer_index}
+                for i, answer in enumerate(q.answers)
+            ]
+        })
+    return dumps({
+        "id": quiz_id,
+        "title": quiz.title,
+        "description": quiz.description,
+        "version": version,
+        "questions": questions
+    })
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Pick a content encoding from an Accept-Encoding header.
+
+    Brotli is preferred when it is installed, then gzip. Codings with q=0 are refused.
+
+    Args:
+        accept_encoding: The header value, or None.
+
+    Returns:
+        ENCODING_BROTLI, ENCODING_GZIP or None for an uncompressed body.
+    """
+    if not accept_encoding:
+        return None
+
+    accepted = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip().lower()] = quality
+
+    wildcard = accepted.get("*", 0.0)
+    if brotli is not None and accepted.get(ENCODING_BROTLI, wildcard) > 0:
+        return ENCODING_BROTLI
+    if accepted.get(ENCODING_GZIP, wildcard) > 0:
+        return ENCODING_GZIP
+    return None
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """
+    Compress a body with a content encoding.
+
+    Args:
+        body: The uncompressed body.
+        encoding: ENCODING_BROTLI or ENCODING_GZIP.
+
+    Returns:
+        The compressed body.
+    """
+    if encoding == ENCODING_BROTLI:
+        return brotli.compress(body, quality=5)
+    return gzip.compress(body, compresslevel=6, mtime=0)
@@ -0,0 +1,206 @@
+"""
+Quiz session module.
+
+This module defines the Attempt record and the SessionEngine, which tracks server-side
+quiz attempts: which question an attempt is on, which questions were answered and
+which were answered correctly. Idle attempts expire after a time-to-live.
+"""
+
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Iterator, Optional, Tuple
+
+
+class Attempt:
+    """
+    A single quiz attempt.
+
+    The answered and correct sets are stored as integer bitsets, bit i standing for
+    question i, so an attempt needs only a few small objects regardless of how it is used.
+
+    Attributes:
+        quiz_id (int): The ID of the quiz being attempted.
+        cursor (int): The index of the next question to answer.
+        answered (int): Bitset of the answered questions.
+        correct (int): Bitset of the correctly answered questions.
+        last_seen (float): The clock time of the last access.
+        user_id (Optional[str]): The user making the attempt, if known.
+        adaptive (Optional[Any]): The ability estimate of an adaptive attempt, which
+            picks its questions instead of going in order; None otherwise.
+    """
+
+    __slots__ = ("quiz_id", "cursor", "answered", "correct", "last_seen", "user_id", "adaptive")
+
+    def __init__(self, quiz_id: int, last_seen: float, user_id: Optional[str] = None):
+        """
+        Initialize a new Attempt.
+
+        Args:
+            quiz_id: The ID of the quiz being attempted.
+            last_seen: The current clock time.
+            user_id: The user making the attempt, if known.
+        """
+        self.quiz_id = quiz_id
+        self.user_id = user_id
+        self.cursor = 0
+        self.answered = 0
+        self.correct = 0
+        self.last_seen = last_seen
+        self.adaptive: Optional[Any] = None
+
+    def record(self, is_correct: bool) -> None:
+        """
+        Record the answer to the current question and move to the next one.
+
+        Args:
+            is_correct: Whether the answer was correct.
+        """
+        bit = 1 << self.cursor
+        self.answered |= bit
+        if is_correct:
+            self.correct |= bit
+        self.cursor += 1
+
+    def responses(self) -> Iterator[Tuple[int, bool]]:
+        """
+        Iterate over the answered questions.
+
+        Yields:
+            The question ID and whether it was answered correctly, in question order.
+        """
+        answered = self.answered
+        while answered:
+            bit = answered & -answered
+            yield bit.bit_length() - 1, bool(self.correct & bit)
+            answered ^= bit
+
+    @property
+    def answered_count(self) -> int:
+        """The number of answered questions."""
+        return bin(self.answered).count("1")
+
+    @property
+    def score(self) -> int:
+        """The number of correctly answered questions."""
+        return bin(self.correct).count("1")
+
+
+class SessionEngine:
+    """
+    Holds active quiz attempts and expires the idle ones.
+
+    Attempts live in an OrderedDict ordered by last access. Every access moves the
+    attempt to the end, so the attempts that expire first are always at the front and
+    expiry only ever looks at the oldest entries. Starting, reading, advancing and
+    finishing an attempt are all O(1) (amortized for expiry).
+
+    Attempts are kept in the current process; with several workers, clients must be
+    routed to the worker that started their attempt.
+
+    Attributes:
+        ttl (float): Seconds of inactivity after which an attempt expires.
+        max_sessions (int): The maximum number of attempts; the least recently used is
+            dropped when it is exceeded.
+        expired (int): The number of attempts removed because they were idle or over capacity.
+    """
+
+    def __init__(self, ttl: float = 1800.0, max_sessions: int = 1_000_000, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize a new SessionEngine.
+
+        Args:
+            ttl: Seconds of inactivity after which an attempt expires.
+            max_sessions: The maximum number of attempts held at once.
+            clock: The time source, replaceable in tests.
+        """
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self.expired = 0
+        self._clock = clock
+        self._sessions: "OrderedDict[str, Attempt]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def start(self, quiz_id: int, user_id: Optional[str] = None) -> Tuple[str, Attempt]:
+        """
+        Start a new attempt.
+
+        Args:
+            quiz_id: The ID of the quiz to attempt.
+            user_id: The user making the attempt, if known.
+
+        Returns:
+            The new session ID and the attempt.
+        """
+        now = self._clock()
+        session_id = secrets.token_urlsafe(12)
+        attempt = Attempt(quiz_id, now, user_id)
+        with self._lock:
+            self._expire(now)
+            self._sessions[session_id] = attempt
+            if len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+                self.expired += 1
+        return session_id, attempt
+
+    def get(self, session_id: str) -> Optional[Attempt]:
+        """
+        Get an active attempt and mark it as used.
+
+        Args:
+            session_id: The session ID.
+
+        Returns:
+            The attempt, or None if it does not exist or has expired.
+        """
+        now = self._clock()
+        with self._lock:
+            self._expire(now)
+            attempt = self._sessions.get(session_id)
+            if attempt is not None:
+                attempt.last_seen = now
+                self._sessions.move_to_end(session_id)
+            return attempt
+
+    def finish(self, session_id: str) -> Optional[Attempt]:
+        """
+        End an attempt and remove it.
+
+        Args:
+            session_id: The session ID.
+
+        Returns:
+            The finished attempt, or None if it does not exist or has expired.
+        """
+        now = self._clock()
+        with self._lock:
+            self._expire(now)
+            return self._sessions.pop(session_id, None)
+
+    def expire(self) -> int:
+        """
+        Remove all attempts that have been idle longer than the TTL.
+
+        Returns:
+            The number of attempts removed.
+        """
+        with self._lock:
+            return self._expire(self._clock())
+
+    def _expire(self, now: float) -> int:
+        """Remove idle attempts from the front of the queue. The caller must hold the lock."""
+        removed = 0
+        deadline = now - self.ttl
+        while self._sessions:
+            oldest = next(iter(self._sessions.values()))
+            if oldest.last_seen > deadline:
+                break
+            self._sessions.popitem(last=False)
+            removed += 1
+        self.expired += removed
+        return removed
+
+    def __len__(self) -> int:
+        """Return the number of active attempts."""
+        return len(self._sessions)
@@ -0,0 +1,409 @@
+"""
+SQLite quiz store module.
+
+This module defines SQLiteQuizStore, a QuizStore backed by a SQLite database file,
+so quizzes survive restarts and catalogues can grow beyond available memory.
+"""
+
+import json
+import queue
+import secrets
+import sqlite3
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from quizmaster.models.quiz import Question, Quiz
+from quizmaster.models.quiz_bank import QuizBank
+from quizmaster.services.quiz_store import QuestionRow, QuizInfo, QuizStore
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS quizzes (
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL,
+    version INTEGER NOT NULL DEFAULT 0,
+    question_count INTEGER NOT NULL DEFAULT 0,
+    dedup_policy TEXT NOT NULL DEFAULT 'off',
+    bank_path TEXT,
+    changed INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS questions (
+    quiz_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    answers TEXT NOT NULL,
+    correct_answer_index INTEGER NOT NULL,
+    PRIMARY KEY (quiz_id, position)
+) WITHOUT ROWID;
+"""
+
+# Statements are kept as module constants so every pooled connection reuses its
+# prepared statement from sqlite3's statement cache.
+SELECT_INFO = "SELECT id, title, description, version, question_count, dedup_policy FROM quizzes WHERE id = ?"
+SELECT_INFOS = (
+    "SELECT id, title, description, version, question_count, dedup_policy FROM quizzes "
+    "WHERE id > ? ORDER BY id LIMIT ?"
+)
+SELECT_QUESTION = "SELECT text, answers, correct_answer_index FROM questions WHERE quiz_id = ? AND position = ?"
+SELECT_QUESTIONS = (
+    "SELECT text, answers, correct_answer_index FROM questions "
+    "WHERE quiz_id = ? AND position >= ? ORDER BY position"
+)
+SELECT_COUNT = "SELECT question_count, bank_path FROM quizzes WHERE id = ?"
+SELECT_BANK = "SELECT bank_path FROM quizzes WHERE id = ?"
+SELECT_BANK_ID = "SELECT id FROM quizzes WHERE bank_path = ?"
+INSERT_BANK = (
+    "INSERT INTO quizzes (id, title, description, version, question_count, dedup_policy, bank_path, changed) "
+    "VALUES ((SELECT COALESCE(MAX(id), -1) + 1 FROM quizzes), ?, ?, ?, ?, ?, ?, "
+    "(SELECT value FROM meta WHERE key = 'change'))"
+)
+INSERT_QUIZ = (
+    "INSERT INTO quizzes (id, title, description, dedup_policy, changed) "
+    "VALUES ((SELECT COALESCE(MAX(id), -1) + 1 FROM quizzes), ?, ?, ?, (SELECT value FROM meta WHERE key = 'change'))"
+)
+INSERT_QUESTION = (
+    "INSERT INTO questions (quiz_id, position, text, answers, correct_answer_index) VALUES (?, ?, ?, ?, ?)"
+)
+UPDATE_COUNTS = (
+    "UPDATE quizzes SET version = version + ?, question_count = question_count + ?, "
+    "changed = (SELECT value FROM meta WHERE key = 'change') WHERE id = ?"
+)
+# Every write transaction takes the next change number, and the quizzes it touches record it
+NEXT_CHANGE = "UPDATE meta SET value = CAST(value AS INTEGER) + 1 WHERE key = 'change'"
+SELECT_CHANGE = "SELECT CAST(value AS INTEGER) FROM meta WHERE key = 'change'"
+# Not ordered in SQL, which would make SQLite walk the primary key instead of the changed index
+SELECT_CHANGED_INFOS = (
+    "SELECT id, title, description, version, question_count, dedup_policy FROM quizzes WHERE changed > ?"
+)
+
+
+class SQLiteQuizStore(QuizStore):
+    """
+    A store that keeps quizzes in a SQLite database.
+
+    The database runs in WAL mode so readers never block the writer, and a fixed pool
+    of connections is shared between threads. Quiz and question lookups go through
+    primary-key indexes, so their cost does not depend on the size of the catalogue.
+    Recently loaded quizzes are kept in a small LRU keyed by version.
+
+    Several processes may open the same file: quiz IDs are allocated inside a write
+    transaction, and every read sees the latest committed version.
+    """
+
+    def __init__(self, path: str, pool_size: int = 4, quiz_cache_size: int = 32, timeout: float = 30.0):
+        """
+        Initialize a new SQLiteQuizStore, creating the schema if needed.
+
+        Args:
+            path: The database file path. Every pooled connection opens it separately,
+                so ":memory:" cannot be used (use MemoryQuizStore instead).
+            pool_size: The number of pooled connections.
+            quiz_cache_size: The number of loaded quizzes kept in memory.
+            timeout: How long to wait for a lock held by another connection, in seconds.
+        """
+        self.path = path
+        self._listeners = []
+        self._timeout = timeout
+        self._pool: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        self._connections: List[sqlite3.Connection] = []
+        for _ in range(pool_size):
+            connection = self._connect()
+            self._connections.append(connection)
+            self._pool.put(connection)
+
+        # Mounted quiz banks opened by this process; the paths live in the database
+        self._banks: Dict[int, QuizBank] = {}
+        self._quiz_cache: "OrderedDict[int, Quiz]" = OrderedDict()
+        self._quiz_cache_size = quiz_cache_size
+        self._cache_lock = threading.Lock()
+
+        with self._connection() as connection:
+            connection.executescript(SCHEMA)
+            connection.execute("BEGIN IMMEDIATE")
+            columns = {row[1] for row in connection.execute("PRAGMA table_info(quizzes)")}
+            if "dedup_policy" not in columns:
+                # Databases created before per-quiz dedup policies
+                connection.execute("ALTER TABLE quizzes ADD COLUMN dedup_policy TEXT NOT NULL DEFAULT 'off'")
+            if "bank_path" not in columns:
+                # Databases created before quiz banks could be mounted
+                connection.execute("ALTER TABLE quizzes ADD COLUMN bank_path TEXT")
+            if "changed" not in columns:
+                # Databases created before writes were numbered; their quizzes count as change 0
+                connection.execute("ALTER TABLE quizzes ADD COLUMN changed INTEGER NOT NULL DEFAULT 0")
+            connection.execute("CREATE INDEX IF NOT EXISTS quizzes_changed ON quizzes (changed)")
+            connection.execute(
+                "INSERT OR IGNORE INTO meta (key, value) VALUES ('epoch', ?)", (secrets.token_hex(4),)
+            )
+            connection.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('change', '0')")
+            connection.execute("COMMIT")
+            self.epoch = connection.execute("SELECT value FROM meta WHERE key = 'epoch'").fetchone()[0]
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection configured for concurrent use."""
+        connection = sqlite3.connect(
+            self.path,
+            timeout=self._timeout,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=64
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection from the pool."""
+        connection = self._pool.get()
+        try:
+            yield connection
+        finally:
+            self._pool.put(connection)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection and run a write transaction on it."""
+        with self._connection() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield connection
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+
+    def add_quiz(self, quiz: Quiz) -> int:
+        """Store a quiz with its questions and return its ID."""
+        rows = [(q.question, q.answers, q.correct_answer_index) for q in quiz.questions]
+        with self._transaction() as connection:
+            connection.execute(NEXT_CHANGE)
+            quiz_id = connection.execute(
+                INSERT_QUIZ, (quiz.title, quiz.description, quiz.dedup_policy)
+            ).lastrowid
+            self._insert_questions(connection, quiz_id, 0, rows)
+        self._notify(quiz_id, 0, rows)
+        return quiz_id
+
+    def mount_bank(self, path: str) -> int:
+        """
+        Record a quiz bank's path under a new quiz ID, or return the ID it already has.
+
+        Every process using the database maps the file itself when the quiz is first
+        read, so workers share the bank's pages.
+        """
+        bank = QuizBank(path)
+        with self._transaction() as connection:
+            row = connection.execute(SELECT_BANK_ID, (bank.path,)).fetchone()
+            if row is not None:
+                quiz_id = row[0]
+            else:
+                connection.execute(NEXT_CHANGE)
+                quiz_id = connection.execute(INSERT_BANK, (
+                    bank.title, bank.description, bank.version, bank.get_question_count(), bank.dedup_policy, bank.path
+                )).lastrowid
+        with self._cache_lock:
+            if quiz_id in self._banks:
+                bank.close()
+            else:
+                self._banks[quiz_id] = bank
+        return quiz_id
+
+    def _bank(self, quiz_id: int, path: Optional[str] = None) -> Optional[QuizBank]:
+        """
+        Get the mapped bank of a quiz, mapping it on first use.
+
+        Args:
+            quiz_id: The quiz ID.
+            path: The quiz's bank_path if already read, to skip the lookup.
+
+        Returns:
+            The bank, or None if the quiz is not a mounted bank.
+        """
+        bank = self._banks.get(quiz_id)
+        if bank is not None:
+            return bank
+        if path is None:
+            with self._connection() as connection:
+                row = connection.execute(SELECT_BANK, (quiz_id,)).fetchone()
+            if row is None or row[0] is None:
+                return None
+            path = row[0]
+        bank = QuizBank(path)
+        with self._cache_lock:
+            if quiz_id in self._banks:
+                bank.close()
+                return self._banks[quiz_id]
+            self._banks[quiz_id] = bank
+        return bank
+
+    def get_quiz(self, quiz_id: int) -> Optional[Quiz]:
+        """Get a quiz by ID, loading it from the database unless a current copy is cached."""
+        info = self.get_quiz_info(quiz_id)
+        if info is None:
+            return None
+        bank = self._bank(quiz_id)
+        if bank is not None:
+            return bank
+
+        with self._cache_lock:
+            quiz = self._quiz_cache.get(quiz_id)
+            if quiz is not None and quiz.version == info.version:
+                self._quiz_cache.move_to_end(quiz_id)
+                return quiz
+
+        quiz = Quiz(info.title, info.description, info.dedup_policy)
+        with self._connection() as connection:
+            # Read everything in one transaction so the rows match a single version
+            connection.execute("BEGIN")
+            try:
+                info = self._row_to_info(connection.execute(SELECT_INFO, (quiz_id,)).fetchone())
+                for text, answers, correct_answer_index in connection.execute(SELECT_QUESTIONS, (quiz_id, 0)):
+                    quiz.add_question(text, json.loads(answers), correct_answer_index)
+            finally:
+                connection.execute("COMMIT")
+        quiz.version = info.version
+
+        with self._cache_lock:
+            self._quiz_cache[quiz_id] = quiz
+            self._quiz_cache.move_to_end(quiz_id)
+            while len(self._quiz_cache) > self._quiz_cache_size:
+                self._quiz_cache.popitem(last=False)
+        return quiz
+
+    def get_quiz_info(self, quiz_id: int) -> Optional[QuizInfo]:
+        """Get the metadata of a quiz."""
+        with self._connection() as connection:
+            row = connection.execute(SELECT_INFO, (quiz_id,)).fetchone()
+        return None if row is None else self._row_to_info(row)
+
+    def iter_quiz_infos(self, after: Optional[int] = None, limit: Optional[int] = None) -> Iterator[QuizInfo]:
+        """
+        Iterate over quiz metadata in ID order.
+
+        Rows are fetched in pages through the primary key, so memory use stays bounded.
+        """
+        cursor = -1 if after is None else after
+        remaining = limit
+        page_size = 500
+        while remaining is None or remaining > 0:
+            size = page_size if remaining is None else min(page_size, remaining)
+            with self._connection() as connection:
+                rows = connection.execute(SELECT_INFOS, (cursor, size)).fetchall()
+            for row in rows:
+                yield self._row_to_info(row)
+            if len(rows) < size:
+                return
+            cursor = rows[-1][0]
+            if remaining is not None:
+                remaining -= len(rows)
+
+    def get_question(self, quiz_id: int, question_id: int) -> Optional[Question]:
+        """Get a single question through the (quiz_id, position) index."""
+        bank = self._banks.get(quiz_id)
+        if bank is None:
+            with self._connection() as connection:
+                row = connection.execute(SELECT_QUESTION, (quiz_id, question_id)).fetchone()
+            if row is not None:
+                return Question(row[0], json.loads(row[1]), row[2])
+            bank = self._bank(quiz_id)
+            if bank is None:
+                return None
+        if not 0 <= question_id < bank.get_question_count():
+            return None
+        return bank.get_question(question_id)
+
+    def get_questions(self, quiz_id: int, start: int = 0) -> Optional[List[Question]]:
+        """Get the questions from a position onwards through the (quiz_id, position) index."""
+        with self._connection() as connection:
+            connection.execute("BEGIN")
+            try:
+                row = connection.execute(SELECT_COUNT, (quiz_id,)).fetchone()
+                if row is None:
+                    return None
+                rows = connection.execute(SELECT_QUESTIONS, (quiz_id, max(start, 0))).fetchall()
+            finally:
+                connection.execute("COMMIT")
+        if row[1] is not None:
+            return self._bank(quiz_id, row[1]).questions[max(start, 0):]
+        return [Question(text, json.loads(answers), correct_answer_index) for text, answers, correct_answer_index in rows]
+
+    def add_questions(self, quiz_id: int, rows: Iterable[QuestionRow]) -> List[Optional[str]]:
+        """Append questions to a quiz in one transaction and return the per-row errors."""
+        with self._transaction() as connection:
+            row = connection.execute(SELECT_COUNT, (quiz_id,)).fetchone()
+            if row is None:
+                raise KeyError(quiz_id)
+            errors: List[Optional[str]] = []
+            valid: List[QuestionRow] = []
+            for question, answers, correct_answer_index in rows:
+                try:
+                    if row[1] is not None:
+                        raise ValueError("Quiz banks are read-only")
+                    Quiz.validate_question(answers, correct_answer_index)
+                except ValueError as e:
+                    errors.append(str(e))
+                else:
+                    errors.append(None)
+                    valid.append((question, answers, correct_answer_index))
+            if valid:
+                connection.execute(NEXT_CHANGE)
+            self._insert_questions(connection, quiz_id, row[0], valid)
+        self._notify(quiz_id, row[0], valid)
+        return errors
+
+    def _insert_questions(
+        self, connection: sqlite3.Connection, quiz_id: int, start: int, rows: Iterable[QuestionRow]
+    ) -> None:
+        """Insert validated questions from the given position and update the quiz counters."""
+        params = [
+            (quiz_id, start + i, question, json.dumps(answers, ensure_ascii=False), correct_answer_index)
+            for i, (question, answers, correct_answer_index) in enumerate(rows)
+        ]
+        if params:
+            connection.executemany(INSERT_QUESTION, params)
+            connection.execute(UPDATE_COUNTS, (len(params), len(params), quiz_id))
+
+    def changes_since(self, change: Optional[int]) -> Tuple[int, List[QuizInfo]]:
+        """Get the quizzes changed after a change through the index on their latest change number."""
+        if change is None:
+            with self._connection() as connection:
+                latest = connection.execute(SELECT_CHANGE).fetchone()[0]
+            return latest, list(self.iter_quiz_infos())
+        with self._connection() as connection:
+            # Read the number and the rows in one transaction so they match
+            connection.execute("BEGIN")
+            try:
+                latest = connection.execute(SELECT_CHANGE).fetchone()[0]
+                rows = connection.execute(SELECT_CHANGED_INFOS, (change,)).fetchall()
+            finally:
+                connection.execute("COMMIT")
+        return latest, [self._row_to_info(row) for row in sorted(rows)]
+
+    @staticmethod
+    def _row_to_info(row: tuple) -> QuizInfo:
+        """Convert a quizzes row to a QuizInfo."""
+        return QuizInfo(*row)
+
+    def __len__(self) -> int:
+        """Return the number of stored quizzes."""
+        with self._connection() as connection:
+            return connection.execute("SELECT COUNT(*) FROM quizzes").fetchone()[0]
+
+    def count_questions(self) -> int:
+        """Return the total number of questions, summed in SQL."""
+        with self._connection() as connection:
+            return connection.execute("SELECT COALESCE(SUM(question_count), 0) FROM quizzes").fetchone()[0]
+
+    def close(self) -> None:
+        """Close all pooled connections and unmap the banks."""
+        for connection in self._connections:
+            connection.close()
+        for bank in self._banks.values():
+            bank.close()
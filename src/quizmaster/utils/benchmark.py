@@ -0,0 +1,515 @@
+"""
+API benchmark module.
+
+This module drives every route of the REST API with concurrent async clients and
+reports throughput and p50/p95/p99 latency per route. It runs either against a live
+server or in-process against the ASGI app, without opening sockets, so it can gate
+performance regressions in CI.
+
+It requires httpx, which is part of the development requirements.
+"""
+
+import asyncio
+import itertools
+import json
+import math
+import random
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+
+class BenchmarkContext:
+    """
+    The data shared by the scenarios of one benchmark run.
+
+    Attributes:
+        quiz_ids (List[int]): The IDs of the seeded quizzes.
+        question_counts (Dict[int, int]): The number of questions of each seeded quiz.
+        session_ids (List[str]): Sessions started during the run.
+        user_ids (List[str]): User IDs that have leaderboard entries.
+        rooms (List[Tuple[str, str]]): Live rooms opened during the run, with their host tokens.
+    """
+
+    def __init__(self):
+        """Initialize an empty BenchmarkContext."""
+        self.quiz_ids: List[int] = []
+        self.question_counts: Dict[int, int] = {}
+        self.session_ids: List[str] = []
+        self.user_ids: List[str] = []
+        self.rooms: List[Tuple[str, str]] = []
+
+    def pick_quiz(self, rng: random.Random) -> int:
+        """Pick a seeded quiz at random."""
+        return rng.choice(self.quiz_ids)
+
+    def pick_question(self, rng: random.Random, quiz_id: int) -> int:
+        """Pick a question of a seeded quiz at random."""
+        return rng.randrange(self.question_counts[quiz_id])
+
+
+# A scenario sends one request for its route and returns the response
+ScenarioFunction = Callable[[httpx.AsyncClient, BenchmarkContext, random.Random], Awaitable[httpx.Response]]
+
+
+class Scenario:
+    """
+    How to exercise one route.
+
+    Attributes:
+        name (str): The method and route template, e.g. "GET /quizzes/{quiz_id}".
+        send (ScenarioFunction): Sends one request.
+        expected (tuple): The status codes that count as success.
+    """
+
+    __slots__ = ("name", "send", "expected")
+
+    def __init__(self, name: str, send: ScenarioFunction, expected: tuple = (200,)):
+        """
+        Initialize a new Scenario.
+
+        Args:
+            name: The method and route template.
+            send: Sends one request.
+            expected: The status codes that count as success.
+        """
+        self.name = name
+        self.send = send
+        self.expected = expected
+
+
+SCENARIOS: List[Scenario] = []
+
+
+def scenario(name: str, expected: tuple = (200,)) -> Callable[[ScenarioFunction], ScenarioFunction]:
+    """Register a scenario function for a route; scenarios run in registration order."""
+    def register(send: ScenarioFunction) -> ScenarioFunction:
+        SCENARIOS.append(Scenario(name, send, expected))
+        return send
+    return register
+
+
+class RouteResult:
+    """
+    The measurements of one route.
+
+    Attributes:
+        name (str): The method and route template.
+        latencies (List[float]): The latency of every request in seconds, sorted.
+        errors (int): The number of requests with an unexpected status or a transport error.
+        elapsed (float): The wall-clock time of the whole route run in seconds.
+    """
+
+    __slots__ = ("name", "latencies", "errors", "elapsed")
+
+    def __init__(self, name: str, latencies: List[float], errors: int, elapsed: float):
+        """
+        Initialize a new RouteResult.
+
+        Args:
+            name: The method and route template.
+            latencies: The request latencies in seconds.
+            errors: The number of failed requests.
+            elapsed: The wall-clock time in seconds.
+        """
+        self.name = name
+        self.latencies = sorted(latencies)
+        self.errors = errors
+        self.elapsed = elapsed
+
+    @property
+    def count(self) -> int:
+        """The number of requests sent."""
+        return len(self.latencies)
+
+    @property
+    def throughput(self) -> float:
+        """Requests per second."""
+        return self.count / self.elapsed if self.elapsed else 0.0
+
+    def percentile(self, p: float) -> float:
+        """
+        Get a latency percentile with the nearest-rank method.
+
+        Args:
+            p: The percentile, from 0 to 100.
+
+        Returns:
+            The latency in seconds, or 0.0 if no request was sent.
+        """
+        if not self.latencies:
+            return 0.0
+        rank = max(math.ceil(p / 100 * len(self.latencies)), 1)
+        return self.latencies[rank - 1]
+
+
+@scenario("GET /api")
+async def _api_root(client, context, rng):
+    """Send one GET /api request."""
+    return await client.get("/api")
+
+
+@scenario("GET /quizzes")
+async def _list_quizzes(client, context, rng):
+    """Send one GET /quizzes request."""
+    return await client.get("/quizzes", params={"limit": 20, "view": rng.choice(["full", "summary"])})
+
+
+@scenario("POST /quizzes", expected=(201,))
+async def _create_quiz(client, context, rng):
+    """Send one POST /quizzes request."""
+    return await client.post("/quizzes", json={"title": "Benchmark quiz", "description": "Created by the benchmark"})
+
+
+@scenario("GET /quizzes/{quiz_id}")
+async def _get_quiz(client, context, rng):
+    """Send one GET /quizzes/{quiz_id} request."""
+    return await client.get(f"/quizzes/{context.pick_quiz(rng)}")
+
+
+@scenario("GET /quizzes/{quiz_id}/changes")
+async def _get_changes(client, context, rng):
+    """Send one GET /quizzes/{quiz_id}/changes request."""
+    quiz_id = context.pick_quiz(rng)
+    return await client.get(f"/quizzes/{quiz_id}/changes", params={"since": context.pick_question(rng, quiz_id)})
+
+
+@scenario("POST /quizzes/{quiz_id}/questions")
+async def _add_question(client, context, rng):
+    """Send one POST /quizzes/{quiz_id}/questions request."""
+    return await client.post(f"/quizzes/{context.pick_quiz(rng)}/questions", json={
+        "text": f"Benchmark question {rng.random()}?", "answers": ["A", "B", "C"], "correct_answer_index": 0
+    })
+
+
+@scenario("POST /quizzes/{quiz_id}/questions/bulk")
+async def _import_questions(client, context, rng):
+    """Send one POST /quizzes/{quiz_id}/questions/bulk request."""
+    body = "".join(
+        json.dumps({"text": f"Imported question {rng.random()}?", "answers": ["A", "B"], "correct_answer_index": 1})
+        + "\n" for _ in range(10)
+    )
+    return await client.post(
+        f"/quizzes/{context.pick_quiz(rng)}/questions/bulk",
+        content=body,
+        headers={"Content-Type": "application/x-ndjson"}
+    )
+
+
+@scenario("GET /quizzes/{quiz_id}/questions/{question_id}")
+async def _get_question(client, context, rng):
+    """Send one GET /quizzes/{quiz_id}/questions/{question_id} request."""
+    quiz_id = context.pick_quiz(rng)
+    return await client.get(f"/quizzes/{quiz_id}/questions/{context.pick_question(rng, quiz_id)}")
+
+
+@scenario("POST /quizzes/{quiz_id}/questions/{question_id}/submit")
+async def _submit_answer(client, context, rng):
+    """Send one POST /quizzes/{quiz_id}/questions/{question_id}/submit request."""
+    quiz_id = context.pick_quiz(rng)
+    return await client.post(
+        f"/quizzes/{quiz_id}/questions/{context.pick_question(rng, quiz_id)}/submit",
+        json={"answer_index": rng.randrange(2)}
+    )
+
+
+@scenario("POST /quizzes/{quiz_id}/grade")
+async def _grade(client, context, rng):
+    """Send one POST /quizzes/{quiz_id}/grade request."""
+    quiz_id = context.pick_quiz(rng)
+    user_id = f"user-{rng.randrange(1000)}"
+    context.user_ids.append(user_id)
+    answers = [rng.randrange(2) for _ in range(context.question_counts[quiz_id])]
+    return await client.post(f"/quizzes/{quiz_id}/grade", json={"answers": answers, "user_id": user_id})
+
+
+@scenario("POST /quizzes/{quiz_id}/grade/bulk")
+async def _grade_bulk(client, context, rng):
+    """Send one POST /quizzes/{quiz_id}/grade/bulk request."""
+    quiz_id = context.pick_quiz(rng)
+    count = context.question_counts[quiz_id]
+    sheets = [[rng.randrange(2) for _ in range(count)] for _ in range(10)]
+    return await client.post(f"/quizzes/{quiz_id}/grade/bulk", json={"sheets": sheets})
+
+
+@scenario("POST /quizzes/{quiz_id}/sessions", expected=(201,))
+async def _start_session(client, context, rng):
+    """Send one POST /quizzes/{quiz_id}/sessions request."""
+    response = await client.post(
+        f"/quizzes/{context.pick_quiz(rng)}/sessions",
+        json={"user_id": f"user-{rng.randrange(1000)}", "adaptive": rng.random() < 0.5}
+    )
+    if response.status_code == 201:
+        context.session_ids.append(response.json()["session_id"])
+    return response
+
+
+@scenario("GET /sessions/{session_id}")
+async def _get_session(client, context, rng):
+    """Send one GET /sessions/{session_id} request."""
+    return await client.get(f"/sessions/{rng.choice(context.session_ids)}")
+
+
+@scenario("POST /sessions/{session_id}/answer", expected=(200, 409))
+async def _answer_session(client, context, rng):
+    """Send one POST /sessions/{session_id}/answer request."""
+    return await client.post(f"/sessions/{rng.choice(context.session_ids)}/answer", json={"answer_index": 0})
+
+
+@scenario("POST /sessions/{session_id}/finish", expected=(200, 404))
+async def _finish_session(client, context, rng):
+    """Send one POST /sessions/{session_id}/finish request."""
+    # Sessions can only be finished once, so later picks of the same session get 404
+    return await client.post(f"/sessions/{rng.choice(context.session_ids)}/finish")
+
+
+@scenario("GET /quizzes/{quiz_id}/leaderboard")
+async def _get_leaderboard(client, context, rng):
+    """Send one GET /quizzes/{quiz_id}/leaderboard request."""
+    return await client.get(f"/quizzes/{context.pick_quiz(rng)}/leaderboard", params={"limit": 10})
+
+
+@scenario("GET /quizzes/{quiz_id}/leaderboard/{user_id}", expected=(200, 404))
+async def _get_rank(client, context, rng):
+    """Send one GET /quizzes/{quiz_id}/leaderboard/{user_id} request."""
+    return await client.get(f"/quizzes/{context.pick_quiz(rng)}/leaderboard/{rng.choice(context.user_ids)}")
+
+
+@scenario("GET /quizzes/{quiz_id}/analytics")
+async def _get_analytics(client, context, rng):
+    """Send one GET /quizzes/{quiz_id}/analytics request."""
+    return await client.get(f"/quizzes/{context.pick_quiz(rng)}/analytics")
+
+
+@scenario("GET /search")
+async def _search(client, context, rng):
+    """Send one GET /search request."""
+    return await client.get("/search", params={"q": rng.choice(["question", "benchmark", "imp", "seed"])})
+
+
+@scenario("POST /init-default-quiz")
+async def _init_default_quiz(client, context, rng):
+    """Send one POST /init-default-quiz request."""
+    return await client.post("/init-default-quiz")
+
+
+@scenario("GET /cache/stats")
+async def _cache_stats(client, context, rng):
+    """Send one GET /cache/stats request."""
+    return await client.get("/cache/stats")
+
+
+@scenario("GET /metrics")
+async def _metrics(client, context, rng):
+    """Send one GET /metrics request."""
+    return await client.get("/metrics")
+
+
+@scenario("POST /quizzes/{quiz_id}/sample")
+async def _sample_questions(client, context, rng):
+    """Send one POST /quizzes/{quiz_id}/sample request."""
+    quiz_id = context.pick_quiz(rng)
+    count = min(10, context.question_counts[quiz_id])
+    weights = {str(context.pick_question(rng, quiz_id)): 5.0} if rng.random() < 0.5 else None
+    return await client.post(f"/quizzes/{quiz_id}/sample", json={"count": count, "weights": weights})
+
+
+@scenario("POST /quizzes/{quiz_id}/calibrate", expected=(200, 400))
+async def _calibrate_quiz(client, context, rng):
+    """Send one POST /quizzes/{quiz_id}/calibrate request."""
+    # Quizzes nobody has answered yet have nothing to calibrate from
+    return await client.post(f"/quizzes/{context.pick_quiz(rng)}/calibrate")
+
+
+@scenario("POST /rooms", expected=(201,))
+async def _create_room(client, context, rng):
+    """Send one POST /rooms request."""
+    response = await client.post("/rooms", json={"quiz_id": context.pick_quiz(rng)})
+    if response.status_code == 201:
+        context.rooms.append((response.json()["room_id"], response.json()["host_token"]))
+    return response
+
+
+@scenario("GET /rooms/{room_id}")
+async def _get_room(client, context, rng):
+    """Send one GET /rooms/{room_id} request."""
+    return await client.get(f"/rooms/{rng.choice(context.rooms)[0]}")
+
+
+@scenario("POST /rooms/{room_id}/advance", expected=(200, 404))
+async def _advance_room(client, context, rng):
+    """Send one POST /rooms/{room_id}/advance request."""
+    # Rooms that have run out of questions are finished and removed, so they answer 404
+    room_id, host_token = rng.choice(context.rooms)
+    return await client.post(f"/rooms/{room_id}/advance", headers={"X-Host-Token": host_token})
+
+
+@scenario("DELETE /rooms/{room_id}", expected=(204, 404))
+async def _close_room(client, context, rng):
+    """Send one DELETE /rooms/{room_id} request."""
+    # Rooms can only be closed once, so later picks of the same room get 404
+    room_id, host_token = rng.choice(context.rooms)
+    return await client.delete(f"/rooms/{room_id}", headers={"X-Host-Token": host_token})
+
+
+@scenario("POST /admin/profile", expected=(403,))
+async def _profile(client, context, rng):
+    """Send one POST /admin/profile request without an admin token."""
+    return await client.post("/admin/profile", params={"seconds": 0.01})
+
+
+@scenario("POST /admin/profile/requests", expected=(403,))
+async def _profile_requests(client, context, rng):
+    """Send one POST /admin/profile/requests request without an admin token."""
+    return await client.post("/admin/profile/requests", params={"route": "/quizzes", "timeout": 0.01})
+
+
+def make_client(base_url: Optional[str] = None, timeout: float = 30.0) -> httpx.AsyncClient:
+    """
+    Create the HTTP client for a benchmark run.
+
+    Args:
+        base_url: The URL of a live server, or None to call the ASGI app in-process.
+        timeout: The request timeout in seconds.
+
+    Returns:
+        The client; close it with aclose() or use it as an async context manager.
+    """
+    if base_url is None:
+        from quizmaster.main import app
+        return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://benchmark", timeout=timeout)
+    return httpx.AsyncClient(base_url=base_url, timeout=timeout)
+
+
+async def seed(client: httpx.AsyncClient, quizzes: int, questions: int) -> BenchmarkContext:
+    """
+    Create the quizzes the scenarios work on.
+
+    Args:
+        client: The HTTP client.
+        quizzes: The number of quizzes to create.
+        questions: The number of questions per quiz.
+
+    Returns:
+        The context holding the seeded quiz IDs.
+
+    Raises:
+        RuntimeError: If the server rejects the seed data.
+    """
+    context = BenchmarkContext()
+    for i in range(quizzes):
+        response = await client.post("/quizzes", json={"title": f"Seed quiz {i}", "description": "Benchmark data"})
+        if response.status_code != 201:
+            raise RuntimeError(f"Could not create a seed quiz: {response.status_code} {response.text}")
+        quiz_id = response.json()["id"]
+        body = "".join(
+            json.dumps({"text": f"Seed question {i}-{j}?", "answers": ["A", "B"], "correct_answer_index": j % 2})
+            + "\n" for j in range(questions)
+        )
+        response = await client.post(
+            f"/quizzes/{quiz_id}/questions/bulk", content=body, headers={"Content-Type": "application/x-ndjson"}
+        )
+        if response.status_code != 200 or response.json()["imported"] != questions:
+            raise RuntimeError(f"Could not import seed questions: {response.status_code} {response.text}")
+        context.quiz_ids.append(quiz_id)
+        context.question_counts[quiz_id] = questions
+    return context
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    context: BenchmarkContext,
+    selected: Scenario,
+    requests: int,
+    concurrency: int,
+    rng: random.Random
+) -> RouteResult:
+    """
+    Send a number of requests for one route from concurrent workers.
+
+    Args:
+        client: The HTTP client.
+        context: The benchmark context.
+        selected: The scenario to run.
+        requests: The total number of requests.
+        concurrency: The number of requests in flight at once.
+        rng: The random source for request parameters.
+
+    Returns:
+        The route's measurements.
+    """
+    latencies: List[float] = []
+    errors = 0
+    counter = itertools.count()
+
+    async def worker() -> None:
+        nonlocal errors
+        while next(counter) < requests:
+            start = time.perf_counter()
+            try:
+                response = await selected.send(client, context, rng)
+                failed = response.status_code not in selected.expected
+            except httpx.HTTPError:
+                failed = True
+            latencies.append(time.perf_counter() - start)
+            if failed:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(max(concurrency, 1))))
+    return RouteResult(selected.name, latencies, errors, time.perf_counter() - start)
+
+
+async def run_benchmark(
+    client: httpx.AsyncClient,
+    requests: int = 200,
+    concurrency: int = 16,
+    quizzes: int = 5,
+    questions: int = 50,
+    routes: Optional[List[str]] = None,
+    seed_value: int = 0
+) -> List[RouteResult]:
+    """
+    Seed data and benchmark every route, one route at a time.
+
+    Args:
+        client: The HTTP client.
+        requests: The number of requests per route.
+        concurrency: The number of concurrent clients.
+        quizzes: The number of seeded quizzes.
+        questions: The number of questions per seeded quiz.
+        routes: Only run the scenarios with these names; all by default.
+        seed_value: The seed of the random request parameters.
+
+    Returns:
+        The measurements of every route, in run order.
+    """
+    context = await seed(client, quizzes, questions)
+    rng = random.Random(seed_value)
+    results = []
+    for selected in SCENARIOS:
+        if routes is None or selected.name in routes:
+            results.append(await run_scenario(client, context, selected, requests, concurrency, rng))
+    return results
+
+
+def format_report(results: List[RouteResult]) -> str:
+    """
+    Format benchmark results as a text table.
+
+    Args:
+        results: The route measurements.
+
+    Returns:
+        The table, one line per route.
+    """
+    width = max([len(result.name) for result in results] + [5])
+    lines = [f"{'Route':<{width}}  {'Reqs':>6}  {'Errors':>6}  {'Req/s':>8}  {'p50 ms':>8}  {'p95 ms':>8}  {'p99 ms':>8}"]
+    for result in results:
+        lines.append(
+            f"{result.name:<{width}}  {result.count:>6}  {result.errors:>6}  {result.throughput:>8.1f}  "
+            f"{result.percentile(50) * 1000:>8.2f}  {result.percentile(95) * 1000:>8.2f}  "
+            f"{result.percentile(99) * 1000:>8.2f}"
+        )
+    return "\n".join(lines)
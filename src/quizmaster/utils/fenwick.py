@@ -0,0 +1,142 @@
+"""
+Fenwick tree module.
+
+This module provides FenwickTree, a binary indexed tree that keeps prefix sums of a
+growable array of counts up to date in O(log n) per change.
+"""
+
+from typing import List, Sequence
+
+
+class FenwickTree:
+    """
+    Prefix sums over an array of non-negative counts.
+
+    Changing a count, reading a prefix sum and finding the position that holds the
+    k-th unit of the total all take O(log n). The array grows on demand, doubling its
+    capacity so growth is amortized O(1) per position.
+    """
+
+    def __init__(self, size: int = 0):
+        """
+        Initialize a new FenwickTree with all counts zero.
+
+        Args:
+            size: The initial number of positions.
+        """
+        self._tree: List[int] = [0] * (max(size, 1) + 1)
+        self._total = 0
+
+    @classmethod
+    def from_counts(cls, counts: Sequence[int]) -> "FenwickTree":
+        """
+        Build a tree from initial counts in O(n).
+
+        Args:
+            counts: The count of every position.
+
+        Returns:
+            The new tree.
+        """
+        tree = cls(len(counts))
+        values = tree._tree
+        values[1:len(counts) + 1] = counts
+        size = len(values)
+        for i in range(1, size):
+            parent = i + (i & -i)
+            if parent < size:
+                values[parent] += values[i]
+        tree._total = sum(counts)
+        return tree
+
+    def __len__(self) -> int:
+        """Return the number of positions."""
+        return len(self._tree) - 1
+
+    @property
+    def total(self) -> int:
+        """The sum of all counts."""
+        return self._total
+
+    def add(self, index: int, delta: int) -> None:
+        """
+        Add to the count at a position, growing the array if needed.
+
+        Args:
+            index: The zero-based position.
+            delta: The amount to add.
+        """
+        if index >= len(self):
+            self._grow(max(index + 1, 2 * len(self)))
+        self._total += delta
+        i = index + 1
+        tree = self._tree
+        size = len(tree)
+        while i < size:
+            tree[i] += delta
+            i += i & -i
+
+    def prefix_sum(self, index: int) -> int:
+        """
+        Get the sum of the counts at positions 0 through index.
+
+        Args:
+            index: The last position included; negative for an empty prefix.
+
+        Returns:
+            The prefix sum.
+        """
+        i = min(index + 1, len(self))
+        result = 0
+        tree = self._tree
+        while i > 0:
+            result += tree[i]
+            i -= i & -i
+        return result
+
+    def get(self, index: int) -> int:
+        """Get the count at a position."""
+        return self.prefix_sum(index) - self.prefix_sum(index - 1)
+
+    def find(self, k: int) -> int:
+        """
+        Find the position holding the k-th unit of the total, counting from zero.
+
+        That is the smallest position whose prefix sum is greater than k.
+
+        Args:
+            k: A value from 0 to total - 1.
+
+        Returns:
+            The position.
+
+        Raises:
+            IndexError: If k is out of range.
+        """
+        if not 0 <= k < self._total:
+            raise IndexError("Fenwick tree index out of range")
+        tree = self._tree
+        position = 0
+        step = 1 << (len(tree) - 1).bit_length()
+        while step:
+            next_position = position + step
+            if next_position < len(tree) and tree[next_position] <= k:
+                position = next_position
+                k -= tree[next_position]
+            step >>= 1
+        return position
+
+    def _grow(self, size: int) -> None:
+        """Rebuild the tree with a larger capacity in O(n)."""
+        tree = list(self._tree)
+        # Undo the prefix structure to get the raw counts, then rebuild at the new size
+        for i in range(len(tree) - 1, 0, -1):
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] -= tree[i]
+        tree.extend([0] * (size + 1 - len(tree)))
+        for i in range(1, len(tree)):
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self._tree = tree
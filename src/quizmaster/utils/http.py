@@ -0,0 +1,48 @@
+"""
+HTTP utilities module.
+
+This module provides helpers for conditional requests (ETag / If-None-Match).
+"""
+
+from typing import Optional
+
+
+def make_etag(*parts: object) -> str:
+    """
+    Build a strong entity tag from the given parts.
+
+    Args:
+        parts: Values identifying the representation, such as IDs and a content version.
+
+    Returns:
+        The quoted entity tag, e.g. '"ab12-3-7"'.
+    """
+    return '"' + "-".join(str(part) for part in parts) + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check whether an If-None-Match header matches an entity tag.
+
+    The comparison is the weak comparison required for If-None-Match, so a
+    W/ prefix on either side is ignored.
+
+    Args:
+        if_none_match: The raw If-None-Match header value, if any.
+        etag: The current entity tag of the resource.
+
+    Returns:
+        True if the client's cached copy is still current.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    current = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == current:
+            return True
+    return False
@@ -0,0 +1,64 @@
+"""
+Unit tests for answer analytics.
+"""
+
+from quizmaster.models.quiz import Quiz
+from quizmaster.services.analytics import AnswerStats
+from quizmaster.services.grading import grade_sheets
+
+
+def test_record_builds_histograms():
+    """Test that answers are counted per choice and per question."""
+    # Arrange
+    stats = AnswerStats()
+    
+    # Act
+    stats.record(0, 0, 1, 3, True)
+    stats.record(0, 0, 1, 3, True)
+    stats.record(0, 0, 2, 3, False)
+    stats.record(0, 1, 0, 2, False)
+    stats.record(1, 0, 0, 2, True)
+    
+    # Assert
+    result = stats.question_stats(0)
+    assert sorted(result) == [0, 1]
+    assert result[0].answer_counts == [0, 2, 1]
+    assert result[0].correct == 2
+    assert result[0].submissions == 3
+    assert result[0].correct_rate == 2 / 3
+    assert result[1].correct_rate == 0.0
+
+
+def test_record_sheets_counts_answered_questions():
+    """Test counting graded answer sheets, skipping blank answers."""
+    # Arrange
+    quiz = Quiz("Test Quiz")
+    quiz.add_question("Q1", ["A", "B"], 1)
+    quiz.add_question("Q2", ["A", "B", "C"], 0)
+    quiz.add_question("Q3", ["A", "B"], 0)
+    stats = AnswerStats()
+    result = grade_sheets(quiz, [[1, 2], [0, None], [1]])
+    
+    # Act
+    stats.record_sheets(0, result)
+    
+    # Assert
+    questions = stats.question_stats(0)
+    assert sorted(questions) == [0, 1]
+    assert questions[0].answer_counts == [1, 2]
+    assert questions[0].correct == 2
+    assert questions[1].answer_counts == [0, 0, 1]
+    assert questions[1].correct == 0
+
+
+def test_clear():
+    """Test resetting the counters."""
+    # Arrange
+    stats = AnswerStats()
+    stats.record(0, 0, 0, 2, True)
+    
+    # Act
+    stats.clear()
+    
+    # Assert
+    assert stats.question_stats(0) == {}
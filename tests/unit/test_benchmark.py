@@ -0,0 +1,83 @@
+"""
+Unit tests for the API benchmark.
+"""
+
+import asyncio
+
+import pytest
+from fastapi.routing import APIRoute
+
+from quizmaster import main
+from quizmaster.services.analytics import AnswerStats
+from quizmaster.services.bot_engine import BotEngine
+from quizmaster.services.leaderboard import Leaderboards
+from quizmaster.services.live_rooms import RoomRegistry
+from quizmaster.services.quiz_store import MemoryQuizStore
+from quizmaster.services.sampling import SamplerRegistry
+from quizmaster.services.search import SearchIndex
+from quizmaster.services.sessions import SessionEngine
+from quizmaster.utils.benchmark import SCENARIOS, RouteResult, make_client, run_benchmark
+
+
+@pytest.fixture
+def app_state(monkeypatch):
+    """Give the app empty in-memory state."""
+    store = MemoryQuizStore()
+    store.add_listener(main.on_questions_added)
+    monkeypatch.setattr(main, "store", store)
+    monkeypatch.setattr(main, "search_index", SearchIndex())
+    monkeypatch.setattr(main, "sessions", SessionEngine())
+    monkeypatch.setattr(main, "dedup", None)
+    monkeypatch.setattr(main, "answer_stats", AnswerStats())
+    monkeypatch.setattr(main, "leaderboards", Leaderboards())
+    monkeypatch.setattr(main, "bots", BotEngine())
+    monkeypatch.setattr(main, "rooms", RoomRegistry(tally_interval=0))
+    monkeypatch.setattr(main, "samplers", SamplerRegistry())
+    monkeypatch.setattr(main, "item_banks", None)
+    main.response_cache.clear()
+    main.metrics.clear()
+
+
+def test_percentiles_use_nearest_rank():
+    """Test latency percentiles and throughput."""
+    # Arrange
+    result = RouteResult("GET /api", [0.005, 0.001, 0.003, 0.002, 0.004], 0, 0.5)
+    
+    # Act & Assert
+    assert result.percentile(50) == 0.003
+    assert result.percentile(99) == 0.005
+    assert result.percentile(0) == 0.001
+    assert result.throughput == 10.0
+    assert RouteResult("GET /api", [], 0, 0.0).percentile(95) == 0.0
+
+
+def test_every_route_has_a_scenario():
+    """Test that the benchmark covers every API route."""
+    # Arrange
+    routes = {
+        f"{method} {route.path}"
+        for route in main.app.routes if isinstance(route, APIRoute)
+        for method in route.methods
+    }
+    
+    # Act
+    covered = {scenario.name for scenario in SCENARIOS}
+    
+    # Assert
+    assert routes == covered
+
+
+def test_in_process_run_has_no_errors(app_state):
+    """Test a small in-process run against the ASGI app."""
+    # Arrange
+    async def run():
+        async with make_client() as client:
+            return await run_benchmark(client, requests=4, concurrency=2, quizzes=2, questions=5)
+    
+    # Act
+    results = asyncio.run(run())
+    
+    # Assert
+    assert [result.name for result in results] == [scenario.name for scenario in SCENARIOS]
+    assert all(result.count == 4 for result in results)
+    assert sum(result.errors for result in results) == 0
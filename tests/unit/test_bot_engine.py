@@ -0,0 +1,106 @@
+"""
+Unit tests for the quiz bot engine.
+"""
+
+import asyncio
+import sys
+
+from quizmaster.models.default_quiz import default_quiz
+from quizmaster.models.quiz import Quiz
+from quizmaster.services.bot_engine import BotEngine, Conversation, MemoryTransport
+
+
+def make_quiz():
+    """Create a quiz with two questions."""
+    quiz = Quiz("Test Quiz", "A quiz for testing")
+    quiz.add_question("What is 2 + 2?", ["3", "4"], 1)
+    quiz.add_question("What is 3 + 3?", ["6", "7", "8"], 0)
+    return quiz
+
+
+def test_conversation_gives_feedback_and_finishes():
+    """Test the question, feedback and completion flow."""
+    # Arrange
+    conversation = Conversation(make_quiz())
+    
+    # Act
+    greeting = conversation.start()
+    wrong = conversation.handle(" 1 ")
+    right = conversation.handle("1")
+    
+    # Assert
+    assert greeting[0] == "Welcome to the Test Quiz!"
+    assert greeting[-2:] == ["1. 3", "2. 4"]
+    assert wrong[0] == "Sorry, that's incorrect. The correct answer is: 4"
+    assert wrong[1] == "\nQuestion 2: What is 3 + 3?"
+    assert right[0] == "Correct! Well done!"
+    assert right[-1] == "Thanks for playing!"
+    assert conversation.finished
+    assert conversation.correct == 1
+    assert conversation.handle("1") == []
+
+
+def test_conversation_repeats_question_on_invalid_input_and_quits():
+    """Test that invalid input re-asks the question and 'q' ends the chat."""
+    # Arrange
+    conversation = Conversation(make_quiz())
+    conversation.start()
+    
+    # Act
+    not_a_number = conversation.handle("four")
+    out_of_range = conversation.handle("3")
+    quit_reply = conversation.handle("Q")
+    
+    # Assert
+    assert not_a_number == ["Please enter a valid number or 'q' to quit", "\nQuestion 1: What is 2 + 2?", "1. 3", "2. 4"]
+    assert out_of_range[0] == "Please enter a number between 1 and 2"
+    assert quit_reply == ["Thanks for playing!"]
+    assert conversation.index == 0
+    assert conversation.finished
+
+
+def test_engine_ends_conversation_when_user_hangs_up():
+    """Test that a closed transport ends the conversation and is closed."""
+    # Arrange
+    engine = BotEngine()
+    transport = MemoryTransport()
+    transport.put(None)
+    
+    # Act
+    conversation = asyncio.run(engine.serve(transport, make_quiz()))
+    
+    # Assert
+    assert not conversation.finished
+    assert transport.closed
+    assert engine.active == 0
+    assert engine.completed == 1
+
+
+def test_engine_runs_thousands_of_concurrent_conversations():
+    """Test that one event loop drives many chats at once with small per-chat state."""
+    # Arrange
+    engine = BotEngine()
+    quiz = default_quiz()
+    count = 2000
+
+    async def chat(transport):
+        await transport.replies.get()
+        for _ in range(quiz.get_question_count()):
+            await transport.ask("2")
+
+    async def run():
+        transports = [MemoryTransport() for _ in range(count)]
+        serving = [asyncio.create_task(engine.serve(transport, quiz)) for transport in transports]
+        await asyncio.sleep(0)
+        peak = engine.active
+        await asyncio.gather(*(chat(transport) for transport in transports))
+        return peak, await asyncio.gather(*serving)
+    
+    # Act
+    peak, conversations = asyncio.run(run())
+    
+    # Assert
+    assert peak == count
+    assert engine.completed == count
+    assert all(c.finished and c.correct == 3 for c in conversations)
+    assert sys.getsizeof(conversations[0]) < 100
@@ -0,0 +1,78 @@
+"""
+Unit tests for duplicate question detection.
+"""
+
+from quizmaster.models.quiz import Quiz
+from quizmaster.services.dedup import DedupIndex, DedupRegistry, fingerprint, normalize
+from quizmaster.services.quiz_store import MemoryQuizStore
+
+
+def test_normalize():
+    """Test lowercasing, punctuation removal and whitespace collapsing."""
+    assert normalize("  What's   2 + 2? ") == "what s 2 2"
+
+
+def test_exact_duplicates_ignore_case_punctuation_and_answer_order():
+    """Test that normalized question and answers are matched exactly."""
+    # Arrange
+    index = DedupIndex()
+    index.add(0, fingerprint("What is the capital of France?", ["London", "Paris"]))
+    
+    # Act
+    match = index.find(fingerprint("what is the capital of france", ["Paris", "London"]))
+    
+    # Assert
+    assert match.question_id == 0
+    assert match.exact
+    assert match.similarity == 1.0
+
+
+def test_near_duplicates_are_found():
+    """Test that slightly reworded questions match and unrelated ones do not."""
+    # Arrange
+    index = DedupIndex()
+    index.add(0, fingerprint("What is the capital of France?", ["London", "Paris"]))
+    index.add(1, fingerprint("Which keyword defines a function in Python?", ["def", "func"]))
+    
+    # Act
+    near = index.find(fingerprint("What is the capital city of France?", ["Paris", "Rome"]))
+    other = index.find(fingerprint("Which Python type is immutable?", ["list", "tuple"]))
+    
+    # Assert
+    assert near.question_id == 0
+    assert not near.exact
+    assert 0.8 <= near.similarity < 1.0
+    assert other is None
+
+
+def test_add_ignores_indexed_ids():
+    """Test that a question ID already in the index is not indexed twice."""
+    # Arrange
+    index = DedupIndex()
+    index.add(0, fingerprint("Q1", ["A", "B"]))
+    
+    # Act
+    index.add(0, fingerprint("Q2", ["A", "B"]))
+    
+    # Assert
+    assert index.count == 1
+    assert index.find(fingerprint("Q2", ["A", "B"])) is None
+
+
+def test_registry_builds_and_follows_indexes():
+    """Test that indexes are built from the store and kept current by the listener."""
+    # Arrange
+    store = MemoryQuizStore()
+    registry = DedupRegistry()
+    store.add_listener(registry.on_questions_added)
+    quiz = Quiz("Test Quiz", dedup_policy="reject")
+    quiz.add_question("What is 2 + 2?", ["3", "4"], 1)
+    quiz_id = store.add_quiz(quiz)
+    
+    # Act
+    index = registry.index_for(store, quiz_id)
+    store.add_question(quiz_id, "Which planet is the largest?", ["Mars", "Jupiter"], 1)
+    
+    # Assert
+    assert index.count == 2
+    assert index.find(fingerprint("Which planet is the largest?", ["Jupiter", "Mars"])).question_id == 1
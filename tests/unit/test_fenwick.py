@@ -0,0 +1,63 @@
+"""
+Unit tests for the Fenwick tree.
+"""
+
+import random
+from itertools import accumulate
+
+import pytest
+
+from quizmaster.utils.fenwick import FenwickTree
+
+
+def test_prefix_sums_and_find_match_a_plain_list():
+    """Test prefix sums and k-th lookups against a list of counts, including growth."""
+    # Arrange
+    rng = random.Random(7)
+    tree = FenwickTree()
+    counts = [0] * 300
+    
+    # Act
+    for _ in range(2000):
+        index = rng.randrange(300)
+        tree.add(index, 1)
+        counts[index] += 1
+    
+    # Assert
+    sums = list(accumulate(counts))
+    assert tree.total == sums[-1]
+    assert all(tree.prefix_sum(i) == sums[i] for i in range(300))
+    assert tree.prefix_sum(-1) == 0
+    assert tree.get(17) == counts[17]
+    for k in rng.sample(range(tree.total), 100):
+        assert tree.find(k) == next(i for i, total in enumerate(sums) if total > k)
+
+
+def test_find_out_of_range():
+    """Test that find rejects positions beyond the total."""
+    # Arrange
+    tree = FenwickTree(4)
+    tree.add(2, 1)
+    
+    # Act & Assert
+    assert tree.find(0) == 2
+    with pytest.raises(IndexError):
+        tree.find(1)
+
+
+def test_from_counts_matches_incremental_build():
+    """Test that the O(n) build gives the same sums as adding counts one by one."""
+    # Arrange
+    counts = [random.Random(3).randrange(10) for _ in range(37)]
+    incremental = FenwickTree()
+    for i, count in enumerate(counts):
+        incremental.add(i, count)
+    
+    # Act
+    tree = FenwickTree.from_counts(counts)
+    tree.add(40, 2)
+    
+    # Assert
+    assert all(tree.prefix_sum(i) == incremental.prefix_sum(i) for i in range(37))
+    assert tree.total == sum(counts) + 2
+    assert tree.get(40) == 2
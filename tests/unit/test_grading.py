@@ -0,0 +1,50 @@
+"""
+Unit tests for the grading service.
+"""
+
+import pytest
+
+from quizmaster.models.quiz import Quiz
+from quizmaster.services.grading import answer_count_vector, answer_key_vector, grade_sheets
+
+
+@pytest.fixture
+def quiz():
+    """Provide a quiz with three questions."""
+    quiz = Quiz("Test Quiz")
+    quiz.add_question("Q1", ["A", "B"], 1)
+    quiz.add_question("Q2", ["A", "B", "C"], 0)
+    quiz.add_question("Q3", ["True", "False"], 1)
+    return quiz
+
+
+def test_vectors(quiz):
+    """Test that the answer key and answer count vectors follow question order."""
+    assert answer_key_vector(quiz).tolist() == [1, 0, 1]
+    assert answer_count_vector(quiz).tolist() == [2, 3, 2]
+
+
+def test_grade_sheets(quiz):
+    """Test per-question correctness and totals for several sheets."""
+    # Act
+    result = grade_sheets(quiz, [[1, 0, 1], [0, None, 1], [1]])
+    
+    # Assert
+    assert result.correct.tolist() == [
+        [True, True, True],
+        [False, False, True],
+        [True, False, False],
+    ]
+    assert result.scores.tolist() == [3, 1, 1]
+    assert result.answered.tolist() == [3, 2, 1]
+    assert result.question_correct_counts.tolist() == [2, 1, 2]
+
+
+def test_grade_sheets_rejects_invalid_answers(quiz):
+    """Test that out-of-range answers and over-long sheets raise ValueError."""
+    with pytest.raises(ValueError):
+        grade_sheets(quiz, [[1, 3, 0]])
+    with pytest.raises(ValueError):
+        grade_sheets(quiz, [[1, 0, 1, 0]])
+    with pytest.raises(ValueError):
+        grade_sheets(quiz, [[100000]])
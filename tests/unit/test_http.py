@@ -0,0 +1,22 @@
+"""
+Unit tests for the HTTP utilities.
+"""
+
+from quizmaster.utils.http import etag_matches, make_etag
+
+
+def test_make_etag_is_quoted():
+    """Test that make_etag joins its parts into a quoted strong tag."""
+    assert make_etag("ab", 1, 2) == '"ab-1-2"'
+
+
+def test_etag_matches():
+    """Test If-None-Match matching for single, listed, weak and wildcard values."""
+    etag = make_etag("ab", 1, 2)
+    
+    assert etag_matches(etag, etag)
+    assert etag_matches('"other", ' + etag, etag)
+    assert etag_matches("W/" + etag, etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches('"ab-1-3"', etag)
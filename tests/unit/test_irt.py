@@ -0,0 +1,173 @@
+"""
+Unit tests for item response theory calibration and adaptive testing.
+"""
+
+import numpy as np
+import pytest
+
+from quizmaster.services.irt import AdaptiveState, ItemBank, ItemBanks, ResponseLog, calibrate, logistic
+
+
+def simulate(rng, discrimination, difficulty, persons):
+    """Simulate complete answer sheets under the 2PL model."""
+    theta = rng.normal(0.0, 1.0, persons)
+    p = logistic(discrimination[None, :] * (theta[:, None] - difficulty[None, :]))
+    return rng.random(p.shape) < p
+
+
+def test_response_log_collects_sheets_and_people():
+    """Test that sheets skip blank answers and every sheet and person gets its own learner ID."""
+    # Arrange
+    log = ResponseLog()
+    
+    # Act
+    log.add_sheets(np.array([[True, False], [False, True]]), np.array([[True, True], [False, True]]))
+    log.add_person([4, 2], [True, False])
+    person_ids, question_ids, correct = log.arrays()
+    
+    # Assert
+    assert len(log) == 5
+    assert log.persons == 3
+    assert person_ids.tolist() == [0, 0, 1, 2, 2]
+    assert question_ids.tolist() == [0, 1, 1, 4, 2]
+    assert correct.tolist() == [True, False, True, True, False]
+
+
+def test_response_log_drops_the_oldest_responses_beyond_its_limit():
+    """Test that a full log sheds its oldest responses in one step and keeps the columns aligned."""
+    # Arrange
+    log = ResponseLog(max_responses=8)
+    
+    # Act
+    log.add_person([0, 1, 2, 3, 4], [True] * 5)
+    log.add_person([5, 6, 7], [False] * 3)
+    full = len(log)
+    log.add_sheets(np.array([[True, False]]), np.array([[True, True]]))
+    person_ids, question_ids, correct = log.arrays()
+    
+    # Assert
+    assert full == 8
+    assert len(log) == 6
+    assert log.persons == 3
+    assert person_ids.tolist() == [0, 1, 1, 1, 2, 2]
+    assert question_ids.tolist() == [4, 5, 6, 7, 0, 1]
+    assert correct.tolist() == [True, False, False, False, True, False]
+
+def test_calibrate_recovers_simulated_parameters():
+    """Test that calibration recovers the discrimination and difficulty used to simulate responses."""
+    # Arrange
+    rng = np.random.default_rng(3)
+    discrimination = rng.uniform(0.6, 2.0, 40)
+    difficulty = rng.normal(0.0, 1.0, 40)
+    log = ResponseLog()
+    correct = simulate(rng, discrimination, difficulty, 3000)
+    log.add_sheets(correct, np.ones_like(correct))
+    
+    # Act
+    bank, iterations = calibrate(*log.arrays(), question_count=41)
+    
+    # Assert
+    assert iterations < 50
+    assert np.corrcoef(bank.difficulty[:40], difficulty)[0, 1] > 0.99
+    assert np.corrcoef(bank.discrimination[:40], discrimination)[0, 1] > 0.9
+    assert np.abs(bank.difficulty[:40] - difficulty).mean() < 0.15
+    assert bank.discrimination[40] == pytest.approx(1.0, abs=0.01)
+
+
+def test_calibrate_requires_responses():
+    """Test that calibrating an empty log fails."""
+    # Act / Assert
+    with pytest.raises(ValueError):
+        calibrate(*ResponseLog().arrays(), question_count=3)
+
+
+def test_adaptive_test_picks_informative_questions_and_tracks_ability():
+    """Test that selection follows the ability estimate and never repeats a question."""
+    # Arrange
+    bank = ItemBank(np.full(9, 2.0), np.linspace(-3.0, 3.0, 9))
+    state = AdaptiveState(max_questions=4)
+    
+    # Act
+    first = bank.select(state)
+    bank.update(state, first, True)
+    second = bank.select(state)
+    bank.update(state, second, True)
+    high, high_se = state.estimate()
+    third = bank.select(state)
+    bank.update(state, third, False)
+    fourth = bank.select(state)
+    bank.update(state, fourth, False)
+    
+    # Assert
+    assert first == 4
+    assert bank.difficulty[second] > bank.difficulty[first]
+    assert high > 0.5
+    assert high_se < 1.0
+    assert len({first, second, third, fourth}) == 4
+    assert state.finished
+    assert bank.select(state) is None
+
+
+def test_adaptive_estimate_converges_on_simulated_learner():
+    """Test that an adaptive test lands near a simulated learner's true ability."""
+    # Arrange
+    rng = np.random.default_rng(8)
+    bank = ItemBank(rng.uniform(1.0, 2.0, 500), rng.normal(0.0, 1.5, 500))
+    state = AdaptiveState(max_questions=40)
+    
+    # Act
+    while not state.finished:
+        question_id = bank.select(state)
+        p = logistic(bank.discrimination[question_id] * (1.2 - bank.difficulty[question_id]))
+        bank.update(state, question_id, rng.random() < p)
+    theta, se = state.estimate()
+    
+    # Assert
+    assert abs(theta - 1.2) < 3 * se
+    assert se < 0.35
+
+
+def test_extended_bank_matches_a_full_build():
+    """Test that extending a bank gives the same tables and ordering as building it from scratch, ties included."""
+    # Arrange
+    rng = np.random.default_rng(4)
+    discrimination = np.concatenate([rng.uniform(0.5, 2.0, 300), np.ones(40)])
+    difficulty = np.concatenate([rng.normal(0.0, 1.0, 300), np.zeros(40)])
+    base = ItemBank(discrimination[:320], difficulty[:320])
+    
+    # Act
+    extended = base.extend(discrimination[320:], difficulty[320:])
+    full = ItemBank(discrimination, difficulty)
+    
+    # Assert
+    assert len(base) == 320
+    assert np.array_equal(extended._order, full._order)
+    assert np.array_equal(extended._ranked, full._ranked)
+    assert np.array_equal(extended._log_p, full._log_p)
+    assert np.array_equal(extended.difficulty, full.difficulty)
+
+def test_item_banks_extend_calibration_with_provisional_questions():
+    """Test that questions added after calibration get parameters from their correct rates."""
+    # Arrange
+    banks = ItemBanks()
+    rng = np.random.default_rng(1)
+    correct = simulate(rng, np.ones(3), np.zeros(3), 200)
+    banks.log(7).add_sheets(correct, np.ones_like(correct))
+    
+    # Act
+    provisional = banks.bank(7, 3, lambda: {0: 0.9})
+    calibrated, _, responses, learners = banks.calibrate(7, 3)
+    same = banks.bank(7, 3, lambda: pytest.fail("rates are not needed"))
+    extended = banks.bank(7, 4, lambda: {3: 0.5})
+    grown = banks.bank(7, 5, lambda: {3: 0.9, 4: 0.1})
+    
+    # Assert
+    assert provisional.difficulty[0] == pytest.approx(-np.log(9))
+    assert (responses, learners) == (600, 200)
+    assert same is calibrated
+    assert len(extended) == 4
+    assert extended.difficulty[:3].tolist() == calibrated.difficulty.tolist()
+    assert extended.difficulty[3] == pytest.approx(0.0)
+    assert banks.bank(7, 4, lambda: pytest.fail("rates are not needed")) is grown
+    assert grown.difficulty[:4].tolist() == extended.difficulty.tolist()
+    assert grown.difficulty[4] == pytest.approx(np.log(9))
@@ -0,0 +1,123 @@
+"""
+Unit tests for the journal quiz store.
+"""
+
+import os
+import threading
+
+from quizmaster.models.quiz import Quiz
+from quizmaster.services.journal_store import JOURNAL_PREFIX, SNAPSHOT_PREFIX, JournalQuizStore
+from quizmaster.services.quiz_store import create_store
+
+
+def open_store(directory, **kwargs):
+    """Open a journal store without the background compactor."""
+    return JournalQuizStore(str(directory), compact_interval=0, **kwargs)
+
+
+def make_quiz(title="Test Quiz", questions=0, dedup_policy="off"):
+    """Build a quiz with the given number of questions."""
+    quiz = Quiz(title, "A quiz", dedup_policy)
+    for i in range(questions):
+        quiz.add_question(f"Question {i}", ["A", "B", "Ünïcode"], i % 3)
+    return quiz
+
+
+def test_journal_store_recovers_quizzes_after_restart(tmp_path):
+    """Test that quizzes, questions, dedup policies, IDs and the epoch survive reopening."""
+    # Arrange
+    store = open_store(tmp_path)
+    first = store.add_quiz(make_quiz(questions=3, dedup_policy="reject"))
+    second = store.add_quiz(make_quiz("Second"))
+    errors = store.add_questions(second, [("Good", ["A", "B"], 1), ("Bad", ["A"], 4)])
+    epoch = store.epoch
+    store.close()
+    
+    # Act
+    reopened = create_store(f"journal:///{tmp_path}")
+    
+    # Assert
+    assert errors == [None, "Correct answer index out of range"]
+    assert reopened.epoch == epoch
+    info = reopened.get_quiz_info(first)
+    assert (info.title, info.description, info.question_count, info.dedup_policy) == (
+        "Test Quiz", "A quiz", 3, "reject"
+    )
+    assert reopened.get_question(first, 2).to_dict() == {
+        "question": "Question 2", "answers": ["A", "B", "Ünïcode"], "correct_answer_index": 2
+    }
+    assert [q.question for q in reopened.get_quiz(second).questions] == ["Good"]
+    assert reopened.add_quiz(make_quiz()) == second + 1
+    reopened.close()
+
+
+def test_compaction_replaces_history_with_a_snapshot(tmp_path):
+    """Test that after compaction only the journal tail is replayed on startup."""
+    # Arrange
+    store = open_store(tmp_path)
+    quiz_id = store.add_quiz(make_quiz())
+    for i in range(50):
+        store.add_question(quiz_id, f"Old {i}", ["A", "B"], 0)
+    store.compact()
+    store.add_question(quiz_id, "New", ["A", "B"], 1)
+    store.close()
+    
+    # Act
+    reopened = open_store(tmp_path)
+    
+    # Assert
+    assert sorted(os.listdir(tmp_path)) == [f"{JOURNAL_PREFIX}00000001", f"{SNAPSHOT_PREFIX}00000001"]
+    assert reopened.recovered_records == 1
+    assert reopened.get_quiz_info(quiz_id).question_count == 51
+    assert reopened.get_question(quiz_id, 50).question == "New"
+    reopened.close()
+
+
+def test_torn_journal_tail_is_discarded(tmp_path):
+    """Test that a record cut short by a crash is dropped and appends continue after the last good one."""
+    # Arrange
+    store = open_store(tmp_path)
+    quiz_id = store.add_quiz(make_quiz(questions=2))
+    store.add_question(quiz_id, "Lost", ["A", "B"], 0)
+    store.close()
+    path = tmp_path / f"{JOURNAL_PREFIX}00000000"
+    with open(path, "r+b") as file:
+        file.truncate(os.path.getsize(path) - 3)
+    
+    # Act
+    recovered = open_store(tmp_path)
+    recovered.add_question(quiz_id, "Kept", ["A", "B"], 1)
+    recovered.close()
+    reopened = open_store(tmp_path)
+    
+    # Assert
+    assert [q.question for q in reopened.get_quiz(quiz_id).questions] == ["Question 0", "Question 1", "Kept"]
+    reopened.close()
+
+
+def test_concurrent_appends_share_fsyncs(tmp_path):
+    """Test that appends from many threads are committed in fewer groups than records."""
+    # Arrange
+    store = open_store(tmp_path)
+    quiz_id = store.add_quiz(make_quiz())
+    
+    def add_questions(worker):
+        for i in range(25):
+            store.add_question(quiz_id, f"Worker {worker} question {i}", ["A", "B"], 0)
+    
+    threads = [threading.Thread(target=add_questions, args=(worker,)) for worker in range(8)]
+    
+    # Act
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    writer = store.writer
+    store.close()
+    reopened = open_store(tmp_path)
+    
+    # Assert
+    assert writer.records == 201
+    assert writer.groups < writer.records
+    assert reopened.get_quiz_info(quiz_id).question_count == 200
+    reopened.close()
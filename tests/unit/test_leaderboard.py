@@ -0,0 +1,101 @@
+"""
+Unit tests for leaderboards.
+"""
+
+from quizmaster.services.leaderboard import Leaderboard, Leaderboards
+
+
+def build_board():
+    """Provide a leaderboard with a tie."""
+    board = Leaderboard()
+    board.record("ann", 5)
+    board.record("bob", 8)
+    board.record("cat", 5)
+    board.record("dan", 2)
+    return board
+
+
+def test_page_orders_by_score_with_shared_ranks():
+    """Test that entries are best first, ties in arrival order with a shared rank."""
+    # Arrange
+    board = build_board()
+    
+    # Act
+    entries = board.top(10)
+    
+    # Assert
+    assert entries == [(1, "bob", 8), (2, "ann", 5), (2, "cat", 5), (4, "dan", 2)]
+
+
+def test_page_offsets():
+    """Test pages starting inside a group of tied scores and past the end."""
+    # Arrange
+    board = build_board()
+    
+    # Act & Assert
+    assert board.page(2, 2) == [(2, "cat", 5), (4, "dan", 2)]
+    assert board.page(1, 1) == [(2, "ann", 5)]
+    assert board.page(4, 10) == []
+
+
+def test_page_skips_empty_scores():
+    """Test that a page visits only occupied scores, however far apart they are."""
+    # Arrange
+    class VisitedScores(dict):
+        def __init__(self, *args):
+            super().__init__(*args)
+            self.visited = []
+
+        def __getitem__(self, score):
+            self.visited.append(score)
+            return super().__getitem__(score)
+
+        def get(self, score, default=None):
+            self.visited.append(score)
+            return super().get(score, default)
+
+    board = Leaderboard()
+    board.record("low", 0)
+    board.record("high", 2_000_000)
+    board.record("mid", 1_000)
+    board._buckets = VisitedScores(board._buckets)
+    
+    # Act
+    entries = board.page(0, 10)
+    
+    # Assert
+    assert entries == [(1, "high", 2_000_000), (2, "mid", 1_000), (3, "low", 0)]
+    assert board._buckets.visited == [2_000_000, 1_000, 0]
+
+
+def test_record_keeps_best_score():
+    """Test that only improvements change a user's entry."""
+    # Arrange
+    board = build_board()
+    
+    # Act
+    lower = board.record("bob", 3)
+    higher = board.record("dan", 9)
+    
+    # Assert
+    assert not lower
+    assert higher
+    assert board.rank("dan") == (1, 9)
+    assert board.rank("bob") == (2, 8)
+    assert board.rank("eve") is None
+    assert len(board) == 4
+
+
+def test_leaderboards_are_per_quiz():
+    """Test that each quiz gets its own leaderboard."""
+    # Arrange
+    boards = Leaderboards()
+    
+    # Act
+    boards.record(0, "ann", 3)
+    boards.record(1, "bob", 1)
+    
+    # Assert
+    assert boards.get(0).top() == [(1, "ann", 3)]
+    assert boards.get(1).top() == [(1, "bob", 1)]
+    assert boards.get(2) is None
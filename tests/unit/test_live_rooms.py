@@ -0,0 +1,202 @@
+"""
+Unit tests for live multiplayer rooms.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from quizmaster.models.quiz import Quiz
+from quizmaster.services.live_rooms import (
+    ROOM_FINISHED, ROOM_QUESTION, ROOM_REVEALED, RoomRegistry
+)
+
+
+def make_quiz():
+    """Create a quiz with two questions."""
+    quiz = Quiz("Live Quiz")
+    quiz.add_question("What is 2 + 2?", ["3", "4"], 1)
+    quiz.add_question("What is 3 + 3?", ["6", "7", "8"], 0)
+    return quiz
+
+
+def drain(participant):
+    """Return the decoded messages waiting for a participant."""
+    messages = []
+    while not participant.outbox.empty():
+        text = participant.outbox.get_nowait()
+        messages.append(None if text is None else json.loads(text))
+    return messages
+
+
+def test_broadcast_is_serialized_once():
+    """Test that every participant is queued the very same message string."""
+    async def run():
+        room = RoomRegistry().create(1, make_quiz())
+        participants = [room.join(f"Player {i}") for i in range(100)]
+        for participant in participants:
+            drain(participant)
+        
+        # Act
+        room.advance()
+        return [participant.outbox.get_nowait() for participant in participants]
+    
+    # Arrange & Act
+    texts = asyncio.run(run())
+    
+    # Assert
+    assert all(text is texts[0] for text in texts)
+    question = json.loads(texts[0])
+    assert question == {
+        "type": "question", "index": 0, "question_count": 2, "text": "What is 2 + 2?", "answers": ["3", "4"]
+    }
+
+
+def test_answers_are_tallied_incrementally_and_pushed_once_per_interval():
+    """Test that many answers lead to one coalesced tally, and duplicate answers are ignored."""
+    async def run():
+        room = RoomRegistry(tally_interval=0.01).create(1, make_quiz())
+        alice, bob = room.join("Alice"), room.join("Bob")
+        room.advance()
+        drain(alice)
+        
+        # Act
+        await room.submit(alice, 1)
+        await room.submit(alice, 0)
+        await room.submit(bob, 0)
+        await asyncio.sleep(0.05)
+        tallies = drain(alice)
+        room.advance()
+        reveal = drain(bob)[-1]
+        return room, alice, bob, tallies, reveal
+    
+    # Arrange & Act
+    room, alice, bob, tallies, reveal = asyncio.run(run())
+    
+    # Assert
+    assert tallies == [{"type": "tally", "index": 0, "counts": [1, 1], "answered": 2, "participants": 2}]
+    assert reveal == {"type": "reveal", "index": 0, "correct_answer_index": 1, "counts": [1, 1], "answered": 2}
+    assert room.state == ROOM_REVEALED
+    assert (alice.score, bob.score) == (1, 0)
+
+
+def test_room_runs_through_questions_and_finishes_with_standings():
+    """Test the advance cycle from the first question to the final standings."""
+    async def run():
+        room = RoomRegistry(tally_interval=0).create(1, make_quiz())
+        alice, bob = room.join("Alice"), room.join("Bob")
+        states = []
+        for answers in ((1, 0), (0, 0)):
+            states.append(room.advance())
+            await room.submit(alice, answers[0])
+            await room.submit(bob, answers[1])
+            await asyncio.sleep(0)
+            states.append(room.advance())
+        
+        # Act
+        states.append(room.advance())
+        return room, states, drain(bob)
+    
+    # Arrange & Act
+    room, states, messages = asyncio.run(run())
+    
+    # Assert
+    assert states == [ROOM_QUESTION, ROOM_REVEALED, ROOM_QUESTION, ROOM_REVEALED, ROOM_FINISHED]
+    assert messages[-2]["standings"] == [
+        {"rank": 1, "participant_id": room.top()[0]["participant_id"], "name": "Alice", "score": 2},
+        {"rank": 2, "participant_id": room.top()[1]["participant_id"], "name": "Bob", "score": 1},
+    ]
+    assert messages[-1] is None
+    with pytest.raises(ValueError):
+        room.advance()
+
+
+def test_slow_participant_is_dropped_without_blocking_others():
+    """Test that a participant whose queue is full is disconnected and removed."""
+    async def run():
+        room = RoomRegistry(queue_size=2).create(1, make_quiz())
+        slow = room.join("Slow")
+        fast = room.join("Fast")
+        
+        # Act
+        room.advance()
+        drain(fast)
+        room.advance()
+        return room, slow, fast
+    
+    # Arrange & Act
+    room, slow, fast = asyncio.run(run())
+    
+    # Assert
+    assert slow.dropped
+    assert list(room.participants) == [fast.participant_id]
+    assert drain(slow) == [None]
+    assert drain(fast)[0]["type"] == "reveal"
+
+
+def test_participant_who_is_behind_still_receives_the_standings():
+    """Test that finishing a room evicts a full queue's oldest messages rather than dropping the participant."""
+    async def run():
+        room = RoomRegistry(queue_size=2).create(1, make_quiz())
+        slow = room.join("Slow")
+        room.advance()
+        
+        # Act
+        room.finish()
+        return slow
+    
+    # Arrange & Act
+    slow = asyncio.run(run())
+    
+    # Assert
+    assert not slow.dropped
+    messages = drain(slow)
+    assert messages[-2]["type"] == "finished"
+    assert messages[-1] is None
+
+
+def test_registry_removes_finished_rooms():
+    """Test that a room advanced past its last question leaves the registry."""
+    async def run():
+        rooms = RoomRegistry(tally_interval=0)
+        room = rooms.create(1, make_quiz())
+        
+        # Act
+        states = [rooms.advance(room) for _ in range(5)]
+        return rooms, room, states
+    
+    # Arrange & Act
+    rooms, room, states = asyncio.run(run())
+    
+    # Assert
+    assert states[-1] == ROOM_FINISHED
+    assert len(rooms) == 0
+    assert rooms.get(room.room_id) is None
+
+
+def test_registry_closes_rooms_whose_host_is_idle():
+    """Test that rooms expire a TTL after the host's last action and disconnect their participants."""
+    async def run():
+        now = [0.0]
+        rooms = RoomRegistry(ttl=60, clock=lambda: now[0])
+        idle = rooms.create(1, make_quiz())
+        active = rooms.create(1, make_quiz())
+        player = idle.join("Ada")
+        now[0] = 50.0
+        rooms.advance(active)
+        
+        # Act
+        now[0] = 70.0
+        found = rooms.get(idle.room_id), rooms.get(active.room_id)
+        return rooms, idle, active, player, found
+    
+    # Arrange & Act
+    rooms, idle, active, player, found = asyncio.run(run())
+    
+    # Assert
+    assert found == (None, active)
+    assert idle.state == ROOM_FINISHED
+    assert [m and m["type"] for m in drain(player)] == ["joined", "finished", None]
+    assert rooms.expired == 1
+    assert len(rooms) == 1
@@ -0,0 +1,867 @@
+"""
+Unit tests for the QuizMaster REST API.
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+
+import httpx
+import pytest
+from fastapi import WebSocketDisconnect
+from fastapi.testclient import TestClient
+
+from quizmaster import main
+from quizmaster.models.quiz import Quiz
+from quizmaster.services.analytics import AnswerStats
+from quizmaster.services.bot_engine import BotEngine
+from quizmaster.services.journal_store import JournalQuizStore
+from quizmaster.services.leaderboard import Leaderboards
+from quizmaster.services.live_rooms import RoomRegistry
+from quizmaster.services.quiz_store import MemoryQuizStore
+from quizmaster.services.sampling import SamplerRegistry
+from quizmaster.services.search import SearchIndex
+from quizmaster.services.sessions import SessionEngine
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Provide a test client with empty in-memory storage."""
+    store = MemoryQuizStore()
+    store.add_listener(main.on_questions_added)
+    monkeypatch.setattr(main, "store", store)
+    monkeypatch.setattr(main, "search_index", SearchIndex())
+    monkeypatch.setattr(main, "sessions", SessionEngine())
+    monkeypatch.setattr(main, "dedup", None)
+    monkeypatch.setattr(main, "answer_stats", AnswerStats())
+    monkeypatch.setattr(main, "leaderboards", Leaderboards())
+    monkeypatch.setattr(main, "bots", BotEngine())
+    monkeypatch.setattr(main, "rooms", RoomRegistry(tally_interval=0))
+    monkeypatch.setattr(main, "samplers", SamplerRegistry())
+    monkeypatch.setattr(main, "item_banks", None)
+    main.response_cache.clear()
+    main.metrics.clear()
+    return TestClient(main.app)
+
+
+def create_quiz(client, title="Test Quiz"):
+    """Create a quiz through the API and return its ID."""
+    response = client.post("/quizzes", json={"title": title, "description": "A quiz"})
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def add_question(client, quiz_id, text="What is 2 + 2?", answers=("3", "4"), correct=1):
+    """Add a question through the API and return the response."""
+    return client.post(
+        f"/quizzes/{quiz_id}/questions",
+        json={"text": text, "answers": list(answers), "correct_answer_index": correct},
+    )
+
+
+def test_get_quiz_is_served_from_cache(client):
+    """Test that repeated reads of a quiz hit the response cache."""
+    # Arrange
+    quiz_id = create_quiz(client)
+    
+    # Act
+    first = client.get(f"/quizzes/{quiz_id}")
+    second = client.get(f"/quizzes/{quiz_id}")
+    
+    # Assert
+    assert first.json() == second.json()
+    assert client.get("/cache/stats").json()["hits"] >= 2
+
+
+def test_add_question_invalidates_cached_quiz(client):
+    """Test that adding a question is reflected in subsequent reads."""
+    # Arrange
+    quiz_id = create_quiz(client)
+    client.get(f"/quizzes/{quiz_id}")
+    
+    # Act
+    add_question(client, quiz_id)
+    quiz = client.get(f"/quizzes/{quiz_id}").json()
+    
+    # Assert
+    assert len(quiz["questions"]) == 1
+    assert quiz["questions"][0]["answers"][1] == {"text": "4", "is_correct": True}
+
+
+def test_get_quizzes_lists_all_quizzes(client):
+    """Test that GET /quizzes returns every quiz."""
+    # Arrange
+    create_quiz(client, "First")
+    create_quiz(client, "Second")
+    
+    # Act
+    response = client.get("/quizzes")
+    
+    # Assert
+    assert response.status_code == 200
+    assert [quiz["title"] for quiz in response.json()] == ["First", "Second"]
+
+
+def test_get_quiz_returns_304_for_matching_etag(client):
+    """Test that a conditional GET with the current ETag is answered with 304."""
+    # Arrange
+    quiz_id = create_quiz(client)
+    etag = client.get(f"/quizzes/{quiz_id}").headers["etag"]
+    
+    # Act
+    response = client.get(f"/quizzes/{quiz_id}", headers={"If-None-Match": etag})
+    
+    # Assert
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+
+
+@pytest.mark.parametrize("fast_json", [True, False])
+def test_quiz_response_renders_the_version_of_its_etag(client, monkeypatch, fast_json):
+    """Test that a write landing after the metadata was read does not leak into the body or its cache entry."""
+    # Arrange
+    monkeypatch.setattr(main, "FAST_JSON", fast_json)
+    quiz_id = create_quiz(client)
+    add_question(client, quiz_id)
+    info = main.store.get_quiz_info(quiz_id)
+    main.store.add_question(quiz_id, "Appended while rendering?", ["Yes", "No"], 0)
+    main.response_cache.clear()
+    
+    # Act
+    response = main.quiz_response(info)
+    
+    # Assert
+    body = json.loads(response.body)
+    assert (body["version"], len(body["questions"])) == (1, 1)
+    assert response.headers["etag"] == main.quiz_etag(info)
+    assert main.response_cache.get(quiz_id, 1) == response.body
+    assert main.response_cache.get(quiz_id, 2) is None
+
+def test_get_quiz_etag_changes_when_question_added(client):
+    """Test that adding a question makes the old ETag stale."""
+    # Arrange
+    quiz_id = create_quiz(client)
+    etag = client.get(f"/quizzes/{quiz_id}").headers["etag"]
+    add_question(client, quiz_id)
+    
+    # Act
+    response = client.get(f"/quizzes/{quiz_id}", headers={"If-None-Match": etag})
+    
+    # Assert
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+def test_get_question_supports_conditional_get(client):
+    """Test that single questions carry an ETag and honour If-None-Match."""
+    # Arrange
+    quiz_id = create_quiz(client)
+    add_question(client, quiz_id)
+    first = client.get(f"/quizzes/{quiz_id}/questions/0")
+    
+    # Act
+    second = client.get(
+        f"/quizzes/{quiz_id}/questions/0",
+        headers={"If-None-Match": first.headers["etag"]},
+    )
+    
+    # Assert
+    assert first.status_code == 200
+    assert first.json()["text"] == "What is 2 + 2?"
+    assert second.status_code == 304
+
+
+def test_get_quizzes_paginates_with_cursor(client):
+    """Test that limit/after walk through the quizzes page by page."""
+    # Arrange
+    for i in range(5):
+        create_quiz(client, f"Quiz {i}")
+    
+    # Act
+    first = client.get("/quizzes", params={"limit": 2})
+    cursor = first.headers["x-next-cursor"]
+    second = client.get("/quizzes", params={"limit": 2, "after": cursor})
+    last = client.get("/quizzes", params={"limit": 2, "after": second.headers["x-next-cursor"]})
+    
+    # Assert
+    assert [quiz["id"] for quiz in first.json()] == [0, 1]
+    assert [quiz["id"] for quiz in second.json()] == [2, 3]
+    assert [quiz["id"] for quiz in last.json()] == [4]
+    assert "x-next-cursor" not in last.headers
+
+
+def test_get_quizzes_summary_view_omits_questions(client):
+    """Test that the summary projection reports a question count instead of questions."""
+    # Arrange
+    quiz_id = create_quiz(client)
+    add_question(client, quiz_id)
+    
+    # Act
+    response = client.get("/quizzes", params={"view": "summary"})
+    
+    # Assert
+    assert response.json() == [
+        {"id": quiz_id, "title": "Test Quiz", "description": "A quiz", "version": 1, "question_count": 1}
+    ]
+
+
+def test_get_quizzes_streams_ndjson(client):
+    """Test that NDJSON mode yields one quiz per line."""
+    # Arrange
+    create_quiz(client, "First")
+    create_quiz(client, "Second")
+    
+    # Act
+    response = client.get("/quizzes", headers={"Accept": "application/x-ndjson"})
+    
+    # Assert
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [quiz["title"] for quiz in lines] == ["First", "Second"]
+
+
+def test_bulk_import_returns_summary(client):
+    """Test that the bulk endpoint imports JSONL rows and reports per-row errors."""
+    # Arrange
+    quiz_id = create_quiz(client)
+    rows = [
+        {"text": "Q1", "answers": ["A", "B"], "correct_answer_index": 0},
+        {"text": "Q2", "answers": ["A", "B"], "correct_answer_index": 2},
+        {"text": "Q3", "answers": ["A", "B"], "correct_answer_index": 1},
+    ]
+    body = "\n".join(json.dumps(row) for row in rows)
+    
+    # Act
+    response = client.post(
+        f"/quizzes/{quiz_id}/questions/bulk",
+        content=body,
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    
+    # Assert
+    assert response.status_code == 200
+    result = response.json()
+    assert result["imported"] == 2
+    assert result["failed"] == 1
+    assert result["question_count"] == 2
+    assert result["errors"] == [{"line": 2, "error": "Correct answer index out of range"}]
+
+
+def test_bulk_import_rejects_unknown_content_type(client):
+    """Test that unsupported bodies are rejected with 415."""
+    # Arrange
+    quiz_id = create_quiz(client)
+    
+    # Act
+    response = client.post(f"/quizzes/{quiz_id}/questions/bulk", json=[])
+    
+    # Assert
+    assert response.status_code == 415
+
+
+def test_grade_answer_sheet(client):
+    """Test grading a whole sheet in one request."""
+    # Arrange
+    quiz_id = create_quiz(client)
+    add_question(client, quiz_id)
+    add_question(client, quiz_id, correct=0)
+    
+    # Act
+    response = client.post(f"/quizzes/{quiz_id}/grade", json={"answers": [1, 1]})
+    
+    # Assert
+    assert response.json() == {"correct": [True, False], "score": 1, "answered": 2, "question_count": 2}
+
+
+def test_grade_answer_sheets_in_bulk(client):
+    """Test the bulk grading endpoint and its validation."""
+    # Arrange
+    quiz_id = create_quiz(client)
+    add_question(client, quiz_id)
+    
+    # Act
+    response = client.post(f"/quizzes/{quiz_id}/grade/bulk", json={"sheets": [[1], [0], [None]]})
+    invalid = client.post(f"/quizzes/{quiz_id}/grade/bulk", json={"sheets": [[2]]})
+    
+    # Assert
+    assert response.json()["scores"] == [1, 0, 0]
+    assert response.json()["question_correct_counts"] == [1]
+    assert invalid.status_code == 400
+
+
+def test_shared_store_url_replaces_memory_store():
+    """Test that multi-worker mode never uses the process-local memory store."""
+    assert main.shared_store_url("memory").startswith("sqlite:///")
+    assert main.shared_store_url("sqlite:///data/quizzes.db") == "sqlite:///data/quizzes.db"
+    with pytest.raises(ValueError):
+        main.shared_store_url("journal:///data")
+
+
+def test_concurrent_writes_share_journal_commits(client, monkeypatch, tmp_path):
+    """Test that concurrent API writes wait off the event loop, so the journal commits them in groups."""
+    # Arrange
+    def slow_fsync(fd, fsync=os.fsync):
+        time.sleep(0.01)
+        fsync(fd)
+    
+    store = JournalQuizStore(str(tmp_path / "journal"), compact_interval=0)
+    store.add_listener(main.on_questions_added)
+    monkeypatch.setattr(main, "store", store)
+    monkeypatch.setattr(os, "fsync", slow_fsync)
+    quiz_id = store.add_quiz(Quiz("Concurrent"))
+    records = store.writer.records
+    
+    async def post_questions(count):
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+            return await asyncio.gather(*(
+                http.post(f"/quizzes/{quiz_id}/questions", json={
+                    "text": f"Question {i}?", "answers": ["A", "B"], "correct_answer_index": 0
+                })
+                for i in range(count)
+            ))
+    
+    # Act
+    groups = store.writer.groups
+    responses = asyncio.run(post_questions(40))
+    groups = store.writer.groups - groups
+    
+    # Assert
+    assert all(response.status_code == 200 for response in responses)
+    assert store.writer.records - records == 40
+    assert groups <= 10
+    store.close()
+
+
+def test_parse_arguments_defaults():
+    """Test the default server options."""
+    args = main.parse_arguments([])
+    
+    assert (args.host, args.port, args.workers) == ("0.0.0.0", 8091, 1)
+
+
+def test_session_lifecycle(client):
+    """Test starting, advancing and finishing a server-side attempt."""
+    # Arrange
+    quiz_id = create_quiz(client)
+    add_question(client, quiz_id)
+    add_question(client, quiz_id, correct=0)
+    
+    # Act
+    session = client.post(f"/quizzes/{quiz_id}/sessions").json()
+    session_id = session["session_id"]
+    first = client.post(f"/sessions/{session_id}/answer", json={"answer_index": 1}).json()
+    second = client.post(f"/sessions/{session_id}/answer", json={"answer_index": 1}).json()
+    extra = client.post(f"/sessions/{session_id}/answer", json={"answer_index": 0})
+    final = client.post(f"/sessions/{session_id}/finish").json()
+    
+    # Assert
+    assert session["next_question_id"] == 0
+    assert first["is_correct"] is True
+    assert first["session"]["next_question_id"] == 1
+    assert second["is_correct"] is False
+    assert second["correct_answer"] == "3"
+    assert extra.status_code == 409
+    assert (final["score"], final["answered"], final["next_question_id"]) == (1, 2, None)
+    assert client.get(f"/sessions/{session_id}").status_code == 404
+
+
+def test_search_finds_added_questions(client):
+    """Test that questions are searchable as soon as they are added."""
+    # Arrange
+    quiz_id = create_quiz(client)
+    add_question(client, quiz_id, text="What is the capital of France?", answers=("London", "Paris"))
+    add_question(client, quiz_id, text="What is the capital of Spain?", answers=("Madrid", "Rome"))
+    
+    # Act
+    response = client.get("/search", params={"q": "capital par"})
+    
+    # Assert
+    results = response.json()
+    assert [r["question_id"] for r in results] == [0, 1]
+    assert results[0]["text"] == "What is the capital of France?"
+
+
+@pytest.mark.parametrize("policy, status_code, question_count", [
+    ("warn", 200, 2),
+    ("merge", 200, 1),
+    ("reject", 409, 1),
+])
+def test_add_duplicate_question_follows_dedup_policy(client, policy, status_code, question_count):
+    """Test that a duplicate question is accepted, skipped or rejected per the quiz policy."""
+    # Arrange
+    quiz_id = client.post("/quizzes", json={"title": "Dedup", "dedup_policy": policy}).json()["id"]
+    add_question(client, quiz_id, text="What is 2 + 2?")
+    
+    # Act
+    response = add_question(client, quiz_id, text="what is 2+2", answers=("4", "3"), correct=0)
+    
+    # Assert
+    assert response.status_code == status_code
+    if status_code == 200:
+        assert response.headers["X-Duplicate-Of"] == "0"
+    assert len(client.get(f"/quizzes/{quiz_id}").json()["questions"]) == question_count
+
+
+def test_dedup_is_off_by_default(client):
+    """Test that quizzes without a policy accept duplicates silently."""
+    # Arrange
+    quiz_id = create_quiz(client)
+    add_question(client, quiz_id)
+    
+    # Act
+    response = add_question(client, quiz_id)
+    
+    # Assert
+    assert response.status_code == 200
+    assert "X-Duplicate-Of" not in response.headers
+    assert len(response.json()["questions"]) == 2
+
+
+def test_concurrent_duplicates_are_rejected(client, monkeypatch, tmp_path):
+    """Test that identical questions posted at the same time are added only once under "reject"."""
+    # Arrange
+    def slow_fsync(fd, fsync=os.fsync):
+        time.sleep(0.01)
+        fsync(fd)
+    
+    store = JournalQuizStore(str(tmp_path / "journal"), compact_interval=0)
+    store.add_listener(main.on_questions_added)
+    monkeypatch.setattr(main, "store", store)
+    monkeypatch.setattr(os, "fsync", slow_fsync)
+    quiz_id = store.add_quiz(Quiz("Dedup", dedup_policy="reject"))
+    
+    async def post_duplicates(count):
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+            return await asyncio.gather(*(
+                http.post(f"/quizzes/{quiz_id}/questions", json={
+                    "text": "What is 2 + 2?", "answers": ["3", "4"], "correct_answer_index": 1
+                })
+                for _ in range(count)
+            ))
+    
+    # Act
+    responses = asyncio.run(post_duplicates(10))
+    
+    # Assert
+    assert sorted(response.status_code for response in responses) == [200] + [409] * 9
+    assert store.get_quiz_info(quiz_id).question_count == 1
+    store.close()
+
+def test_bulk_import_rejects_duplicates(client):
+    """Test that rejected duplicates are reported as row errors."""
+    # Arrange
+    quiz_id = client.post("/quizzes", json={"title": "Dedup", "dedup_policy": "reject"}).json()["id"]
+    add_question(client, quiz_id, text="What is 2 + 2?")
+    body = "What is 2 + 2?,3,4,1\nWhat is 3 + 3?,5,6,1\n"
+    
+    # Act
+    response = client.post(
+        f"/quizzes/{quiz_id}/questions/bulk", content=body, headers={"Content-Type": "text/csv"}
+    )
+    
+    # Assert
+    assert response.status_code == 200
+    assert response.json()["imported"] == 1
+    assert response.json()["errors"] == [{"line": 1, "error": "Duplicate of question 0"}]
+
+
+def test_quiz_analytics_counts_submissions_and_sheets(client):
+    """Test that submitted answers and graded sheets show up in the analytics."""
+    # Arrange
+    quiz_id = create_quiz(client)
+    add_question(client, quiz_id)
+    add_question(client, quiz_id, text="What is 3 + 3?", answers=("5", "6", "7"), correct=1)
+    client.post(f"/quizzes/{quiz_id}/questions/0/submit", json={"answer_index": 1})
+    client.post(f"/quizzes/{quiz_id}/questions/0/submit", json={"answer_index": 0})
+    client.post(f"/quizzes/{quiz_id}/grade", json={"answers": [1, 2]})
+    
+    # Act
+    response = client.get(f"/quizzes/{quiz_id}/analytics")
+    
+    # Assert
+    assert response.status_code == 200
+    data = response.json()
+    assert data["submissions"] == 4
+    first, second = data["questions"]
+    assert [a["count"] for a in first["answers"]] == [1, 2]
+    assert first["correct"] == 2
+    assert first["correct_rate"] == 2 / 3
+    assert [a["count"] for a in second["answers"]] == [0, 0, 1]
+    assert second["correct_rate"] == 0.0
+
+
+def test_quiz_analytics_without_answers(client):
+    """Test that unanswered questions report zero counts and no correct rate."""
+    # Arrange
+    quiz_id = create_quiz(client)
+    add_question(client, quiz_id)
+    
+    # Act
+    response = client.get(f"/quizzes/{quiz_id}/analytics")
+    
+    # Assert
+    question = response.json()["questions"][0]
+    assert question["submissions"] == 0
+    assert question["correct_rate"] is None
+    assert client.get("/quizzes/999/analytics").status_code == 404
+
+
+def test_leaderboard_ranks_graded_sheets_and_sessions(client):
+    """Test that named sheets and finished sessions are ranked by best score."""
+    # Arrange
+    quiz_id = create_quiz(client)
+    add_question(client, quiz_id)
+    add_question(client, quiz_id, text="What is 3 + 3?", answers=("5", "6"), correct=1)
+    client.post(f"/quizzes/{quiz_id}/grade", json={"answers": [1, 1], "user_id": "ann"})
+    client.post(f"/quizzes/{quiz_id}/grade/bulk", json={"sheets": [[1, 0], [0, 0]], "user_ids": ["bob", None]})
+    session_id = client.post(f"/quizzes/{quiz_id}/sessions", json={"user_id": "cat"}).json()["session_id"]
+    client.post(f"/sessions/{session_id}/answer", json={"answer_index": 1})
+    client.post(f"/sessions/{session_id}/finish")
+    
+    # Act
+    response = client.get(f"/quizzes/{quiz_id}/leaderboard", params={"limit": 2, "offset": 1})
+    
+    # Assert
+    assert response.status_code == 200
+    assert response.json() == {
+        "quiz_id": quiz_id,
+        "total": 3,
+        "entries": [{"rank": 2, "user_id": "bob", "score": 1}, {"rank": 2, "user_id": "cat", "score": 1}],
+    }
+    assert client.get(f"/quizzes/{quiz_id}/leaderboard/ann").json() == {"rank": 1, "user_id": "ann", "score": 2}
+    assert client.get(f"/quizzes/{quiz_id}/leaderboard/dan").status_code == 404
+
+
+def test_bulk_grade_rejects_mismatched_user_ids(client):
+    """Test that user_ids must line up with the sheets."""
+    # Arrange
+    quiz_id = create_quiz(client)
+    add_question(client, quiz_id)
+    
+    # Act
+    response = client.post(f"/quizzes/{quiz_id}/grade/bulk", json={"sheets": [[1]], "user_ids": []})
+    
+    # Assert
+    assert response.status_code == 400
+
+
+def test_quiz_changes_returns_questions_since_version(client):
+    """Test that only questions appended after the given version are returned."""
+    # Arrange
+    quiz_id = create_quiz(client)
+    add_question(client, quiz_id)
+    version = client.get(f"/quizzes/{quiz_id}").json()["version"]
+    add_question(client, quiz_id, text="What is 3 + 3?", answers=("5", "6"), correct=1)
+    
+    # Act
+    response = client.get(f"/quizzes/{quiz_id}/changes", params={"since": version})
+    
+    # Assert
+    assert response.status_code == 200
+    data = response.json()
+    assert data["since"] == 1
+    assert data["version"] == 2
+    assert data["epoch"] == main.store.epoch
+    assert [q["id"] for q in data["questions"]] == [1]
+    assert data["questions"][0]["text"] == "What is 3 + 3?"
+
+
+def test_quiz_changes_when_up_to_date(client):
+    """Test an empty delta, conditional requests and versions from the future."""
+    # Arrange
+    quiz_id = create_quiz(client)
+    add_question(client, quiz_id)
+    
+    # Act
+    response = client.get(f"/quizzes/{quiz_id}/changes", params={"since": 1})
+    cached = client.get(
+        f"/quizzes/{quiz_id}/changes", params={"since": 1}, headers={"If-None-Match": response.headers["ETag"]}
+    )
+    ahead = client.get(f"/quizzes/{quiz_id}/changes", params={"since": 5})
+    
+    # Assert
+    assert response.json()["questions"] == []
+    assert response.json()["version"] == 1
+    assert cached.status_code == 304
+    assert ahead.status_code == 409
+
+
+def test_large_quiz_is_compressed_and_cached(client, monkeypatch):
+    """Test that large quiz bodies are gzip-encoded with a matching ETag and Vary header."""
+    # Arrange
+    monkeypatch.setattr(main, "COMPRESS_MIN_BYTES", 100)
+    monkeypatch.setattr(main, "FAST_JSON", True)
+    quiz_id = create_quiz(client)
+    for i in range(5):
+        add_question(client, quiz_id, text=f"Question {i} about something long enough")
+    
+    # Act
+    response = client.get(f"/quizzes/{quiz_id}", headers={"Accept-Encoding": "gzip"})
+    cached = client.get(
+        f"/quizzes/{quiz_id}", headers={"Accept-Encoding": "gzip", "If-None-Match": response.headers["ETag"]}
+    )
+    plain = client.get(f"/quizzes/{quiz_id}", headers={"Accept-Encoding": "identity"})
+    
+    # Assert
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["Vary"]
+    assert response.headers["ETag"].endswith('-gzip"')
+    assert response.json() == plain.json()
+    assert "Content-Encoding" not in plain.headers
+    assert plain.headers["ETag"] != response.headers["ETag"]
+    assert cached.status_code == 304
+
+
+def test_metrics_are_labelled_by_route_template(client):
+    """Test that /metrics reports requests per route template with store sizes."""
+    # Arrange
+    quiz_id = create_quiz(client)
+    add_question(client, quiz_id)
+    client.get(f"/quizzes/{quiz_id}")
+    client.get(f"/quizzes/{quiz_id}")
+    client.get("/no/such/path")
+    
+    # Act
+    response = client.get("/metrics")
+    
+    # Assert
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = response.text
+    assert 'quizmaster_http_requests_total{method="GET",route="/quizzes/{quiz_id}",status="200"} 2' in text
+    assert 'quizmaster_http_requests_total{method="GET",route="unmatched",status="404"} 1' in text
+    assert 'quizmaster_http_request_duration_seconds_count{method="GET",route="/quizzes/{quiz_id}"} 2' in text
+    assert "quizmaster_quizzes 1\n" in text
+    assert "quizmaster_questions 1\n" in text
+    assert "quizmaster_http_requests_in_flight 1\n" in text
+    assert "quizmaster_response_cache_hit_ratio" in text
+
+
+def test_admin_profile_requires_token(client, monkeypatch):
+    """Test that the profiler is disabled without a configured token and rejects wrong tokens."""
+    # Arrange
+    monkeypatch.setattr(main, "ADMIN_TOKEN", "")
+    disabled = client.post("/admin/profile", params={"seconds": 0.01}, headers={"X-Admin-Token": ""})
+    monkeypatch.setattr(main, "ADMIN_TOKEN", "secret")
+    
+    # Act
+    wrong = client.post("/admin/profile", params={"seconds": 0.01}, headers={"X-Admin-Token": "guess"})
+    right = client.post("/admin/profile", params={"seconds": 0.01}, headers={"X-Admin-Token": "secret"})
+    
+    # Assert
+    assert disabled.status_code == 403
+    assert wrong.status_code == 403
+    assert right.status_code == 200
+    assert right.headers["content-type"].startswith("text/plain")
+    assert "X-Profile-Samples" in right.headers
+
+
+def test_admin_profile_covers_the_next_requests_to_a_route(monkeypatch):
+    """Test that a route profile returns once the requested number of requests has finished."""
+    # Arrange
+    monkeypatch.setattr(main, "store", MemoryQuizStore())
+    monkeypatch.setattr(main, "ADMIN_TOKEN", "secret")
+    main.response_cache.clear()
+    results = []
+    with TestClient(main.app) as client:
+        quiz_id = create_quiz(client)
+        profiler = threading.Thread(target=lambda: results.append(client.post(
+            "/admin/profile/requests",
+            params={"route": "/quizzes/{quiz_id}", "count": 2, "timeout": 10},
+            headers={"X-Admin-Token": "secret"},
+        )))
+        profiler.start()
+        while main.profiling.route_profile is None:
+            time.sleep(0.001)
+        
+        # Act
+        client.get("/quizzes")
+        for _ in range(2):
+            client.get(f"/quizzes/{quiz_id}")
+        profiler.join()
+    
+    # Assert
+    assert results[0].status_code == 200
+    assert results[0].headers["X-Profiled-Requests"] == "2"
+    assert main.profiling.busy is False
+
+
+def test_admin_profile_rejects_unknown_route(client, monkeypatch):
+    """Test that profiling a route the app does not have fails fast."""
+    # Arrange
+    monkeypatch.setattr(main, "ADMIN_TOKEN", "secret")
+    
+    # Act
+    response = client.post(
+        "/admin/profile/requests", params={"route": "/nope"}, headers={"X-Admin-Token": "secret"}
+    )
+    
+    # Assert
+    assert response.status_code == 404
+
+
+def test_chat_with_bot_over_websocket(client):
+    """Test a quiz bot conversation over the WebSocket endpoint."""
+    # Arrange
+    quiz_id = create_quiz(client)
+    add_question(client, quiz_id)
+    
+    # Act
+    with client.websocket_connect(f"/quizzes/{quiz_id}/chat") as websocket:
+        greeting = websocket.receive_text()
+        websocket.send_text("5")
+        retry = websocket.receive_text()
+        websocket.send_text("2")
+        feedback = websocket.receive_text()
+    
+    # Assert
+    assert greeting.startswith("Welcome to the Test Quiz!")
+    assert "Question 1: What is 2 + 2?\n1. 3\n2. 4" in greeting
+    assert retry.startswith("Please enter a number between 1 and 2")
+    assert feedback.startswith("Correct! Well done!")
+    assert "You've completed the quiz." in feedback
+    assert main.bots.completed == 1
+
+
+def test_chat_with_missing_quiz_is_refused(client):
+    """Test that a chat for an unknown quiz is closed during the handshake."""
+    # Act & Assert
+    with pytest.raises(WebSocketDisconnect):
+        with client.websocket_connect("/quizzes/99/chat"):
+            pass
+
+
+def test_live_room_broadcasts_questions_and_tallies(client):
+    """Test a live room with a host driving questions to a WebSocket participant."""
+    # Entering the client runs every request on one event loop, as in a server
+    # Arrange
+    quiz_id = create_quiz(client)
+    add_question(client, quiz_id)
+    room = client.post("/rooms", json={"quiz_id": quiz_id}).json()
+    host = {"X-Host-Token": room["host_token"]}
+    
+    # Act
+    with client, client.websocket_connect(f"/rooms/{room['room_id']}/play?name=Ada") as websocket:
+        joined = websocket.receive_json()
+        client.post(f"/rooms/{room['room_id']}/advance", headers=host)
+        question = websocket.receive_json()
+        websocket.send_json({"answer": 1})
+        tally = websocket.receive_json()
+        state = client.get(f"/rooms/{room['room_id']}").json()
+        reveal = client.post(f"/rooms/{room['room_id']}/advance", headers=host).json()
+        websocket.receive_json()
+        client.post(f"/rooms/{room['room_id']}/advance", headers=host)
+        finished = websocket.receive_json()
+        after = client.get(f"/rooms/{room['room_id']}")
+    
+    # Assert
+    assert joined["type"] == "joined"
+    assert question["text"] == "What is 2 + 2?"
+    assert "correct_answer_index" not in question
+    assert tally["counts"] == [0, 1]
+    assert state["participants"] == 1
+    assert reveal["state"] == "revealed"
+    assert finished["standings"][0]["name"] == "Ada"
+    assert finished["standings"][0]["score"] == 1
+    assert after.status_code == 404
+
+
+def test_live_room_host_actions_need_the_host_token(client):
+    """Test that only the host can advance or close a room."""
+    # Arrange
+    quiz_id = create_quiz(client)
+    room = client.post("/rooms", json={"quiz_id": quiz_id}).json()
+    
+    # Act
+    advance = client.post(f"/rooms/{room['room_id']}/advance", headers={"X-Host-Token": "guess"})
+    close = client.delete(f"/rooms/{room['room_id']}", headers={"X-Host-Token": room["host_token"]})
+    
+    # Assert
+    assert advance.status_code == 403
+    assert close.status_code == 204
+    assert client.get(f"/rooms/{room['room_id']}").status_code == 404
+    assert client.post("/rooms", json={"quiz_id": 99}).status_code == 404
+
+
+def test_sample_questions_is_seeded_and_weighted(client):
+    """Test drawing questions with a seed and with weights that exclude questions."""
+    # Arrange
+    quiz_id = create_quiz(client)
+    for i in range(20):
+        add_question(client, quiz_id, text=f"Question {i}?")
+    
+    # Act
+    first = client.post(f"/quizzes/{quiz_id}/sample", json={"count": 5, "seed": 42}).json()
+    again = client.post(f"/quizzes/{quiz_id}/sample", json={"count": 5, "seed": first["seed"]}).json()
+    weighted = client.post(
+        f"/quizzes/{quiz_id}/sample",
+        json={"count": 2, "weights": {str(i): 0 for i in range(18)}}
+    ).json()
+    too_many = client.post(f"/quizzes/{quiz_id}/sample", json={"count": 21})
+    
+    # Assert
+    assert first == again
+    assert len({q["id"] for q in first["questions"]}) == 5
+    assert first["version"] == 20
+    assert sorted(q["id"] for q in weighted["questions"]) == [18, 19]
+    assert weighted["questions"][0]["text"] == f"Question {weighted['questions'][0]['id']}?"
+    assert too_many.status_code == 400
+
+
+def test_adaptive_session_asks_up_to_max_questions(client):
+    """Test that an adaptive attempt picks distinct questions, stops at its limit and reports an ability."""
+    # Arrange
+    quiz_id = create_quiz(client)
+    for i in range(6):
+        add_question(client, quiz_id, text=f"Question {i}?")
+    
+    # Act
+    session = client.post(f"/quizzes/{quiz_id}/sessions", json={"adaptive": True, "max_questions": 3}).json()
+    session_id = session["session_id"]
+    asked = [session["next_question_id"]]
+    for _ in range(3):
+        reply = client.post(f"/sessions/{session_id}/answer", json={"answer_index": 1}).json()
+        asked.append(reply["session"]["next_question_id"])
+    extra = client.post(f"/sessions/{session_id}/answer", json={"answer_index": 1})
+    final = client.post(f"/sessions/{session_id}/finish").json()
+    
+    # Assert
+    assert session["adaptive"] is True
+    assert session["ability"] == pytest.approx(0.0, abs=1e-6)
+    assert len(set(asked[:3])) == 3
+    assert asked[3] is None
+    assert extra.status_code == 409
+    assert (final["answered"], final["score"]) == (3, 3)
+    assert final["ability"] > 0.5
+    assert 0 < final["ability_se"] < 1
+
+
+def test_calibrate_uses_graded_sheets_and_finished_sessions(client):
+    """Test that calibration needs responses and counts those of sheets and sessions."""
+    # Arrange
+    quiz_id = create_quiz(client)
+    add_question(client, quiz_id)
+    add_question(client, quiz_id, correct=0)
+    empty = client.post(f"/quizzes/{quiz_id}/calibrate")
+    client.post(f"/quizzes/{quiz_id}/grade/bulk", json={"sheets": [[1, 0], [0, None], [1, 1]]})
+    session_id = client.post(f"/quizzes/{quiz_id}/sessions").json()["session_id"]
+    client.post(f"/sessions/{session_id}/answer", json={"answer_index": 1})
+    client.post(f"/sessions/{session_id}/finish")
+    
+    # Act
+    response = client.post(f"/quizzes/{quiz_id}/calibrate")
+    adaptive = client.post(f"/quizzes/{quiz_id}/sessions", json={"adaptive": True}).json()
+    
+    # Assert
+    assert empty.status_code == 400
+    assert client.post("/quizzes/999/calibrate").status_code == 404
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["responses"], body["learners"], body["question_count"]) == (6, 4, 2)
+    assert body["iterations"] >= 1
+    assert adaptive["next_question_id"] in (0, 1)
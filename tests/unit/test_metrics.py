@@ -0,0 +1,104 @@
+"""
+Unit tests for the request metrics.
+"""
+
+import asyncio
+
+from quizmaster.services.metrics import Metrics, MetricsMiddleware, escape_label
+
+
+class FakeRoute:
+    """A matched route with a path template."""
+
+    def __init__(self, path):
+        self.path = path
+
+
+def test_histogram_buckets_are_cumulative():
+    """Test that rendered histogram buckets count every observation at or below the bound."""
+    # Arrange
+    metrics = Metrics()
+    
+    # Act
+    metrics.observe("GET", "/quizzes", 200, 0.0004)
+    metrics.observe("GET", "/quizzes", 200, 0.003)
+    metrics.observe("GET", "/quizzes", 500, 20.0)
+    text = metrics.render()
+    
+    # Assert
+    assert 'quizmaster_http_requests_total{method="GET",route="/quizzes",status="200"} 2' in text
+    assert 'quizmaster_http_requests_total{method="GET",route="/quizzes",status="500"} 1' in text
+    assert 'quizmaster_http_request_duration_seconds_bucket{method="GET",route="/quizzes",le="0.0005"} 1' in text
+    assert 'quizmaster_http_request_duration_seconds_bucket{method="GET",route="/quizzes",le="0.005"} 2' in text
+    assert 'quizmaster_http_request_duration_seconds_bucket{method="GET",route="/quizzes",le="10"} 2' in text
+    assert 'quizmaster_http_request_duration_seconds_bucket{method="GET",route="/quizzes",le="+Inf"} 3' in text
+    assert 'quizmaster_http_request_duration_seconds_count{method="GET",route="/quizzes"} 3' in text
+
+
+def test_render_includes_gauges_and_escapes_labels():
+    """Test extra gauges and label escaping."""
+    # Arrange
+    metrics = Metrics()
+    metrics.observe("GET", 'a"b\\c', 200, 0.1)
+    
+    # Act
+    text = metrics.render([("quizzes", "Stored quizzes.", 3), ("ratio", "A ratio.", 0.25)])
+    
+    # Assert
+    assert escape_label('a"b\\c\n') == 'a\\"b\\\\c\\n'
+    assert 'route="a\\"b\\\\c"' in text
+    assert "# TYPE quizmaster_quizzes gauge\nquizmaster_quizzes 3\n" in text
+    assert "quizmaster_ratio 0.25\n" in text
+    assert text.endswith("\n")
+
+
+def test_middleware_records_status_route_and_in_flight():
+    """Test that the middleware times requests and reads the matched route template."""
+    # Arrange
+    metrics = Metrics()
+    in_flight = []
+    sent = []
+
+    async def app(scope, receive, send):
+        in_flight.append(metrics.in_flight)
+        scope["route"] = FakeRoute("/quizzes/{quiz_id}")
+        await send({"type": "http.response.start", "status": 404, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    async def send(message):
+        sent.append(message)
+
+    ticks = iter([1.0, 1.25])
+    middleware = MetricsMiddleware(app, metrics, clock=lambda: next(ticks))
+    
+    # Act
+    asyncio.run(middleware({"type": "http", "method": "GET", "path": "/quizzes/7"}, None, send))
+    text = metrics.render()
+    
+    # Assert
+    assert in_flight == [1]
+    assert metrics.in_flight == 0
+    assert len(sent) == 2
+    assert 'quizmaster_http_requests_total{method="GET",route="/quizzes/{quiz_id}",status="404"} 1' in text
+    assert 'quizmaster_http_request_duration_seconds_sum{method="GET",route="/quizzes/{quiz_id}"} 0.25' in text
+
+
+def test_middleware_labels_unmatched_requests():
+    """Test that requests without a matched route share one label."""
+    # Arrange
+    metrics = Metrics()
+
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 404, "headers": []})
+
+    async def send(message):
+        pass
+
+    middleware = MetricsMiddleware(app, metrics)
+    
+    # Act
+    for path in ("/a", "/b"):
+        asyncio.run(middleware({"type": "http", "method": "GET", "path": path}, None, send))
+    
+    # Assert
+    assert 'route="unmatched",status="404"} 2' in metrics.render()
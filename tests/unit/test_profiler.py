@@ -0,0 +1,78 @@
+"""
+Unit tests for the sampling profiler.
+"""
+
+import asyncio
+import threading
+
+from quizmaster.services.profiler import Profiling, SamplingProfiler
+
+
+def spin_until(stop):
+    """Keep a thread busy until stop is set."""
+    while not stop.is_set():
+        sum(range(100))
+
+
+def test_sample_records_busy_threads_as_collapsed_stacks():
+    """Test that a working thread shows up outermost frame first, and waiting threads are skipped."""
+    # Arrange
+    stop = threading.Event()
+    worker = threading.Thread(target=spin_until, args=(stop,))
+    waiter = threading.Thread(target=stop.wait)
+    worker.start()
+    waiter.start()
+    profiler = SamplingProfiler()
+    
+    # Act
+    for _ in range(5):
+        profiler.sample()
+    stop.set()
+    worker.join()
+    waiter.join()
+    lines = profiler.collapsed().splitlines()
+    
+    # Assert
+    assert profiler.samples >= 5
+    spinning = [line for line in lines if "spin_until (unit/test_profiler.py:" in line]
+    assert spinning
+    stack, count = spinning[0].rsplit(" ", 1)
+    assert stack.split(";")[0].startswith("_bootstrap (")
+    assert int(count) >= 1
+    assert not any(line.split(" ", 1)[0].endswith("wait") for line in lines)
+
+
+def test_profiler_thread_skips_samples_while_gated():
+    """Test that nothing is sampled while should_sample returns False."""
+    # Arrange
+    profiler = SamplingProfiler(interval=0.001, should_sample=lambda: False)
+    
+    # Act
+    profiler.start()
+    threading.Event().wait(0.02)
+    profiler.stop()
+    
+    # Assert
+    assert profiler.samples == 0
+    assert profiler.collapsed() == ""
+
+
+def test_profile_for_releases_the_busy_flag():
+    """Test that a timed profile marks profiling as busy only while it runs."""
+    # Arrange
+    profiling = Profiling()
+    seen = []
+
+    async def run():
+        task = asyncio.create_task(profiling.profile_for(0.02, 0.001))
+        await asyncio.sleep(0)
+        seen.append(profiling.busy)
+        return await task
+    
+    # Act
+    stacks, samples = asyncio.run(run())
+    
+    # Assert
+    assert seen == [True]
+    assert profiling.busy is False
+    assert samples >= stacks.count("\n")
@@ -0,0 +1,208 @@
+"""
+Unit tests for the question import service.
+"""
+
+import asyncio
+import hashlib
+import sys
+import threading
+
+import pytest
+
+from quizmaster.models.quiz import Quiz
+from quizmaster.services.dedup import DEDUP_MERGE, DEDUP_REJECT, DEDUP_WARN, DedupRegistry
+from quizmaster.services.quiz_store import MemoryQuizStore
+from quizmaster.services.question_import import (
+    FORMAT_CSV,
+    FORMAT_JSONL,
+    QuestionImporter,
+    format_for_content_type,
+    iter_lines,
+    parse_csv_row,
+    parse_jsonl_row,
+)
+
+
+async def chunks(*parts):
+    """Yield the given byte strings as an async stream."""
+    for part in parts:
+        yield part
+
+
+async def collect(lines):
+    """Collect an async iterator of lines into a list."""
+    return [line async for line in lines]
+
+
+def test_iter_lines_handles_split_chunks():
+    """Test that lines and multi-byte characters split across chunks are rejoined."""
+    # Arrange
+    body = "first\r\nsecond é\nthird".encode("utf-8")
+    parts = [body[:3], body[3:14], body[14:]]
+    
+    # Act
+    lines = asyncio.run(collect(iter_lines(chunks(*parts))))
+    
+    # Assert
+    assert lines == ["first", "second é", "third"]
+
+
+def test_parse_rows():
+    """Test parsing of valid JSONL and CSV rows."""
+    assert parse_jsonl_row('{"text": "Q", "answers": ["A", "B"], "correct_answer_index": 1}') == ("Q", ["A", "B"], 1)
+    assert parse_csv_row('"Q, with comma",A,B,0') == ("Q, with comma", ["A", "B"], 0)
+
+
+def test_parse_rows_rejects_bad_input():
+    """Test that malformed rows raise ValueError."""
+    with pytest.raises(ValueError):
+        parse_jsonl_row("{not json")
+    with pytest.raises(ValueError):
+        parse_jsonl_row('{"text": "Q", "answers": "A", "correct_answer_index": 0}')
+    with pytest.raises(ValueError):
+        parse_csv_row("Q,A,x")
+
+
+def test_format_for_content_type():
+    """Test content type negotiation."""
+    assert format_for_content_type("text/csv; charset=utf-8") == FORMAT_CSV
+    assert format_for_content_type("application/x-ndjson") == FORMAT_JSONL
+    with pytest.raises(ValueError):
+        format_for_content_type("application/json")
+
+
+def test_importer_appends_in_chunks_and_reports_errors():
+    """Test that valid rows are appended and invalid rows are reported by line."""
+    # Arrange
+    store = MemoryQuizStore()
+    quiz_id = store.add_quiz(Quiz("Test Quiz"))
+    importer = QuestionImporter(store, quiz_id, chunk_size=2)
+    body = b"question,a,b,correct\nQ1,A,B,0\nQ2,A,B,5\nQ3,A\n\nQ4,A,B,1\n"
+    
+    # Act
+    asyncio.run(importer.run(iter_lines(chunks(body)), FORMAT_CSV))
+    
+    # Assert
+    assert importer.imported == 2
+    assert importer.failed == 2
+    assert [line for line, _ in importer.errors] == [3, 4]
+    assert [q.question for q in store.get_quiz(quiz_id).questions] == ["Q1", "Q4"]
+
+
+def test_importer_applies_dedup_policy():
+    """Test that duplicates of stored rows and of earlier rows in the body are merged."""
+    # Arrange
+    store = MemoryQuizStore()
+    registry = DedupRegistry()
+    store.add_listener(registry.on_questions_added)
+    quiz = Quiz("Test Quiz", dedup_policy=DEDUP_MERGE)
+    quiz.add_question("What is 2 + 2?", ["3", "4"], 1)
+    quiz_id = store.add_quiz(quiz)
+    importer = QuestionImporter(store, quiz_id, dedup=registry, dedup_policy=DEDUP_MERGE)
+    body = b"What is 2 + 2?,4,3,0\nWhich planet is largest?,Mars,Jupiter,1\nWhich planet is largest?,Mars,Jupiter,1\n"
+    
+    # Act
+    asyncio.run(importer.run(iter_lines(chunks(body)), FORMAT_CSV))
+    
+    # Assert
+    assert importer.imported == 1
+    assert importer.merged == 2
+    assert [line for line, _ in importer.warnings] == [1, 3]
+    assert store.get_quiz_info(quiz_id).question_count == 2
+
+
+def test_importer_does_not_index_rows_the_store_rejects():
+    """Test that a row the store refuses is not taken for the original of a later row."""
+    # Arrange
+    class FullStore(MemoryQuizStore):
+        def add_questions(self, quiz_id, rows):
+            rows = list(rows)
+            return ["Quiz is full"] * len(rows) if self.full else super().add_questions(quiz_id, rows)
+    
+    store = FullStore()
+    registry = DedupRegistry()
+    store.add_listener(registry.on_questions_added)
+    quiz_id = store.add_quiz(Quiz("Test Quiz", dedup_policy=DEDUP_WARN))
+    importer = QuestionImporter(store, quiz_id, dedup=registry, dedup_policy=DEDUP_WARN)
+    store.full = True
+    importer.add_row(1, ("Which planet is largest?", ["Mars", "Jupiter"], 1))
+    importer.flush()
+    store.full = False
+    
+    # Act
+    importer.add_row(2, ("Which planet is largest?", ["Mars", "Jupiter"], 1))
+    importer.flush()
+    
+    # Assert
+    assert importer.errors == [(1, "Quiz is full")]
+    assert importer.warnings == []
+    assert importer.imported == 1
+    assert registry.index_for(store, quiz_id).count == 1
+
+
+def test_importer_indexes_rows_under_the_ids_the_store_gives_them():
+    """Test that a write landing between the duplicate check and the append is still indexed."""
+    # Arrange
+    class BusyStore(MemoryQuizStore):
+        def add_questions(self, quiz_id, rows):
+            if self.intruder is not None:
+                super().add_questions(quiz_id, [self.intruder])
+                self.intruder = None
+            return super().add_questions(quiz_id, rows)
+    
+    store = BusyStore()
+    store.intruder = None
+    registry = DedupRegistry()
+    store.add_listener(registry.on_questions_added)
+    quiz_id = store.add_quiz(Quiz("Test Quiz", dedup_policy=DEDUP_WARN))
+    importer = QuestionImporter(store, quiz_id, dedup=registry, dedup_policy=DEDUP_WARN)
+    store.intruder = ("Which planet is largest?", ["Mars", "Jupiter"], 1)
+    importer.add_row(1, ("What is 2 + 2?", ["3", "4"], 1))
+    importer.flush()
+    
+    # Act
+    importer.add_row(2, ("Which planet is largest?", ["Mars", "Jupiter"], 1))
+    importer.flush()
+    
+    # Assert
+    assert importer.warnings == [(2, "Duplicate of question 0")]
+    assert store.get_question(quiz_id, 1).question == "What is 2 + 2?"
+
+def test_concurrent_imports_reject_each_others_duplicates():
+    """Test that imports running in parallel threads never both add the same question."""
+    # Arrange
+    store = MemoryQuizStore()
+    registry = DedupRegistry()
+    store.add_listener(registry.on_questions_added)
+    quiz_id = store.add_quiz(Quiz("Test Quiz", dedup_policy=DEDUP_REJECT))
+    importers = [
+        QuestionImporter(store, quiz_id, chunk_size=1, dedup=registry, dedup_policy=DEDUP_REJECT) for _ in range(8)
+    ]
+    
+    # Hex digests share too few shingles to be near duplicates of each other
+    texts = [hashlib.sha1(str(i).encode()).hexdigest() for i in range(100)]
+    
+    def run(importer):
+        for line_number, text in enumerate(texts, 1):
+            if importer.add_row(line_number, (text, ["Yes", "No"], 0)):
+                importer.flush()
+        importer.flush()
+    
+    threads = [threading.Thread(target=run, args=(importer,)) for importer in importers]
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    
+    # Act
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+    
+    # Assert
+    questions = [q.question for q in store.get_questions(quiz_id, 0)]
+    assert sorted(questions) == sorted(texts)
+    assert sum(importer.imported for importer in importers) == 100
+    assert registry.index_for(store, quiz_id).count == 100
@@ -4,7 +4,7 @@ Unit tests for the Quiz model.
 
 import pytest
 
-from quizmaster.models.quiz import Quiz
+from quizmaster.models.quiz import MAX_ANSWERS, Question, Quiz
 
 
 def test_quiz_initialization():
@@ -86,4 +86,94 @@ def test_string_representation():
     assert str(quiz) == "Quiz: Test Quiz (0 questions)"
     
     quiz.add_question("Question 1", ["A", "B"], 0)
-    assert str(quiz) == "Quiz: Test Quiz (1 questions)"
\ No newline at end of file
+    assert str(quiz) == "Quiz: Test Quiz (1 questions)"
+
+
+def test_version_increments_on_add_question():
+    """Test that adding a question bumps the quiz version."""
+    # Arrange
+    quiz = Quiz("Test Quiz")
+    
+    # Act & Assert
+    assert quiz.version == 0
+    
+    quiz.add_question("Question 1", ["A", "B"], 0)
+    assert quiz.version == 1
+    
+    with pytest.raises(ValueError):
+        quiz.add_question("Question 2", ["A", "B"], 5)
+    assert quiz.version == 1
+
+
+def test_get_question_returns_record():
+    """Test that get_question returns a Question with attribute and item access."""
+    # Arrange
+    quiz = Quiz("Test Quiz")
+    quiz.add_question("Question 1", ["A", "B"], 0)
+    quiz.add_question("Question 2", ["C", "D", "E"], 2)
+    
+    # Act
+    question = quiz.get_question(1)
+    
+    # Assert
+    assert isinstance(question, Question)
+    assert question.question == "Question 2"
+    assert question.answers == ["C", "D", "E"]
+    assert question["correct_answer_index"] == 2
+    assert quiz.get_question(-1) == question
+    with pytest.raises(IndexError):
+        quiz.get_question(2)
+
+
+def test_questions_view_supports_sequence_operations():
+    """Test that the questions view behaves like the old list of dicts."""
+    # Arrange
+    quiz = Quiz("Test Quiz")
+    quiz.add_question("Question 1", ["True", "False"], 0)
+    quiz.add_question("Question 2", ["True", "False"], 1)
+    
+    # Act
+    questions = quiz.questions
+    
+    # Assert
+    assert len(questions) == 2
+    assert [q.question for q in questions] == ["Question 1", "Question 2"]
+    assert questions[1:] == [
+        {"question": "Question 2", "answers": ["True", "False"], "correct_answer_index": 1}
+    ]
+    assert list(quiz.answer_keys) == [0, 1]
+
+
+def test_add_question_rejects_too_many_answers():
+    """Test that answer keys are limited to what fits in a byte."""
+    # Arrange
+    quiz = Quiz("Test Quiz")
+    
+    # Act & Assert
+    with pytest.raises(ValueError):
+        quiz.add_question("Question", [str(i) for i in range(MAX_ANSWERS + 1)], 0)
+    assert quiz.get_question_count() == 0
+
+
+def test_quiz_uses_slots():
+    """Test that Quiz instances have no per-instance __dict__."""
+    assert not hasattr(Quiz("Test Quiz"), "__dict__")
+
+
+def test_copy_is_independent():
+    """Test that a copied quiz keeps the content and version but changes separately."""
+    # Arrange
+    quiz = Quiz("Test Quiz", "A quiz for testing", dedup_policy="warn")
+    quiz.add_question("What is 2 + 2?", ["3", "4"], 1)
+    
+    # Act
+    copy = quiz.copy()
+    copy.add_question("What is 3 + 3?", ["6", "7"], 0)
+    
+    # Assert
+    assert quiz.get_question_count() == 1
+    assert quiz.version == 1
+    assert copy.version == 2
+    assert copy.dedup_policy == "warn"
+    assert copy.questions[0] == quiz.questions[0]
+    assert copy.get_question(1).answers == ["6", "7"]
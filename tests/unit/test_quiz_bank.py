@@ -0,0 +1,145 @@
+"""
+Unit tests for memory-mapped quiz banks.
+"""
+
+import pytest
+
+from quizmaster.models.quiz import Quiz
+from quizmaster.models.quiz_bank import QuizBank, open_quiz_bank, write_quiz_bank
+from quizmaster.services.grading import grade_sheets
+from quizmaster.services.journal_store import JournalQuizStore
+from quizmaster.services.quiz_store import MemoryQuizStore
+from quizmaster.services.search import SearchIndex
+from quizmaster.services.sqlite_store import SQLiteQuizStore
+
+
+ROWS = [
+    ("What is 2 + 2?", ["3", "4"], 1),
+    ("Capital of France?", ["Paris", "Lyon", "Nice"], 0),
+    ("Ünïcode ✓?", ["Yes", "No"], 0),
+]
+
+
+@pytest.fixture
+def bank_path(tmp_path):
+    """Write a small bank and return its path."""
+    path = str(tmp_path / "bank.qmb")
+    write_quiz_bank(path, "Certification", ROWS, description="Read-only bank")
+    return path
+
+
+def test_bank_reads_like_a_quiz(bank_path):
+    """Test that a mapped bank offers the reading interface of Quiz."""
+    # Arrange
+    quiz = Quiz("Certification", "Read-only bank")
+    for row in ROWS:
+        quiz.add_question(*row)
+    
+    # Act
+    bank = QuizBank(bank_path)
+    
+    # Assert
+    assert (bank.title, bank.description, bank.dedup_policy) == ("Certification", "Read-only bank", "off")
+    assert bank.get_question_count() == bank.version == 3
+    assert bank.questions == quiz.questions
+    assert bank.get_question(-1).question == "Ünïcode ✓?"
+    assert bytes(bank.answer_keys) == quiz.answer_keys.tobytes()
+    assert list(bank.answer_offsets) == list(quiz.answer_offsets)
+    assert bank.copy().questions == quiz.questions
+    assert str(bank) == str(quiz)
+    with pytest.raises(IndexError):
+        bank.get_question(3)
+    with pytest.raises(ValueError):
+        bank.add_question("New?", ["A", "B"], 0)
+    bank.close()
+
+
+def test_bank_is_graded_from_the_mapped_answer_keys(bank_path):
+    """Test that vectorized grading works on a bank."""
+    # Arrange
+    bank = QuizBank(bank_path)
+    
+    # Act
+    result = grade_sheets(bank, [[1, 0, 1], [0, None, 0]])
+    
+    # Assert
+    assert result.scores.tolist() == [2, 1]
+    bank.close()
+
+
+def test_open_rejects_other_files(tmp_path):
+    """Test that files that are not banks are refused and missing files give None."""
+    # Arrange
+    path = tmp_path / "not-a-bank"
+    path.write_bytes(b"x" * 200)
+    
+    # Act / Assert
+    with pytest.raises(ValueError):
+        QuizBank(str(path))
+    assert open_quiz_bank(str(tmp_path / "missing.qmb")) is None
+
+
+def test_memory_store_mounts_a_bank_once_without_indexing_it(bank_path):
+    """Test that mounting allocates one ID per file, skips listeners and refuses new questions."""
+    # Arrange
+    store = MemoryQuizStore()
+    store.add_quiz(Quiz("Regular"))
+    notified = []
+    store.add_listener(lambda *args: notified.append(args))
+    index = SearchIndex()
+    
+    # Act
+    quiz_id = store.mount_bank(bank_path)
+    again = store.mount_bank(bank_path)
+    errors = store.add_questions(quiz_id, [("New?", ["A", "B"], 0)])
+    index.index_store(store)
+    
+    # Assert
+    assert (quiz_id, again) == (1, 1)
+    assert notified == []
+    assert errors == ["Quiz banks are read-only"]
+    assert store.get_question(quiz_id, 1).answers == ["Paris", "Lyon", "Nice"]
+    assert store.get_quiz_info(quiz_id).question_count == 3
+    assert index.search("paris") == []
+
+
+def test_journal_store_remounts_banks_after_restart_and_compaction(tmp_path, bank_path):
+    """Test that mounted banks keep their IDs across restarts and snapshots."""
+    # Arrange
+    store = JournalQuizStore(str(tmp_path / "journal"), compact_interval=0)
+    quiz_id = store.mount_bank(bank_path)
+    store.compact()
+    store.close()
+    
+    # Act
+    reopened = JournalQuizStore(str(tmp_path / "journal"), compact_interval=0)
+    next_id = reopened.add_quiz(Quiz("After"))
+    
+    # Assert
+    assert isinstance(reopened.get_quiz(quiz_id), QuizBank)
+    assert reopened.get_question(quiz_id, 0).question == "What is 2 + 2?"
+    assert next_id == quiz_id + 1
+    reopened.close()
+
+
+def test_sqlite_store_shares_mounted_banks_between_instances(tmp_path, bank_path):
+    """Test that a bank mounted through one store is served by another on the same database."""
+    # Arrange
+    path = str(tmp_path / "quizzes.db")
+    first = SQLiteQuizStore(path)
+    second = SQLiteQuizStore(path)
+    
+    # Act
+    quiz_id = first.mount_bank(bank_path)
+    
+    # Assert
+    assert first.mount_bank(bank_path) == quiz_id
+    assert second.get_question(quiz_id, 2).question == "Ünïcode ✓?"
+    assert second.get_question(quiz_id, 3) is None
+    assert [q.question for q in second.get_questions(quiz_id, 2)] == ["Ünïcode ✓?"]
+    assert second.get_quiz(quiz_id).get_question_count() == 3
+    assert second.get_quiz_info(quiz_id).version == 3
+    assert second.add_questions(quiz_id, [("New?", ["A", "B"], 0)]) == ["Quiz banks are read-only"]
+    assert second.get_quiz_info(quiz_id).question_count == 3
+    first.close()
+    second.close()
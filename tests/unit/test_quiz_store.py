@@ -0,0 +1,277 @@
+"""
+Unit tests for the quiz stores.
+"""
+
+import multiprocessing
+import sys
+import threading
+
+import pytest
+
+from quizmaster.models.quiz import Quiz
+from quizmaster.services.journal_store import JournalQuizStore
+from quizmaster.services.quiz_store import MemoryQuizStore, create_store
+from quizmaster.services.sqlite_store import SQLiteQuizStore
+
+
+@pytest.fixture(params=["memory", "sqlite", "journal"])
+def store(request, tmp_path):
+    """Provide an empty store of each backend."""
+    if request.param == "memory":
+        store = MemoryQuizStore()
+    elif request.param == "journal":
+        store = JournalQuizStore(str(tmp_path / "journal"), compact_interval=0)
+    else:
+        store = SQLiteQuizStore(str(tmp_path / "quizzes.db"))
+    yield store
+    store.close()
+
+
+def make_quiz(title="Test Quiz", questions=0):
+    """Build a quiz with the given number of questions."""
+    quiz = Quiz(title, "A quiz")
+    for i in range(questions):
+        quiz.add_question(f"Question {i}", ["A", "B"], i % 2)
+    return quiz
+
+
+def test_add_quiz_allocates_sequential_ids(store):
+    """Test that IDs start at zero and increase by one."""
+    # Act
+    ids = [store.add_quiz(make_quiz(f"Quiz {i}")) for i in range(3)]
+    
+    # Assert
+    assert ids == [0, 1, 2]
+    assert len(store) == 3
+    assert 1 in store
+    assert 3 not in store
+
+
+def test_add_quiz_keeps_existing_questions(store):
+    """Test that questions of a prebuilt quiz are stored with it."""
+    # Act
+    quiz_id = store.add_quiz(make_quiz(questions=3))
+    
+    # Assert
+    info = store.get_quiz_info(quiz_id)
+    assert (info.title, info.question_count, info.version) == ("Test Quiz", 3, 3)
+    quiz = store.get_quiz(quiz_id)
+    assert [q.question for q in quiz.questions] == ["Question 0", "Question 1", "Question 2"]
+    assert list(quiz.answer_keys) == [0, 1, 0]
+
+
+def test_add_questions_reports_per_row_errors(store):
+    """Test that invalid rows are skipped and valid rows appended."""
+    # Arrange
+    quiz_id = store.add_quiz(make_quiz())
+    
+    # Act
+    errors = store.add_questions(quiz_id, [("Q1", ["A", "B"], 1), ("Q2", ["A"], 4), ("Q3", ["é", "B"], 0)])
+    
+    # Assert
+    assert errors == [None, "Correct answer index out of range", None]
+    assert store.get_quiz_info(quiz_id).version == 2
+    assert store.get_question(quiz_id, 1).answers == ["é", "B"]
+    assert store.get_question(quiz_id, 2) is None
+
+
+def test_add_question_validates(store):
+    """Test the single-question helper."""
+    # Arrange
+    quiz_id = store.add_quiz(make_quiz())
+    
+    # Act & Assert
+    store.add_question(quiz_id, "Q1", ["A", "B"], 1)
+    with pytest.raises(ValueError):
+        store.add_question(quiz_id, "Q2", ["A", "B"], 2)
+    with pytest.raises(KeyError):
+        store.add_question(99, "Q3", ["A", "B"], 0)
+
+
+def test_get_quiz_reflects_new_questions(store):
+    """Test that a quiz read after an append includes the new question."""
+    # Arrange
+    quiz_id = store.add_quiz(make_quiz(questions=1))
+    store.get_quiz(quiz_id)
+    
+    # Act
+    store.add_question(quiz_id, "New", ["A", "B"], 0)
+    
+    # Assert
+    assert store.get_quiz(quiz_id).get_question_count() == 2
+
+
+def test_iter_quiz_infos_pages(store):
+    """Test cursor-based iteration."""
+    # Arrange
+    for i in range(5):
+        store.add_quiz(make_quiz(f"Quiz {i}"))
+    
+    # Act & Assert
+    assert [info.id for info in store.iter_quiz_infos()] == [0, 1, 2, 3, 4]
+    assert [info.id for info in store.iter_quiz_infos(after=1, limit=2)] == [2, 3]
+    assert [info.id for info in store.iter_quiz_infos(after=4)] == []
+
+
+def test_changes_since_reports_quizzes_changed_after_a_change(store):
+    """Test that changes_since lists new and appended quizzes once and nothing when idle."""
+    # Arrange
+    first = store.add_quiz(make_quiz("First"))
+    second = store.add_quiz(make_quiz("Second"))
+    change, everything = store.changes_since(None)
+    
+    # Act
+    idle = store.changes_since(change)
+    store.add_question(first, "New?", ["A", "B"], 0)
+    third = store.add_quiz(make_quiz("Third"))
+    latest, changed = store.changes_since(change)
+    
+    # Assert
+    assert [info.id for info in everything] == [first, second]
+    assert idle == (change, [])
+    assert latest > change
+    assert [(info.id, info.question_count) for info in changed] == [(first, 1), (third, 0)]
+    assert store.changes_since(latest) == (latest, [])
+
+def test_sqlite_store_persists_across_instances(tmp_path):
+    """Test that a reopened database keeps quizzes, IDs and the epoch."""
+    # Arrange
+    path = str(tmp_path / "quizzes.db")
+    first = SQLiteQuizStore(path)
+    quiz_id = first.add_quiz(make_quiz(questions=2))
+    epoch = first.epoch
+    first.close()
+    
+    # Act
+    second = create_store(f"sqlite:///{path}")
+    
+    # Assert
+    assert second.epoch == epoch
+    assert second.get_quiz(quiz_id).get_question_count() == 2
+    assert second.add_quiz(make_quiz()) == quiz_id + 1
+    second.close()
+
+
+def test_create_store_rejects_unknown_url():
+    """Test that unsupported storage URLs raise ValueError."""
+    with pytest.raises(ValueError):
+        create_store("redis://localhost")
+
+
+def create_quizzes_in_process(path, count):
+    """Create quizzes through a separate store instance, as a worker process would."""
+    store = SQLiteQuizStore(path, pool_size=1)
+    for i in range(count):
+        store.add_quiz(make_quiz(f"Quiz {i}"))
+    store.close()
+
+
+def test_sqlite_store_allocates_unique_ids_across_processes(tmp_path):
+    """Test that concurrent worker processes never receive the same quiz ID."""
+    # Arrange
+    path = str(tmp_path / "quizzes.db")
+    SQLiteQuizStore(path).close()
+    context = multiprocessing.get_context("fork")
+    processes = [context.Process(target=create_quizzes_in_process, args=(path, 25)) for _ in range(4)]
+    
+    # Act
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    
+    # Assert
+    store = SQLiteQuizStore(path)
+    assert [info.id for info in store.iter_quiz_infos()] == list(range(100))
+    store.close()
+
+
+def test_sqlite_store_changes_are_visible_to_other_instances(tmp_path):
+    """Test that a quiz written through one store is immediately read by another."""
+    # Arrange
+    path = str(tmp_path / "quizzes.db")
+    writer = SQLiteQuizStore(path)
+    reader = SQLiteQuizStore(path)
+    quiz_id = writer.add_quiz(make_quiz())
+    reader.get_quiz(quiz_id)
+    
+    # Act
+    writer.add_question(quiz_id, "New", ["A", "B"], 1)
+    
+    # Assert
+    assert reader.get_quiz_info(quiz_id).version == 1
+    assert reader.get_quiz(quiz_id).get_question(0).question == "New"
+    writer.close()
+    reader.close()
+
+
+def test_get_questions_from_version(store):
+    """Test that the questions from a version onwards are exactly the later additions."""
+    # Arrange
+    quiz_id = store.add_quiz(make_quiz(questions=2))
+    store.add_question(quiz_id, "Question 2", ["A", "B"], 0)
+    
+    # Act
+    questions = store.get_questions(quiz_id, 2)
+    
+    # Assert
+    assert [q.question for q in questions] == ["Question 2"]
+    assert store.get_questions(quiz_id, 3) == []
+    assert len(store.get_questions(quiz_id)) == 3
+    assert store.get_questions(99, 0) is None
+
+
+def test_count_questions_sums_all_quizzes(store):
+    """Test that the total question count covers every quiz."""
+    # Arrange
+    empty_count = store.count_questions()
+    store.add_quiz(make_quiz(questions=2))
+    quiz_id = store.add_quiz(make_quiz(questions=1))
+    
+    # Act
+    store.add_question(quiz_id, "Another", ["A", "B"], 1)
+    
+    # Assert
+    assert empty_count == 0
+    assert store.count_questions() == 4
+
+
+def test_every_backend_can_mount_banks(store):
+    """Test that mount_bank is implemented by each backend rather than inherited."""
+    # Act
+    mount_bank = type(store).mount_bank
+    
+    # Assert
+    assert not getattr(mount_bank, "__isabstractmethod__", False)
+
+
+def test_concurrent_add_questions_keep_questions_whole(store):
+    """Test that appends from many threads neither corrupt questions nor misreport their IDs."""
+    # Arrange
+    quiz_id = store.add_quiz(make_quiz())
+    notified = []
+    store.add_listener(lambda _, first, rows: notified.extend(range(first, first + len(rows))))
+    
+    def add(worker):
+        for i in range(500):
+            store.add_questions(quiz_id, [(f"{worker}-{i}", [f"{worker}-{i}-{a}" for a in range(i % 4 + 2)], 1)])
+    
+    threads = [threading.Thread(target=add, args=(worker,)) for worker in range(8)]
+    interval = sys.getswitchinterval()
+    # Switch threads as often as possible so unsynchronized appends interleave
+    sys.setswitchinterval(1e-6)
+    
+    # Act
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+    
+    # Assert
+    questions = store.get_questions(quiz_id, 0)
+    assert len(questions) == store.get_quiz_info(quiz_id).version == 4000
+    assert all(q.answers == [f"{q.question}-{a}" for a in range(len(q.answers))] for q in questions)
+    assert sorted(notified) == list(range(4000))
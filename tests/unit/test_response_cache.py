@@ -0,0 +1,79 @@
+"""
+Unit tests for the ResponseCache service.
+"""
+
+from quizmaster.services.response_cache import ResponseCache
+
+
+def test_get_returns_cached_body_for_same_version():
+    """Test that a stored body is returned for the version it was built from."""
+    # Arrange
+    cache = ResponseCache(max_bytes=1024)
+    cache.put(1, 3, b"body")
+    
+    # Act & Assert
+    assert cache.get(1, 3) == b"body"
+    assert cache.stats()["hits"] == 1
+
+
+def test_get_with_new_version_invalidates_entry():
+    """Test that a version change turns the entry into a miss and drops it."""
+    # Arrange
+    cache = ResponseCache(max_bytes=1024)
+    cache.put(1, 3, b"body")
+    
+    # Act
+    result = cache.get(1, 4)
+    
+    # Assert
+    assert result is None
+    stats = cache.stats()
+    assert stats["invalidations"] == 1
+    assert stats["entries"] == 0
+    assert stats["bytes"] == 0
+
+
+def test_put_evicts_least_recently_used_entries():
+    """Test that the byte budget is enforced by evicting the oldest entries first."""
+    # Arrange
+    cache = ResponseCache(max_bytes=10)
+    cache.put("a", 0, b"1234")
+    cache.put("b", 0, b"1234")
+    cache.get("a", 0)  # "a" is now the most recently used
+    
+    # Act
+    cache.put("c", 0, b"1234")
+    
+    # Assert
+    assert cache.get("b", 0) is None
+    assert cache.get("a", 0) == b"1234"
+    assert cache.get("c", 0) == b"1234"
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["bytes"] == 8
+
+
+def test_put_skips_bodies_larger_than_budget():
+    """Test that a body bigger than the whole budget is not cached."""
+    # Arrange
+    cache = ResponseCache(max_bytes=4)
+    
+    # Act
+    cache.put("a", 0, b"too large")
+    
+    # Assert
+    assert len(cache) == 0
+
+
+def test_stats_hit_rate():
+    """Test that the hit rate is computed from hits and misses."""
+    # Arrange
+    cache = ResponseCache()
+    cache.put("a", 0, b"x")
+    
+    # Act
+    cache.get("a", 0)
+    cache.get("b", 0)
+    
+    # Assert
+    assert cache.stats()["hit_rate"] == 0.5
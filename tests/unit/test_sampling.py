@@ -0,0 +1,107 @@
+"""
+Unit tests for question sampling.
+"""
+
+import random
+from collections import Counter
+
+import pytest
+
+from quizmaster.services.sampling import (
+    AliasTable, SamplerRegistry, WeightedSampler, reservoir_sample, sample_uniform, weights_for_topics
+)
+
+
+def test_uniform_sample_is_distinct_and_reproducible():
+    """Test that uniform sampling picks distinct positions and repeats with the same seed."""
+    # Act
+    first = sample_uniform(100000, 30, random.Random(5))
+    second = sample_uniform(100000, 30, random.Random(5))
+    
+    # Assert
+    assert first == second
+    assert len(set(first)) == 30
+    assert all(0 <= i < 100000 for i in first)
+
+
+def test_weighted_sampler_follows_weights_and_restores_them():
+    """Test that draws are proportional to weight, without replacement, and leave the sampler unchanged."""
+    # Arrange
+    sampler = WeightedSampler([1.0, 3.0, 0.0, 1.0])
+    rng = random.Random(11)
+    
+    # Act
+    firsts = Counter(sampler.sample(1, rng)[0] for _ in range(5000))
+    everything = sampler.sample(3, rng)
+    
+    # Assert
+    assert 2 not in firsts
+    assert 0.55 < firsts[1] / 5000 < 0.65
+    assert sorted(everything) == [0, 1, 3]
+    with pytest.raises(ValueError):
+        sampler.sample(4, rng)
+    assert sampler.sample(3, random.Random(1)) == sampler.sample(3, random.Random(1))
+
+
+def test_weighted_sampler_overrides_apply_to_one_draw():
+    """Test that override weights are used for a single draw only."""
+    # Arrange
+    sampler = WeightedSampler([1.0] * 10)
+    
+    # Act
+    only = sampler.sample(2, random.Random(2), {i: 0.0 for i in range(8)})
+    later = {i for _ in range(50) for i in sampler.sample(2, random.Random(_))}
+    
+    # Assert
+    assert sorted(only) == [8, 9]
+    assert len(later) > 2
+    with pytest.raises(ValueError):
+        sampler.sample(1, random.Random(2), {10: 1.0})
+
+
+def test_alias_table_matches_weights():
+    """Test that alias-table draws with replacement follow the weights."""
+    # Arrange
+    table = AliasTable([1.0, 2.0, 0.0, 7.0])
+    
+    # Act
+    counts = Counter(table.sample(20000, random.Random(3)))
+    
+    # Assert
+    assert counts[2] == 0
+    assert 0.67 < counts[3] / 20000 < 0.73
+    assert 0.08 < counts[0] / 20000 < 0.12
+
+
+def test_reservoir_sample_from_stream():
+    """Test uniform and weighted reservoir sampling over a generator."""
+    # Act
+    uniform = reservoir_sample((i for i in range(10000)), 20, random.Random(4))
+    short = reservoir_sample(iter("ab"), 5, random.Random(4))
+    weighted = Counter(
+        item
+        for seed in range(2000)
+        for item in reservoir_sample(iter("abc"), 1, random.Random(seed), weight={"a": 1, "b": 0, "c": 3}.get)
+    )
+    
+    # Assert
+    assert len(set(uniform)) == 20
+    assert sorted(short) == ["a", "b"]
+    assert weighted["b"] == 0
+    assert 0.7 < weighted["c"] / 2000 < 0.8
+
+
+def test_registry_extends_samplers_as_quizzes_grow():
+    """Test that a quiz's sampler covers newly added questions."""
+    # Arrange
+    registry = SamplerRegistry()
+    sampler = registry.get(1, 3)
+    
+    # Act
+    grown = registry.get(1, 5)
+    
+    # Assert
+    assert grown is sampler
+    assert len(grown) == 5
+    assert sorted(grown.sample(5, random.Random(0))) == [0, 1, 2, 3, 4]
+    assert weights_for_topics(["math", "art", "math"], {"math": 2.0}) == [2.0, 1.0, 2.0]
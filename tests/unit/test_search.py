@@ -0,0 +1,162 @@
+"""
+Unit tests for the search index.
+"""
+
+from quizmaster.models.quiz import Quiz
+from quizmaster.services.quiz_store import MemoryQuizStore
+from quizmaster.services.search import SearchIndex, tokenize
+from quizmaster.services.sqlite_store import SQLiteQuizStore
+
+
+def build_index():
+    """Provide an index over two small quizzes."""
+    index = SearchIndex()
+    index.add_questions(0, 0, [
+        ("What is the capital of France?", ["London", "Paris"], 1),
+        ("Which keyword defines a function in Python?", ["def", "func"], 0),
+    ])
+    index.add_questions(1, 0, [
+        ("Which Python type is immutable?", ["list", "tuple"], 1),
+    ])
+    return index
+
+
+def test_tokenize():
+    """Test lowercasing and punctuation handling."""
+    assert tokenize("What's 2 + 2, Python?") == ["what", "s", "2", "2", "python"]
+
+
+def test_search_ranks_matching_questions():
+    """Test that every question containing the terms is found, best match first."""
+    # Arrange
+    index = build_index()
+    
+    # Act
+    results = index.search("python function", prefix=False)
+    
+    # Assert
+    assert [(quiz_id, question_id) for quiz_id, question_id, _ in results] == [(0, 1), (1, 0)]
+    assert results[0][2] > results[1][2]
+
+
+def test_search_matches_answer_text_and_prefixes():
+    """Test that answers are indexed and the last word is matched as a prefix."""
+    # Arrange
+    index = build_index()
+    
+    # Act & Assert
+    assert [r[:2] for r in index.search("pari")] == [(0, 0)]
+    assert index.search("pari", prefix=False) == []
+    assert [r[:2] for r in index.search("tup")] == [(1, 0)]
+
+
+def test_search_filters_by_quiz():
+    """Test restricting results to one quiz."""
+    # Arrange
+    index = build_index()
+    
+    # Act
+    results = index.search("python", quiz_id=1)
+    
+    # Assert
+    assert [r[:2] for r in results] == [(1, 0)]
+
+
+def test_index_follows_store_listener():
+    """Test that an index registered as a store listener sees new questions."""
+    # Arrange
+    store = MemoryQuizStore()
+    index = SearchIndex()
+    quiz = Quiz("Existing")
+    quiz.add_question("Old question about rivers", ["A", "B"], 0)
+    store.add_quiz(quiz)
+    index.index_store(store)
+    store.add_listener(index.add_questions)
+    
+    # Act
+    store.add_question(0, "New question about mountains", ["A", "B"], 1)
+    
+    # Assert
+    assert len(index) == 2
+    assert [r[:2] for r in index.search("mountains")] == [(0, 1)]
+    assert [r[:2] for r in index.search("rivers")] == [(0, 0)]
+
+
+def test_index_store_catches_up_with_other_writers(tmp_path):
+    """Test that questions added through another store on the same database are indexed before searching."""
+    # Arrange
+    path = str(tmp_path / "quizzes.db")
+    mine = SQLiteQuizStore(path)
+    other = SQLiteQuizStore(path)
+    index = SearchIndex()
+    mine.add_listener(index.add_questions)
+    quiz_id = mine.add_quiz(Quiz("Shared"))
+    mine.add_question(quiz_id, "Question about rivers", ["A", "B"], 0)
+    other.add_question(quiz_id, "Question about mountains", ["A", "B"], 1)
+    
+    # Act
+    before = index.search("mountains")
+    index.index_store(mine, quiz_id)
+    mine.add_question(quiz_id, "Question about lakes", ["A", "B"], 0)
+    
+    # Assert
+    assert before == []
+    assert len(index) == 3
+    assert [r[:2] for r in index.search("question", prefix=False)] == [(0, 0), (0, 1), (0, 2)]
+    mine.close()
+    other.close()
+
+
+def test_index_store_reads_only_changed_quizzes(tmp_path):
+    """Test that catching up with the whole store only reads the metadata of quizzes changed since the last time."""
+    # Arrange
+    class CountingStore(SQLiteQuizStore):
+        def changes_since(self, change):
+            latest, infos = super().changes_since(change)
+            self.read.extend(info.id for info in infos)
+            return latest, infos
+    
+    path = str(tmp_path / "quizzes.db")
+    mine = CountingStore(path)
+    other = SQLiteQuizStore(path)
+    quiz_ids = [mine.add_quiz(Quiz(f"Quiz {i}")) for i in range(5)]
+    index = SearchIndex()
+    mine.add_listener(index.add_questions)
+    mine.read = []
+    index.index_store(mine)
+    
+    # Act
+    mine.read = []
+    index.index_store(mine)
+    unchanged = mine.read
+    mine.read = []
+    other.add_question(quiz_ids[3], "Question about glaciers", ["A", "B"], 0)
+    index.index_store(mine)
+    
+    # Assert
+    assert unchanged == []
+    assert mine.read == [quiz_ids[3]]
+    assert [r[:2] for r in index.search("glaciers")] == [(quiz_ids[3], 0)]
+    mine.close()
+    other.close()
+
+def test_rows_after_a_gap_wait_for_index_store():
+    """Test that listener rows arriving out of order are skipped until the store is indexed."""
+    # Arrange
+    store = MemoryQuizStore()
+    quiz = Quiz("Existing")
+    quiz.add_question("First question", ["A", "B"], 0)
+    quiz.add_question("Second question", ["A", "B"], 0)
+    store.add_quiz(quiz)
+    index = SearchIndex()
+    
+    # Act
+    index.add_questions(0, 1, [("Second question", ["A", "B"], 0)])
+    skipped = len(index)
+    index.index_store(store)
+    index.index_store(store)
+    
+    # Assert
+    assert skipped == 0
+    assert len(index) == 2
+    assert [r[:2] for r in index.search("second")] == [(0, 1)]
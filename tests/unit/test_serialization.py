@@ -0,0 +1,79 @@
+"""
+Unit tests for the serialization service.
+"""
+
+import gzip
+
+import pytest
+
+from quizmaster import main
+from quizmaster.models.quiz import Quiz
+from quizmaster.services import serialization
+from quizmaster.services.serialization import (
+    ENCODING_GZIP,
+    compress,
+    dumps,
+    negotiate_encoding,
+    quiz_to_json,
+)
+
+
+def build_quiz():
+    """Provide a quiz with non-ASCII text."""
+    quiz = Quiz("Café Quiz", "Ünïcode “quotes”")
+    quiz.add_question("What is 2 + 2?", ["3", "4"], 1)
+    quiz.add_question("Wie heißt die Hauptstadt?", ["Berlin", "München", "Köln"], 0)
+    return quiz
+
+
+def test_quiz_to_json_matches_model_path():
+    """Test that the fast path produces the same bytes as the Pydantic path."""
+    # Arrange
+    quiz = build_quiz()
+    
+    # Act
+    fast = quiz_to_json(quiz, 7)
+    
+    # Assert
+    assert fast == main.render_json(main.quiz_to_model(quiz, 7))
+
+
+def test_dumps_without_orjson_matches(monkeypatch):
+    """Test that the json fallback produces the same bytes as orjson."""
+    # Arrange
+    data = {"text": "Köln", "items": [1, True, None]}
+    expected = dumps(data)
+    monkeypatch.setattr(serialization, "orjson", None)
+    
+    # Act & Assert
+    assert dumps(data) == expected
+
+
+@pytest.mark.parametrize("header, expected", [
+    (None, None),
+    ("identity", None),
+    ("gzip, deflate", "gzip"),
+    ("gzip;q=0, deflate", None),
+    ("*", "gzip"),
+    ("*, gzip;q=0", None),
+])
+def test_negotiate_encoding_without_brotli(monkeypatch, header, expected):
+    """Test Accept-Encoding negotiation, including q=0 refusals and wildcards."""
+    # Arrange
+    monkeypatch.setattr(serialization, "brotli", None)
+    
+    # Act & Assert
+    assert negotiate_encoding(header) == expected
+
+
+def test_compress_gzip_round_trip():
+    """Test that gzip bodies decompress to the original."""
+    # Arrange
+    body = dumps({"text": "x" * 1000})
+    
+    # Act
+    compressed = compress(body, ENCODING_GZIP)
+    
+    # Assert
+    assert gzip.decompress(compressed) == body
+    assert len(compressed) < len(body)
@@ -0,0 +1,97 @@
+"""
+Unit tests for the session engine.
+"""
+
+from quizmaster.services.sessions import Attempt, SessionEngine
+
+
+class FakeClock:
+    """A manually advanced clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_attempt_records_answers_as_bitsets():
+    """Test that answers advance the cursor and set the answered and correct bits."""
+    # Arrange
+    attempt = Attempt(quiz_id=3, last_seen=0.0)
+    
+    # Act
+    attempt.record(True)
+    attempt.record(False)
+    attempt.record(True)
+    
+    # Assert
+    assert attempt.cursor == 3
+    assert attempt.answered == 0b111
+    assert attempt.correct == 0b101
+    assert attempt.answered_count == 3
+    assert attempt.score == 2
+
+
+def test_idle_sessions_expire():
+    """Test that only attempts idle for longer than the TTL are removed."""
+    # Arrange
+    clock = FakeClock()
+    engine = SessionEngine(ttl=10, clock=clock)
+    old_id, _ = engine.start(quiz_id=0)
+    clock.now = 5
+    active_id, _ = engine.start(quiz_id=0)
+    
+    # Act
+    clock.now = 12
+    
+    # Assert
+    assert engine.get(old_id) is None
+    assert engine.get(active_id) is not None
+    assert len(engine) == 1
+    assert engine.expired == 1
+
+
+def test_access_extends_lifetime():
+    """Test that reading an attempt resets its idle timer."""
+    # Arrange
+    clock = FakeClock()
+    engine = SessionEngine(ttl=10, clock=clock)
+    session_id, _ = engine.start(quiz_id=0)
+    
+    # Act
+    clock.now = 8
+    engine.get(session_id)
+    clock.now = 16
+    
+    # Assert
+    assert engine.get(session_id) is not None
+    assert engine.expire() == 0
+
+
+def test_capacity_drops_least_recently_used():
+    """Test that the oldest attempt is dropped when the engine is full."""
+    # Arrange
+    engine = SessionEngine(max_sessions=2)
+    first, _ = engine.start(quiz_id=0)
+    second, _ = engine.start(quiz_id=0)
+    engine.get(first)
+    
+    # Act
+    engine.start(quiz_id=0)
+    
+    # Assert
+    assert engine.get(second) is None
+    assert engine.get(first) is not None
+
+
+def test_finish_removes_attempt():
+    """Test that a finished attempt can no longer be used."""
+    # Arrange
+    engine = SessionEngine()
+    session_id, attempt = engine.start(quiz_id=0)
+    
+    # Act & Assert
+    assert engine.finish(session_id) is attempt
+    assert engine.get(session_id) is None
+    assert engine.finish(session_id) is None
@@ -0,0 +1,66 @@
+"""
+Unit tests for startup cost: import-time budgets and the prebuilt default quiz.
+"""
+
+import json
+import subprocess
+import sys
+
+from quizmaster.models.default_quiz import DEFAULT_QUESTIONS, default_quiz
+from quizmaster.services.quiz_bot import QuizBot
+
+# Cold-start budgets in seconds, about twice the measured times to allow for slow CI machines
+CLI_IMPORT_BUDGET = 0.5
+API_IMPORT_BUDGET = 1.0
+
+WEB_MODULES = ("fastapi", "starlette", "uvicorn", "pydantic", "numpy")
+
+
+def import_in_subprocess(module):
+    """Import a module in a fresh interpreter and return the import time and loaded top-level modules."""
+    code = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        f"import {module}\n"
+        "elapsed = time.perf_counter() - start\n"
+        "print(json.dumps([elapsed, sorted({name.split('.')[0] for name in sys.modules})]))\n"
+    )
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    elapsed, modules = json.loads(output)
+    return elapsed, set(modules)
+
+
+def test_cli_import_stays_within_budget_without_web_stack():
+    """Test that the CLI starts quickly and never loads the web stack."""
+    # Act
+    elapsed, modules = import_in_subprocess("quizmaster.services.quiz_bot")
+    
+    # Assert
+    assert elapsed < CLI_IMPORT_BUDGET
+    assert not modules.intersection(WEB_MODULES)
+
+
+def test_api_import_stays_within_budget_without_server():
+    """Test that importing the API app is within budget and leaves the server and NumPy unloaded."""
+    # Act
+    elapsed, modules = import_in_subprocess("quizmaster.main")
+    
+    # Assert
+    assert elapsed < API_IMPORT_BUDGET
+    assert not modules.intersection(("uvicorn", "numpy"))
+
+
+def test_default_quiz_copies_are_independent():
+    """Test that each default quiz is a fresh copy of the prebuilt quiz."""
+    # Arrange
+    first = default_quiz()
+    
+    # Act
+    first.add_question("Extra?", ["Yes", "No"], 0)
+    second = QuizBot().quiz
+    
+    # Assert
+    assert second.get_question_count() == len(DEFAULT_QUESTIONS)
+    assert second.get_question(1).answers[2] == "# This is a comment"
+    assert second.get_question(4).correct_answer_index == 1
+    assert first is not second